@@ -21,7 +21,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.core.docling_adapter import DoclingDocumentExtractor
-from src.core.config import DoclingConfig
+from src.core.config import DoclingConfig, config_from_env
 
 
 @dataclass
@@ -102,7 +102,7 @@ def run_benchmark() -> pd.DataFrame:
         original_env = apply_env_overrides(overrides)
 
         try:
-            config = DoclingConfig()
+            config = config_from_env(DoclingConfig)
             extractor = DoclingDocumentExtractor(config)
 
             for doc_path in SAMPLE_DOCS:
@@ -27,7 +27,7 @@ from __future__ import annotations
 import argparse
 import os
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
@@ -96,13 +96,9 @@ def run_docling(pdf_path: Path) -> Tuple[str, float, int]:
     """Run DoclingDocumentExtractor and return (text, seconds, pages_processed=doc pages)."""
     if DoclingDocumentExtractor is None or DoclingConfig is None:
         return "", 0.0, 0
-    cfg = DoclingConfig()  # start from env-configured settings
-    # For digital PDF baseline, disable OCR to avoid engine requirements
-    try:
-        cfg.do_ocr = False
-        cfg.auto_ocr_detection = False
-    except Exception:
-        pass
+    # Start from env-configured settings; for the digital PDF baseline, disable
+    # OCR to avoid engine requirements
+    cfg = replace(DoclingConfig(), do_ocr=False, auto_ocr_detection=False)
     extractor = DoclingDocumentExtractor(cfg)
     start = time.perf_counter()
     result = extractor.extract(pdf_path)
@@ -10,6 +10,7 @@ import sys
 import json
 import argparse
 import logging
+from dataclasses import replace
 from pathlib import Path
 from typing import Dict, Any, Tuple, Optional
 from datetime import datetime
@@ -24,7 +25,7 @@ except ImportError:
     REQUESTS_AVAILABLE = False
 
 from dotenv import load_dotenv
-from src.core.config import DeepSeekConfig, env_str
+from src.core.config import DeepSeekConfig, config_from_env, env_str
 from src.core.constants import LEGAL_EVENTS_PROMPT
 
 # Configure logging
@@ -150,7 +151,7 @@ class DeepSeekDiagnostic:
         self.print_step(3, "Configuration Loading")
 
         try:
-            self.config = DeepSeekConfig()
+            self.config = config_from_env(DeepSeekConfig)
             self.print_result(True, "Configuration loaded successfully")
 
             # Display configuration
@@ -161,7 +162,7 @@ class DeepSeekDiagnostic:
 
             # Override model if test model specified
             if self.test_model:
-                self.config.model = self.test_model
+                self.config = replace(self.config, model=self.test_model)
                 self.log(f"   ⚠️  Test model override: {self.test_model}")
 
             return True
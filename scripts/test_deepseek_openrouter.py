@@ -9,6 +9,7 @@ import sys
 import json
 import argparse
 import logging
+from dataclasses import replace
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -23,7 +24,7 @@ except ImportError:
     REQUESTS_AVAILABLE = False
 
 from dotenv import load_dotenv
-from src.core.config import OpenRouterConfig, env_str
+from src.core.config import OpenRouterConfig, config_from_env, env_str
 from src.core.constants import LEGAL_EVENTS_PROMPT
 
 # Configure logging
@@ -137,11 +138,11 @@ class DeepSeekDiagnostic:
         self.print_step(3, "Configuration Loading")
 
         try:
-            self.config = OpenRouterConfig()
+            self.config = config_from_env(OpenRouterConfig)
 
             # Override model if specified
             if self.test_model:
-                self.config.model = self.test_model
+                self.config = replace(self.config, model=self.test_model)
 
             self.print_result(True, "Configuration loaded successfully")
             self.log(f"   Base URL: {self.config.base_url}")
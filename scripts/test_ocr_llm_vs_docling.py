@@ -27,6 +27,8 @@ This script will NOT run the Claude path unless `ENABLE_CLAUDE_OCR_TEST=true` an
 from __future__ import annotations
 
 import base64
+import importlib.util
+import io
 import os
 import sys
 import time
@@ -43,20 +45,13 @@ if str(PROJECT_ROOT) not in sys.path:
 # Load environment variables from .env
 load_dotenv(PROJECT_ROOT / ".env")
 
-from src.core.config import DoclingConfig
+from src.core.config import DoclingConfig, config_from_env
 from src.core.docling_adapter import DoclingDocumentExtractor
 
-try:
-    from pdf2image import convert_from_path  # type: ignore
-    HAS_PDF2IMAGE = True
-except ImportError:
-    HAS_PDF2IMAGE = False
-
-try:
-    from anthropic import Anthropic  # type: ignore
-    HAS_ANTHROPIC = True
-except ImportError:
-    HAS_ANTHROPIC = False
+# Heavy optional dependencies are only imported by the functions that use them;
+# probe availability without paying their import cost on the Docling-only path.
+HAS_PDF2IMAGE = importlib.util.find_spec("pdf2image") is not None
+HAS_ANTHROPIC = importlib.util.find_spec("anthropic") is not None
 
 
 @dataclass
@@ -88,7 +83,7 @@ def run_docling(file_path: Path, do_ocr: bool) -> ExtractionResult:
         os.environ[key] = value
 
     try:
-        config = DoclingConfig()
+        config = config_from_env(DoclingConfig)
         extractor = DoclingDocumentExtractor(config)
         start = time.perf_counter()
         extracted = extractor.extract(file_path)
@@ -115,11 +110,14 @@ def run_docling(file_path: Path, do_ocr: bool) -> ExtractionResult:
 def encode_pdf_pages_to_images(file_path: Path) -> List[str]:
     if not HAS_PDF2IMAGE:
         raise RuntimeError("pdf2image is not installed; install it to run the Claude OCR test.")
+    try:
+        from pdf2image import convert_from_path  # type: ignore
+    except ImportError as exc:
+        raise RuntimeError("pdf2image failed to import; install it to run the Claude OCR test.") from exc
     # convert_from_path returns Pillow Images; convert to PNG bytes then b64
     images = convert_from_path(str(file_path))
     encoded_pages: List[str] = []
     for image in images:
-        import io
         buffer = io.BytesIO()
         image.save(buffer, format="PNG")
         encoded = base64.b64encode(buffer.getvalue()).decode("utf-8")
@@ -133,6 +131,10 @@ def run_claude_vision(file_path: Path) -> ExtractionResult:
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
         raise RuntimeError("ANTHROPIC_API_KEY not set.")
+    try:
+        from anthropic import Anthropic  # type: ignore
+    except ImportError as exc:
+        raise RuntimeError("anthropic python client failed to import; install it to run the Claude OCR test.") from exc
 
     encoded_pages = encode_pdf_pages_to_images(file_path)
     client = Anthropic(api_key=api_key)
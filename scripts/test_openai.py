@@ -9,6 +9,7 @@ import sys
 import json
 import argparse
 import logging
+from dataclasses import replace
 from pathlib import Path
 from typing import Dict, Any, Tuple, Optional
 from datetime import datetime
@@ -23,7 +24,7 @@ except ImportError:
     REQUESTS_AVAILABLE = False
 
 from dotenv import load_dotenv
-from src.core.config import OpenAIConfig, env_str
+from src.core.config import OpenAIConfig, config_from_env, env_str
 
 # Configure logging
 logging.basicConfig(
@@ -150,7 +151,7 @@ class OpenAIDiagnostic:
         self.print_step(3, "Configuration Loading")
 
         try:
-            self.config = OpenAIConfig()
+            self.config = config_from_env(OpenAIConfig)
             self.print_result(True, "Configuration loaded successfully")
 
             # Display configuration
@@ -161,7 +162,7 @@ class OpenAIDiagnostic:
 
             # Override model if test model specified
             if self.test_model:
-                self.config.model = self.test_model
+                self.config = replace(self.config, model=self.test_model)
                 self.log(f"   ⚠️  Test model override: {self.test_model}")
 
             return True
@@ -5,10 +5,14 @@ Comprehensive testing of all available OpenCode Zen models for legal event extra
 """
 
 import os
+import re
 import sys
 import json
 import time
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime
@@ -19,12 +23,45 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
     print("❌ Error: requests library not available")
     sys.exit(1)
 
+try:
+    import orjson
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers stay unchanged
+    json_loads = orjson.loads
+    json_dumps_bytes = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+try:
+    # HTTP/2 needs the h2 extra (pip install "httpx[http2]"), not just httpx
+    import httpx
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
 # Load environment FIRST (before imports that need it)
 from dotenv import load_dotenv
 load_dotenv()
@@ -35,8 +72,11 @@ from src.core.constants import LEGAL_EVENTS_PROMPT
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+# Markdown code fence around a JSON body (DeepSeek-style ```json ... ```)
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
 
-@dataclass
+@dataclass(slots=True)
 class ModelTestResult:
     """Results for a single model test"""
     model_id: str
@@ -54,17 +94,138 @@ class ModelTestResult:
     notes: List[str] = field(default_factory=list)
     json_clean: bool = False
     all_fields_present: bool = False
+    terminal_auth_error: bool = False  # 401/403/404 - model unknown or not entitled
+
+
+def _response_body(response) -> bytes:
+    """Whole body of a requests response or a streamed httpx response"""
+    return response.content if hasattr(response, "raw") else response.read()
+
+
+def read_chat_fields(response) -> Tuple[str, int]:
+    """Extract (choices[0].message.content, usage.total_tokens) from a chat response
+
+    With ijson available the streamed body is parsed incrementally in one pass,
+    so the rest of the envelope is never materialized as Python objects.
+    httpx responses have no file-like raw stream and are parsed whole.
+    """
+    if not IJSON_AVAILABLE or not hasattr(response, "raw"):
+        data = json_loads(_response_body(response))
+        content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+        return content, data.get("usage", {}).get("total_tokens", 0)
+
+    response.raw.decode_content = True
+    content: Optional[str] = None
+    tokens = 0
+    for prefix, _event, value in ijson.parse(response.raw):
+        if prefix == "choices.item.message.content" and content is None:
+            content = value
+        elif prefix == "usage.total_tokens" and value is not None:
+            tokens = int(value)
+    return content or "", tokens
+
+
+def iter_listed_models(response):
+    """Yield the model entries of a /models response without building the whole body"""
+    if not IJSON_AVAILABLE or not hasattr(response, "raw"):
+        yield from json_loads(_response_body(response)).get("data", [])
+        return
+
+    response.raw.decode_content = True
+    yield from ijson.items(response.raw, "data.item", use_float=True)
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_prompt(text: str) -> str:
+    """Collapse whitespace runs so formatting-only prompt edits share a cache key"""
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+CACHE_DIR = Path(__file__).parent / ".oczen_cache"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+NEGATIVE_CACHE_TTL_SECONDS = 60 * 60
+
+# Statuses that won't change on retry: bad key, no entitlement, unknown model
+TERMINAL_STATUS_CODES = frozenset({401, 403, 404})
+# Only an unknown model is worth remembering; 401/403 clear up once the key is fixed
+NEGATIVE_CACHE_STATUS_CODES = frozenset({404})
+
+
+# Fields checked on the first extracted legal event
+REQUIRED_EVENT_FIELDS = frozenset({"event_particulars"})
+OPTIONAL_EVENT_FIELDS = frozenset({"date", "citation", "document_reference"})
+
+
+class TerminalHTTPError(Exception):
+    """Basic chat got a status that makes the remaining probes pointless"""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class CacheBackend:
+    """On-disk cache for deterministic (temperature=0) probe responses
+
+    Entries read or written during a run are also kept in memory, so repeat
+    lookups skip the SQLite round trip. A run is far shorter than the TTL.
+    """
+
+    def __init__(self, directory: Path = CACHE_DIR, ttl: int = CACHE_TTL_SECONDS):
+        self._cache = diskcache.Cache(str(directory))
+        self._memory: Dict[str, Tuple[int, str, int, float]] = {}
+        self.ttl = ttl
+
+    @staticmethod
+    def scope_for(base_url: str, api_key: str) -> str:
+        """Digest of the endpoint and key, so a rotated key or new base URL misses old entries"""
+        return hashlib.sha256(f"{base_url}\0{api_key}".encode()).hexdigest()
+
+    @staticmethod
+    def key_for(model_id: str, payload: Dict[str, Any], scope: str) -> str:
+        # Key on whitespace-normalized message text so re-wrapped or re-indented
+        # prompts still hit; model, temperature and the other knobs stay exact
+        messages = [
+            {**message, "content": _normalize_prompt(message.get("content", ""))}
+            for message in payload.get("messages", [])
+        ]
+        payload = {**payload, "messages": messages}
+        blob = json.dumps(
+            {"scope": scope, "model": model_id, "endpoint": "chat/completions", "payload": payload}, sort_keys=True
+        )
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[int, str, int, float]]:
+        value = self._memory.get(key)
+        if value is None:
+            value = self._cache.get(key)
+            if value is not None:
+                self._memory[key] = value
+        return value
+
+    def set(self, key: str, value: Tuple[int, str, int, float], ttl: Optional[int] = None) -> None:
+        self._memory[key] = value
+        self._cache.set(key, value, expire=ttl or self.ttl)
+
+    def close(self) -> None:
+        self._cache.close()
 
 
 class OpenCodeZenModelsTester:
     """Test multiple OpenCode Zen models for legal extraction"""
 
-    def __init__(self, specific_models: Optional[List[str]] = None, verbose: bool = False):
+    def __init__(self, specific_models: Optional[List[str]] = None, verbose: bool = False,
+                 use_cache: bool = True, http2: bool = False):
         self.api_key = os.getenv("OPENCODEZEN_API_KEY", "")
         self.base_url = os.getenv("OPENCODEZEN_BASE_URL", "https://opencode.ai/zen/v1").rstrip('/').replace('/chat/completions', '')
+        self._chat_url = f"{self.base_url}/chat/completions"
+        self._models_url = f"{self.base_url}/models"
         self.verbose = verbose
         self.log_file = Path(__file__).parent / "opencode_zen_models_test.log"
         self.results: List[ModelTestResult] = []
+        self._local = threading.local()  # Per-thread log buffer while models run in parallel
 
         # Setup file logging
         file_handler = logging.FileHandler(self.log_file, mode='w')
@@ -94,33 +255,152 @@ class OpenCodeZenModelsTester:
             logger.error("❌ OPENCODEZEN_API_KEY not set in .env")
             sys.exit(1)
 
+        # One pooled keep-alive session for every probe, so the 3 tests x N
+        # models reuse TLS connections instead of handshaking per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # urllib3 skips POST by default, and every probe is a chat POST
+                allowed_methods=frozenset(["GET", "POST"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,  # Hand the final response back so tests can report its status
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"X-API-Key": self.api_key, "Content-Type": "application/json"})
+
+        # Optionally multiplex the parallel probes as HTTP/2 streams over one
+        # connection; httpx negotiates HTTP/1.1 if the server doesn't offer h2.
+        # httpx only retries failed connects, not 429/5xx responses
+        self.http2_client = None
+        if http2 and HTTP2_AVAILABLE:
+            self.http2_client = httpx.Client(
+                http2=True,
+                transport=httpx.HTTPTransport(http2=True, retries=2),
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+                timeout=30.0,
+                headers=dict(self.session.headers),
+            )
+        elif http2:
+            logger.warning("⚠️  HTTP/2 needs httpx[http2]; falling back to requests")
+
+        # Probes are fixed prompts at temperature 0, so re-runs can reuse answers;
+        # the cache itself is opened in run() while model discovery is in flight
+        self.use_cache = use_cache and DISKCACHE_AVAILABLE
+        self.cache: Optional[CacheBackend] = None
+        self._cache_scope = CacheBackend.scope_for(self.base_url, self.api_key)
+
+    def _prebuild_payload_templates(self):
+        """Build the probe requests once; each test only adds the model id
+
+        Identical prompt prefixes across models also give the provider a chance
+        to reuse its prompt cache.
+        """
+        self._basic_payload_template = {
+            "messages": [
+                {"role": "user", "content": "Say 'hello' in one word."}
+            ],
+            "max_tokens": 10,
+            "temperature": 0.0
+        }
+        self._json_payload_template = {
+            "messages": [
+                {"role": "system", "content": "Return only valid JSON."},
+                {"role": "user", "content": 'Return: {"test": "ok", "value": 42}'}
+            ],
+            "response_format": {"type": "json_object"},
+            "max_tokens": 50,
+            "temperature": 0.0
+        }
+        self._legal_system = LEGAL_EVENTS_PROMPT + "\n\nReturn ONLY valid JSON array."
+        self._legal_payload_template = {
+            "messages": [
+                {"role": "system", "content": self._legal_system},
+                {"role": "user", "content": f"Extract legal events:\n\n{self.legal_text}"}
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": 0.0,
+            "max_tokens": 800
+        }
+
     def log(self, message: str):
-        """Log to console and file"""
-        logger.info(message)
+        """Log to console and file (buffered while inside a parallel model test)"""
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            buffer.append(message)
+        else:
+            logger.info(message)
+
+    def _test_model_buffered(self, model_id: str, display_name: str, tier: str,
+                             cost: float) -> Tuple[ModelTestResult, List[str]]:
+        """Run test_model with its log lines captured so each model's output stays contiguous"""
+        self._local.buffer = []
+        try:
+            return self.test_model(model_id, display_name, tier, cost), self._local.buffer
+        finally:
+            self._local.buffer = None
+
+    def _post_chat(self, payload: Dict[str, Any], timeout: int) -> Tuple[int, str, int, float]:
+        """POST a chat completion and return (status, content, total_tokens, elapsed)
+
+        Deterministic payloads (temperature 0) are served from the on-disk cache
+        when possible; the cached elapsed time is the originally measured latency.
+        A 404 (unknown model) is cached too, for a shorter TTL; 401/403 never
+        are, so fixing the key takes effect on the next run.
+        """
+        cache_key = None
+        if self.cache is not None and payload.get("temperature") == 0:
+            cache_key = CacheBackend.key_for(payload["model"], payload, self._cache_scope)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        t0 = time.perf_counter_ns()
+        body = json_dumps_bytes(payload)
+        if self.http2_client is not None:
+            response = self.http2_client.stream("POST", self._chat_url, content=body, timeout=timeout)
+        else:
+            response = self.session.post(self._chat_url, data=body, timeout=timeout, stream=True)
+        with response as response:
+            if response.status_code != 200:
+                outcome = (response.status_code, "", 0, (time.perf_counter_ns() - t0) / 1e9)
+                if cache_key is not None and response.status_code in NEGATIVE_CACHE_STATUS_CODES:
+                    self.cache.set(cache_key, outcome, ttl=NEGATIVE_CACHE_TTL_SECONDS)
+                return outcome
+            content, tokens = read_chat_fields(response)
+        elapsed = (time.perf_counter_ns() - t0) / 1e9
+
+        if cache_key is not None:
+            self.cache.set(cache_key, (response.status_code, content, tokens, elapsed))
+        return response.status_code, content, tokens, elapsed
 
     def discover_models(self) -> List[Tuple[str, str, str, float]]:
         """Try to discover available models from API"""
         # Try /models endpoint
-        url = f"{self.base_url}/models"
-        headers = {"X-API-Key": self.api_key}
-
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                models = data.get("data", [])
-
-                discovered = []
-                for model in models:
-                    model_id = model.get("id", "")
-                    name = model.get("name", model_id)
-                    tier = "free" if ":free" in model_id or model.get("free", False) else "paid"
-                    cost = model.get("pricing", {}).get("completion", 0.0)
-                    discovered.append((model_id, name, tier, cost))
-
-                if discovered:
-                    self.log(f"✅ Discovered {len(discovered)} models from API")
-                    return discovered
+            if self.http2_client is not None:
+                request = self.http2_client.stream("GET", self._models_url, timeout=10)
+            else:
+                request = self.session.get(self._models_url, timeout=10, stream=True)
+            with request as response:
+                if response.status_code == 200:
+                    discovered = []
+                    for model in iter_listed_models(response):
+                        model_id = model.get("id", "")
+                        name = model.get("name", model_id)
+                        tier = "free" if ":free" in model_id or model.get("free", False) else "paid"
+                        cost = model.get("pricing", {}).get("completion", 0.0)
+                        discovered.append((model_id, name, tier, cost))
+
+                    if discovered:
+                        self.log(f"✅ Discovered {len(discovered)} models from API")
+                        return discovered
         except Exception as e:
             if self.verbose:
                 self.log(f"⚠️  Could not discover models: {e}")
@@ -130,140 +410,72 @@ class OpenCodeZenModelsTester:
         return self.known_models
 
     def test_basic_chat(self, model_id: str) -> Tuple[bool, float, int, str]:
-        """Test 1: Basic chat completion"""
-        url = f"{self.base_url}/chat/completions"
-        headers = {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json"
-        }
+        """Test 1: Basic chat completion
 
-        payload = {
-            "model": model_id,
-            "messages": [
-                {"role": "user", "content": "Say 'hello' in one word."}
-            ],
-            "max_tokens": 10,
-            "temperature": 0.0
-        }
+        Raises TerminalHTTPError on 401/403/404 so the caller can stop testing
+        the model. A working endpoint answers in a few seconds, so the timeout is
+        short and transient failures are left to the session's retries.
+        """
+        payload = {**self._basic_payload_template, "model": model_id}
 
         try:
-            start_time = time.time()
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            elapsed = time.time() - start_time
-
-            if response.status_code == 200:
-                data = response.json()
-                content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                tokens = data.get("usage", {}).get("total_tokens", 0)
+            status, content, tokens, elapsed = self._post_chat(payload, timeout=10)
 
+            if status == 200:
                 if content.strip():
                     return True, elapsed, tokens, ""
                 else:
                     return False, elapsed, 0, "Empty response"
+            elif status in TERMINAL_STATUS_CODES:
+                raise TerminalHTTPError(status)
             else:
-                return False, elapsed, 0, f"HTTP {response.status_code}"
+                return False, elapsed, 0, f"HTTP {status}"
 
+        except TerminalHTTPError:
+            raise
         except Exception as e:
             return False, 0.0, 0, str(e)[:100]
 
     def test_json_mode(self, model_id: str) -> Tuple[bool, bool, float, int, str]:
         """Test 2: JSON response format support"""
-        url = f"{self.base_url}/chat/completions"
-        headers = {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json"
-        }
-
-        payload = {
-            "model": model_id,
-            "messages": [
-                {"role": "system", "content": "Return only valid JSON."},
-                {"role": "user", "content": 'Return: {"test": "ok", "value": 42}'}
-            ],
-            "response_format": {"type": "json_object"},
-            "max_tokens": 50,
-            "temperature": 0.0
-        }
+        payload = {**self._json_payload_template, "model": model_id}
 
         try:
-            start_time = time.time()
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            elapsed = time.time() - start_time
+            status, content, tokens, elapsed = self._post_chat(payload, timeout=30)
 
-            if response.status_code == 200:
-                data = response.json()
-                content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                tokens = data.get("usage", {}).get("total_tokens", 0)
+            if status == 200:
 
-                # Check for markdown wrapping
-                clean = not ("```" in content)
+                # Handle markdown-wrapped JSON (DeepSeek-style)
+                match = _FENCE_RE.search(content)
+                clean = match is None
 
                 try:
-                    # Handle markdown-wrapped JSON (DeepSeek-style)
-                    if "```json" in content:
-                        json_text = content.split("```json")[1].split("```")[0].strip()
-                        json.loads(json_text)
-                        return True, False, elapsed, tokens, ""  # Works but not clean
-                    else:
-                        json.loads(content.strip())
-                        return True, clean, elapsed, tokens, ""  # Clean JSON
+                    json_loads((content if clean else match.group(1)).strip())
+                    return True, clean, elapsed, tokens, ""  # Not clean when fenced
                 except json.JSONDecodeError as e:
                     return False, False, elapsed, tokens, f"Invalid JSON: {str(e)[:50]}"
             else:
-                return False, False, elapsed, 0, f"HTTP {response.status_code}"
+                return False, False, elapsed, 0, f"HTTP {status}"
 
         except Exception as e:
             return False, False, 0.0, 0, str(e)[:100]
 
     def test_legal_extraction(self, model_id: str) -> Tuple[bool, bool, bool, float, int, str]:
         """Test 3: Legal event extraction with quality scoring"""
-        url = f"{self.base_url}/chat/completions"
-        headers = {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json"
-        }
-
-        payload = {
-            "model": model_id,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": LEGAL_EVENTS_PROMPT + "\n\nReturn ONLY valid JSON array."
-                },
-                {
-                    "role": "user",
-                    "content": f"Extract legal events:\n\n{self.legal_text}"
-                }
-            ],
-            "response_format": {"type": "json_object"},
-            "temperature": 0.0,
-            "max_tokens": 800
-        }
+        payload = {**self._legal_payload_template, "model": model_id}
 
         try:
-            start_time = time.time()
-            response = requests.post(url, headers=headers, json=payload, timeout=60)
-            elapsed = time.time() - start_time
+            status, content, tokens, elapsed = self._post_chat(payload, timeout=60)
 
-            if response.status_code == 200:
-                data = response.json()
-                content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                tokens = data.get("usage", {}).get("total_tokens", 0)
+            if status == 200:
 
-                # Check for markdown wrapping
-                clean = not ("```" in content)
+                # Extract JSON from potential markdown
+                match = _FENCE_RE.search(content)
+                clean = match is None
+                clean_content = (content if clean else match.group(1)).strip()
 
                 try:
-                    # Extract JSON from potential markdown
-                    clean_content = content.strip()
-                    if "```json" in clean_content:
-                        clean_content = clean_content.split("```json")[1].split("```")[0].strip()
-                        clean = False
-                    elif "```" in clean_content:
-                        clean_content = clean_content.split("```")[1].split("```")[0].strip()
-                        clean = False
-
-                    parsed = json.loads(clean_content)
+                    parsed = json_loads(clean_content)
 
                     # Handle different response structures
                     events = parsed
@@ -283,11 +495,10 @@ class OpenCodeZenModelsTester:
 
                     # Check first event for required fields
                     first_event = events[0] if events else {}
-                    required_fields = ["event_particulars"]
-                    optional_fields = ["date", "citation", "document_reference"]
+                    keys = first_event.keys() if isinstance(first_event, dict) else frozenset()
 
-                    has_required = all(field in first_event for field in required_fields)
-                    field_count = sum(1 for field in optional_fields if field in first_event and first_event[field])
+                    has_required = REQUIRED_EVENT_FIELDS <= keys
+                    field_count = sum(1 for field in keys & OPTIONAL_EVENT_FIELDS if first_event[field])
 
                     # Quality scoring: has_required + field_coverage + event_count
                     all_fields = has_required and field_count >= 2
@@ -297,7 +508,7 @@ class OpenCodeZenModelsTester:
                 except json.JSONDecodeError as e:
                     return False, False, False, elapsed, tokens, f"JSON error: {str(e)[:50]}"
             else:
-                return False, False, False, elapsed, 0, f"HTTP {response.status_code}"
+                return False, False, False, elapsed, 0, f"HTTP {status}"
 
         except Exception as e:
             return False, False, False, 0.0, 0, str(e)[:100]
@@ -344,7 +555,14 @@ class OpenCodeZenModelsTester:
         self.log(f"{'='*70}")
 
         # Test 1: Basic chat
-        basic_pass, basic_time, basic_tokens, basic_error = self.test_basic_chat(model_id)
+        try:
+            basic_pass, basic_time, basic_tokens, basic_error = self.test_basic_chat(model_id)
+        except TerminalHTTPError as e:
+            result.terminal_auth_error = True
+            result.error_message = str(e)
+            self.log(f"❌ Basic chat: FAIL - {e} (skipping remaining tests)")
+            self.calculate_scores(result)
+            return result
         result.basic_chat_passed = basic_pass
         result.response_time = basic_time
         result.tokens_used = basic_tokens
@@ -395,24 +613,26 @@ class OpenCodeZenModelsTester:
         return result
 
     def print_summary(self):
-        """Print comprehensive summary and recommendations"""
-        self.log("\n\n" + "="*70)
-        self.log("📊 TEST SUMMARY")
-        self.log("="*70)
+        """Print comprehensive summary and recommendations
+
+        The report is assembled in one buffer and logged once.
+        """
+        lines = ["\n\n" + "="*70, "📊 TEST SUMMARY", "="*70]
+        emit = lines.append
 
         # Overall stats
         total = len(self.results)
         passed_all = sum(1 for r in self.results if r.quality_score >= 8)
-        self.log(f"\nModels Tested: {total}")
-        self.log(f"Fully Passing (Quality ≥8): {passed_all}/{total}")
+        emit(f"\nModels Tested: {total}")
+        emit(f"Fully Passing (Quality ≥8): {passed_all}/{total}")
 
         # Results table
-        self.log(f"\n{'Model':<35} {'Q':>3} {'R':>3} {'Time':>7} {'Cost':>8}")
-        self.log("-" * 70)
+        emit(f"\n{'Model':<35} {'Q':>3} {'R':>3} {'Time':>7} {'Cost':>8}")
+        emit("-" * 70)
 
         for result in sorted(self.results, key=lambda x: x.quality_score, reverse=True):
             cost_text = "FREE" if result.cost_per_million == 0 else f"${result.cost_per_million:.2f}/M"
-            self.log(
+            emit(
                 f"{result.display_name:<35} "
                 f"{result.quality_score:>3}/10 "
                 f"{result.reliability_score:>3}/10 "
@@ -420,39 +640,49 @@ class OpenCodeZenModelsTester:
                 f"{cost_text:>8}"
             )
 
-        # Champions
+        # Champions, all found in one pass; strict comparisons keep the first
+        # model on ties, as max()/min() would
         if self.results:
-            quality_champ = max(self.results, key=lambda x: x.quality_score)
-            reliable_champ = max(self.results, key=lambda x: x.reliability_score)
-            speed_champ = min([r for r in self.results if r.quality_score >= 7],
-                            key=lambda x: x.response_time, default=None)
-            free_champ = max([r for r in self.results if r.cost_per_million == 0],
-                           key=lambda x: x.quality_score, default=None)
-
-            self.log(f"\n🏆 CHAMPIONS BY CATEGORY:")
-            self.log(f"   Quality: {quality_champ.display_name} ({quality_champ.quality_score}/10)")
-            self.log(f"   Reliability: {reliable_champ.display_name} ({reliable_champ.reliability_score}/10)")
+            quality_champ = reliable_champ = self.results[0]
+            speed_champ = free_champ = production = None
+            for r in self.results:
+                if r.quality_score > quality_champ.quality_score:
+                    quality_champ = r
+                if r.reliability_score > reliable_champ.reliability_score:
+                    reliable_champ = r
+                if r.quality_score >= 7 and (speed_champ is None or r.response_time < speed_champ.response_time):
+                    speed_champ = r
+                if r.cost_per_million == 0 and (free_champ is None or r.quality_score > free_champ.quality_score):
+                    free_champ = r
+                if r.quality_score >= 9 and r.reliability_score >= 9 and (
+                    production is None
+                    or (r.quality_score, -r.response_time) > (production.quality_score, -production.response_time)
+                ):
+                    production = r
+
+            emit(f"\n🏆 CHAMPIONS BY CATEGORY:")
+            emit(f"   Quality: {quality_champ.display_name} ({quality_champ.quality_score}/10)")
+            emit(f"   Reliability: {reliable_champ.display_name} ({reliable_champ.reliability_score}/10)")
             if speed_champ:
-                self.log(f"   Speed: {speed_champ.display_name} ({speed_champ.response_time:.2f}s)")
+                emit(f"   Speed: {speed_champ.display_name} ({speed_champ.response_time:.2f}s)")
             if free_champ:
-                self.log(f"   Free Tier: {free_champ.display_name} ({free_champ.quality_score}/10)")
+                emit(f"   Free Tier: {free_champ.display_name} ({free_champ.quality_score}/10)")
 
             # Recommendations
-            self.log(f"\n💡 RECOMMENDATIONS:")
+            emit(f"\n💡 RECOMMENDATIONS:")
 
-            production = max([r for r in self.results if r.quality_score >= 9 and r.reliability_score >= 9],
-                           key=lambda x: (x.quality_score, -x.response_time), default=None)
             if production:
-                self.log(f"   Production: {production.model_id} (Q:{production.quality_score}/10, R:{production.reliability_score}/10)")
+                emit(f"   Production: {production.model_id} (Q:{production.quality_score}/10, R:{production.reliability_score}/10)")
 
             if free_champ and free_champ.quality_score >= 7:
-                self.log(f"   Budget: {free_champ.model_id} (FREE, Q:{free_champ.quality_score}/10)")
+                emit(f"   Budget: {free_champ.model_id} (FREE, Q:{free_champ.quality_score}/10)")
 
             if speed_champ:
-                self.log(f"   Speed: {speed_champ.model_id} ({speed_champ.response_time:.2f}s avg)")
+                emit(f"   Speed: {speed_champ.model_id} ({speed_champ.response_time:.2f}s avg)")
 
-        self.log(f"\n📄 Detailed log: {self.log_file}")
-        self.log("="*70 + "\n")
+        emit(f"\n📄 Detailed log: {self.log_file}")
+        emit("="*70 + "\n")
+        self.log("\n".join(lines))
 
     def run(self):
         """Execute comprehensive model testing"""
@@ -461,20 +691,44 @@ class OpenCodeZenModelsTester:
         self.log("="*70)
         self.log(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-        # Discover or use known models
-        models_to_test = self.discover_models()
-
-        self.log(f"Testing {len(models_to_test)} models...\n")
-
-        # Test each model
-        for i, (model_id, name, tier, cost) in enumerate(models_to_test, 1):
-            self.log(f"\n[{i}/{len(models_to_test)}] {name}")
-            result = self.test_model(model_id, name, tier, cost)
-            self.results.append(result)
-
-            # Brief pause between tests
-            if i < len(models_to_test):
-                time.sleep(1)
+        try:
+            # Discover or use known models; the /models round trip also leaves a
+            # warm connection in the session pool, so prepare the probes and
+            # open the cache while it is in flight
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                discovery = executor.submit(self.discover_models)
+                self._prebuild_payload_templates()
+                if self.use_cache:
+                    self.cache = CacheBackend()
+                models_to_test = discovery.result()
+
+            self.log(f"Testing {len(models_to_test)} models...\n")
+
+            # Test models in parallel; each model's three probes stay sequential
+            # so a failing basic chat still skips the later (billable) tests
+            max_workers = max(1, min(8, len(models_to_test)))
+            # Progress is logged as models finish, but results keep the
+            # models_to_test order so the summary and champion ties are stable
+            results: List[Optional[ModelTestResult]] = [None] * len(models_to_test)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._test_model_buffered, model_id, name, tier, cost): (index, name)
+                    for index, (model_id, name, tier, cost) in enumerate(models_to_test)
+                }
+                for i, future in enumerate(as_completed(futures), 1):
+                    index, name = futures[future]
+                    result, lines = future.result()
+                    self.log(f"\n[{i}/{len(models_to_test)}] {name}")
+                    for line in lines:
+                        self.log(line)
+                    results[index] = result
+            self.results.extend(results)
+        finally:
+            self.session.close()
+            if self.http2_client is not None:
+                self.http2_client.close()
+            if self.cache is not None:
+                self.cache.close()
 
         # Print summary
         self.print_summary()
@@ -486,6 +740,10 @@ def main():
     parser = argparse.ArgumentParser(description="Test OpenCode Zen models comprehensively")
     parser.add_argument("--models", help="Comma-separated list of specific models to test")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always call the API instead of reusing cached temperature-0 responses (24h TTL)")
+    parser.add_argument("--http2", action="store_true",
+                        help="Send probes over one multiplexed HTTP/2 connection (requires httpx[http2])")
 
     args = parser.parse_args()
 
@@ -493,7 +751,9 @@ def main():
 
     tester = OpenCodeZenModelsTester(
         specific_models=specific_models,
-        verbose=args.verbose
+        verbose=args.verbose,
+        use_cache=not args.no_cache,
+        http2=args.http2
     )
 
     tester.run()
@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 """Test all 5 providers on OCR-extracted scanned PDF"""
+import asyncio
+import csv
 import os
 import sys
+import threading
 from pathlib import Path
 import time
-import pandas as pd
 import json
 from dataclasses import asdict
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 
@@ -16,11 +24,30 @@ load_dotenv(PROJECT_ROOT / ".env")
 
 from src.core.config import load_provider_config
 
-def test_provider(provider_name: str, text: str, output_dir: Path):
-    """Test a single provider on OCR-extracted text"""
-    print(f"\n{'='*70}")
-    print(f"Testing: {provider_name.upper()}")
-    print(f"{'='*70}")
+# A provider that hasn't answered by then is reported as timed out
+PROVIDER_TIMEOUT_SECONDS = 120
+
+def _write_events_csv(output_file: Path, rows):
+    with open(output_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def test_provider(provider_name: str, text: str, output_dir: Path, claim_output=None):
+    """Test a single provider on OCR-extracted text
+
+    Output is collected and printed as one block when the provider finishes,
+    so concurrent runs don't interleave their lines. The CSV is written along
+    with that block, and neither happens if `claim_output()` returns False
+    because the caller has already reported this provider as timed out.
+    """
+    lines = []
+    emit = lines.append
+    csv_output = None
+
+    emit(f"\n{'='*70}")
+    emit(f"Testing: {provider_name.upper()}")
+    emit(f"{'='*70}")
 
     try:
         start = time.perf_counter()
@@ -45,11 +72,11 @@ def test_provider(provider_name: str, text: str, output_dir: Path):
             from src.core.anthropic_adapter import AnthropicEventExtractor
             extractor = AnthropicEventExtractor(event_config)
         else:
-            print(f"❌ Unknown provider: {provider_name}")
+            emit(f"❌ Unknown provider: {provider_name}")
             return None
 
         if not extractor.is_available():
-            print(f"⚠️  Provider not configured (missing API key)")
+            emit(f"⚠️  Provider not configured (missing API key)")
             return {
                 "provider": provider_name,
                 "status": "not_configured",
@@ -64,27 +91,27 @@ def test_provider(provider_name: str, text: str, output_dir: Path):
         elapsed = time.perf_counter() - start
 
         # Display results
-        print(f"✅ {len(events)} events extracted in {elapsed:.2f}s")
+        emit(f"✅ {len(events)} events extracted in {elapsed:.2f}s")
 
         if hasattr(extractor, '_total_cost'):
             cost = extractor._total_cost
-            print(f"💰 Cost: ${cost:.4f}")
+            emit(f"💰 Cost: ${cost:.4f}")
         else:
             cost = 0
 
         # Save events
         if events:
-            df = pd.DataFrame([asdict(e) for e in events])
+            rows = [asdict(e) for e in events]
             output_file = output_dir / f"{provider_name}_ocr_events.csv"
-            df.to_csv(output_file, index=False)
-            print(f"📁 Saved to {output_file.name}")
+            csv_output = (output_file, rows)
+            emit(f"📁 Saved to {output_file.name}")
 
             # Display sample
-            print(f"\n[Sample Event]")
+            emit(f"\n[Sample Event]")
             first = events[0]
-            print(f"Date: {first.date}")
-            print(f"Particulars: {first.event_particulars[:150]}...")
-            print(f"Citation: {first.citation}")
+            emit(f"Date: {first.date}")
+            emit(f"Particulars: {first.event_particulars[:150]}...")
+            emit(f"Citation: {first.citation}")
 
         return {
             "provider": provider_name,
@@ -96,9 +123,9 @@ def test_provider(provider_name: str, text: str, output_dir: Path):
         }
 
     except Exception as e:
-        print(f"❌ Error: {e}")
+        emit(f"❌ Error: {e}")
         import traceback
-        traceback.print_exc()
+        emit(traceback.format_exc().rstrip())
         return {
             "provider": provider_name,
             "status": "error",
@@ -107,6 +134,80 @@ def test_provider(provider_name: str, text: str, output_dir: Path):
             "time": 0,
             "cost": 0
         }
+    finally:
+        if claim_output is None or claim_output():
+            if csv_output is not None:
+                _write_events_csv(*csv_output)
+            print("\n".join(lines))
+
+def _run_in_daemon_thread(loop, fn, *args) -> asyncio.Future:
+    """Run fn(*args) on a daemon thread and resolve a future on `loop` with its outcome
+
+    Unlike ThreadPoolExecutor workers, which the interpreter joins at exit, a
+    daemon thread still stuck in a provider call does not keep the script alive.
+    """
+    future = loop.create_future()
+
+    def settle(outcome, failed):
+        if not future.done():  # Skip a future the loop has already given up on
+            (future.set_exception if failed else future.set_result)(outcome)
+
+    def target():
+        try:
+            outcome, failed = fn(*args), False
+        except BaseException as e:
+            outcome, failed = e, True
+        try:
+            loop.call_soon_threadsafe(settle, outcome, failed)
+        except RuntimeError:
+            pass  # Loop already closed: this provider timed out and was reported
+
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+
+async def run_providers(providers, text: str, output_dir: Path, timeout: float = PROVIDER_TIMEOUT_SECONDS):
+    """Run test_provider for every provider at once, preserving input order
+
+    Each provider writes its CSV as soon as its extraction finishes. A provider
+    still running after `timeout` seconds gets a "timeout" result; its daemon
+    thread keeps going in the background, prints and writes nothing, and is
+    abandoned when the script exits.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def run_one(provider):
+        # The worker publishing its output and the timeout report race; the
+        # first to claim the provider wins, so the summary matches the files
+        claimed_by = []
+        claim_lock = threading.Lock()
+
+        def claim(who):
+            with claim_lock:
+                if not claimed_by:
+                    claimed_by.append(who)
+                return claimed_by[0] == who
+
+        future = _run_in_daemon_thread(
+            loop, test_provider, provider, text, output_dir, lambda: claim("worker")
+        )
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            if not claim("timeout"):
+                # Finished right at the deadline and already published its output
+                return await future
+            print(f"\n⏱️  {provider}: no result after {timeout:.0f}s")
+            return {
+                "provider": provider,
+                "status": "timeout",
+                "error": f"No result after {timeout:.0f}s",
+                "events_count": 0,
+                "time": timeout,
+                "cost": 0
+            }
+
+    return await asyncio.gather(*(run_one(provider) for provider in providers))
 
 def main():
     # Load OCR-extracted text
@@ -128,14 +229,10 @@ def main():
     print(f"Providers: LangExtract, OpenRouter, OpenAI, Anthropic, OpenCode Zen")
     print(f"{'='*70}\n")
 
-    # Test all providers
+    # Test all providers concurrently; each adapter makes blocking HTTP calls,
+    # so run them in worker threads and wait for the slowest instead of the sum
     providers = ["langextract", "openrouter", "openai", "anthropic", "opencode_zen"]
-    results = []
-
-    for provider in providers:
-        result = test_provider(provider, text, results_dir)
-        if result:
-            results.append(result)
+    results = [r for r in asyncio.run(run_providers(providers, text, results_dir)) if r]
 
     # Save summary
     summary = {
@@ -148,8 +245,11 @@ def main():
     }
 
     summary_file = results_dir / "ocr_comparison_summary.json"
-    with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    if ORJSON_AVAILABLE:
+        summary_file.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        with open(summary_file, 'w') as f:
+            json.dump(summary, f, indent=2)
 
     # Print summary table
     print(f"\n{'='*70}")
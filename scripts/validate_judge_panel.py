@@ -18,11 +18,21 @@ Success Criteria:
 
 import os
 import sys
+import argparse
+import asyncio
+import hashlib
 import json
 import logging
+from dataclasses import replace
 from pathlib import Path
 from typing import Dict, List, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -31,7 +41,8 @@ sys.path.insert(0, str(project_root))
 from dotenv import load_dotenv
 load_dotenv()
 
-from src.core.judge_panel import JudgePanel
+from src.core.judge_cache import RUBRIC_VERSION, JudgeCache, dedupe_provider_outputs, expand_duplicate_scores
+from src.core.judge_panel import JUDGE_PANEL_VERSION, JudgePanel
 
 # Configure logging
 logging.basicConfig(
@@ -40,10 +51,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+BASELINE_RESULTS_FILE = project_root / "config/benchmarks/results/phase4_extractions_20251004_175446.json"
+OUTPUT_DIR = project_root / "config/benchmarks/results"
+
+
+def _read_results(path: Path) -> List[Dict[str, Any]]:
+    """Parse a results file"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
 
 def load_baseline_results() -> Dict[str, List[Dict[str, Any]]]:
     """Load baseline extraction results from Phase 4"""
-    results_file = project_root / "config/benchmarks/results/phase4_extractions_20251004_175446.json"
+    results_file = BASELINE_RESULTS_FILE
 
     if not results_file.exists():
         raise FileNotFoundError(
@@ -51,8 +73,7 @@ def load_baseline_results() -> Dict[str, List[Dict[str, Any]]]:
             "Run: uv run python scripts/benchmark_combinations.py config/benchmarks/test_set_famas_baseline.json"
         )
 
-    with open(results_file) as f:
-        data = json.load(f)
+    data = _read_results(results_file)
 
     # Format for judge: {provider_name: [events]}
     provider_outputs = {}
@@ -72,6 +93,164 @@ def load_baseline_results() -> Dict[str, List[Dict[str, Any]]]:
     return provider_outputs
 
 
+def panel_input_hash(results_file: Path) -> str:
+    """Hash of the baseline results plus panel and rubric versions
+
+    Saved panel results are named by this hash, so an unchanged re-run can
+    reuse them instead of calling the judges again.
+    """
+    digest = hashlib.sha256(results_file.read_bytes())
+    digest.update(f"{JUDGE_PANEL_VERSION}:{RUBRIC_VERSION}".encode())
+    return digest.hexdigest()[:16]
+
+
+AUTH_ERROR_STATUS_CODES = frozenset({401, 403})
+
+
+async def _preflight(keys: Dict[str, str]) -> Dict[str, bool]:
+    """
+    Make one cheap authenticated call per judge provider, all concurrently
+
+    A rejected key then fails in seconds instead of after the slower judges
+    have already been paid for. Listing models costs no tokens.
+
+    Returns:
+        Dict mapping each key name to False if the provider rejected it
+    """
+    async def probe_openai():
+        from openai import AsyncOpenAI
+        async with AsyncOpenAI(api_key=keys["OPENAI_API_KEY"]) as client:
+            await client.models.list()
+
+    async def probe_anthropic():
+        from anthropic import AsyncAnthropic
+        async with AsyncAnthropic(api_key=keys["ANTHROPIC_API_KEY"]) as client:
+            await client.models.list(limit=1)
+
+    async def probe_gemini():
+        import google.generativeai as genai
+        genai.configure(api_key=keys["GEMINI_API_KEY"])
+        # The SDK only pages lazily and synchronously; fetch the first page off the loop
+        await asyncio.to_thread(lambda: next(iter(genai.list_models()), None))
+
+    probes = {
+        "OPENAI_API_KEY": probe_openai(),
+        "ANTHROPIC_API_KEY": probe_anthropic(),
+        "GEMINI_API_KEY": probe_gemini()
+    }
+    outcomes = await asyncio.gather(*probes.values(), return_exceptions=True)
+
+    accepted = {}
+    for key_name, outcome in zip(probes, outcomes):
+        if not isinstance(outcome, BaseException):
+            logger.info(f"   ✅ {key_name} accepted")
+            accepted[key_name] = True
+            continue
+
+        status = getattr(outcome, "status_code", None) or getattr(outcome, "code", None)
+        if status in AUTH_ERROR_STATUS_CODES:
+            logger.error(f"   ❌ {key_name} rejected (HTTP {status}): {outcome}")
+            accepted[key_name] = False
+        else:
+            # Rate limits, outages and network errors say nothing about the key
+            logger.warning(f"   ⚠️ {key_name} preflight inconclusive ({status or type(outcome).__name__}): {outcome}")
+            accepted[key_name] = True
+
+    return accepted
+
+
+async def judge_and_close(panel: JudgePanel, document_name: str, provider_outputs: Dict[str, List[Dict[str, Any]]]):
+    """Run the panel and close its shared connection pool on the same event loop"""
+    try:
+        return await panel.judge_document_async(document_name, provider_outputs)
+    finally:
+        await panel.aclose()
+
+
+def run_panel(use_judge_cache: bool):
+    """Check API keys, load baseline results and run the 3-judge panel"""
+    # Check API keys
+    required_keys = {
+        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY"),
+        "ANTHROPIC_API_KEY": os.getenv("ANTHROPIC_API_KEY"),
+        "GEMINI_API_KEY": os.getenv("GEMINI_API_KEY")
+    }
+
+    missing_keys = [k for k, v in required_keys.items() if not v]
+    if missing_keys:
+        logger.error(f"\n❌ Missing API keys: {', '.join(missing_keys)}")
+        logger.error("Please set these environment variables in .env file")
+        sys.exit(1)
+
+    logger.info("\n✅ All API keys configured")
+
+    logger.info("\n🔑 Checking API keys with each provider...")
+    accepted = asyncio.run(_preflight(required_keys))
+    rejected_keys = [k for k, ok in accepted.items() if not ok]
+    if rejected_keys:
+        logger.error(f"\n❌ API keys rejected: {', '.join(rejected_keys)}")
+        sys.exit(1)
+
+    # Load baseline results
+    logger.info("\n📂 Loading baseline extraction results...")
+    try:
+        provider_outputs = load_baseline_results()
+        logger.info(f"✅ Loaded results for {len(provider_outputs)} providers")
+        for provider, events in provider_outputs.items():
+            logger.info(f"   {provider}: {len(events)} events")
+    except Exception as e:
+        logger.error(f"❌ Failed to load baseline results: {e}")
+        sys.exit(1)
+
+    # Initialize 3-judge panel
+    logger.info("\n🎯 Initializing 3-judge panel...")
+    try:
+        panel = JudgePanel(
+            gpt5_api_key=required_keys["OPENAI_API_KEY"],
+            claude_api_key=required_keys["ANTHROPIC_API_KEY"],
+            gemini_api_key=required_keys["GEMINI_API_KEY"],
+            cache=JudgeCache() if use_judge_cache else None
+        )
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize panel: {e}")
+        sys.exit(1)
+
+    # Run panel evaluation
+    logger.info("\n🔍 Running 3-judge panel evaluation...")
+    logger.info("⏳ This may take 30-60 seconds (3 premium models with deep thinking)...\n")
+
+    # Providers with identical events are judged once and share the scores
+    unique_outputs, duplicates = dedupe_provider_outputs(provider_outputs)
+
+    try:
+        document_name = "Answer to Request for Arbitration.pdf"
+        panel_result = asyncio.run(judge_and_close(panel, document_name, unique_outputs))
+    except Exception as e:
+        logger.error(f"❌ Panel evaluation failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+    return panel, expand_duplicate_providers(panel_result, duplicates)
+
+
+def expand_duplicate_providers(panel_result, duplicates: Dict[str, List[str]]):
+    """Copy the judged provider's individual and consensus scores to its duplicates"""
+    if not duplicates:
+        return panel_result
+
+    for judge_result in panel_result.individual_results.values():
+        judge_result.provider_scores = expand_duplicate_scores(judge_result.provider_scores, duplicates)
+
+    for representative, others in duplicates.items():
+        consensus = panel_result.consensus_scores.get(representative)
+        if consensus is not None:
+            for provider in others:
+                panel_result.consensus_scores[provider] = replace(consensus, provider=provider)
+
+    return panel_result
+
+
 def validate_panel_consensus(panel_result):
     """Validate panel consensus against Phase 2 manual evaluation"""
     logger.info("\n" + "="*70)
@@ -86,9 +265,9 @@ def validate_panel_consensus(panel_result):
 
     # Check 1: Winner should be OpenAI or OpenRouter
     if actual_winner in expected_winners:
-        logger.info(f"✅ PASS: Consensus winner '{panel_result.consensus_winner}' matches Phase 2 expectations")
-        logger.info(f"   Phase 2: User preferred OpenAI/OpenRouter (both got 10/10)")
-        logger.info(f"   Panel vote: {panel_result.winner_votes}")
+        logger.info("✅ PASS: Consensus winner '%s' matches Phase 2 expectations", panel_result.consensus_winner)
+        logger.info("   Phase 2: User preferred OpenAI/OpenRouter (both got 10/10)")
+        logger.info("   Panel vote: %s", panel_result.winner_votes)
     else:
         logger.error(f"❌ FAIL: Consensus winner '{panel_result.consensus_winner}' does not match Phase 2")
         logger.error(f"   Expected: {expected_winners}")
@@ -99,7 +278,7 @@ def validate_panel_consensus(panel_result):
     if "openai" in panel_result.consensus_scores:
         openai_score = panel_result.consensus_scores["openai"].overall_quality
         if openai_score >= 7.0:
-            logger.info(f"✅ PASS: OpenAI consensus score {openai_score:.1f}/10 (expected >7.0)")
+            logger.info("✅ PASS: OpenAI consensus score %.1f/10 (expected >7.0)", openai_score)
         else:
             logger.error(f"❌ FAIL: OpenAI consensus score {openai_score:.1f}/10 too low (expected >7.0)")
             validation_passed = False
@@ -107,7 +286,7 @@ def validate_panel_consensus(panel_result):
     if "openrouter" in panel_result.consensus_scores:
         openrouter_score = panel_result.consensus_scores["openrouter"].overall_quality
         if openrouter_score >= 7.0:
-            logger.info(f"✅ PASS: OpenRouter consensus score {openrouter_score:.1f}/10 (expected >7.0)")
+            logger.info("✅ PASS: OpenRouter consensus score %.1f/10 (expected >7.0)", openrouter_score)
         else:
             logger.error(f"❌ FAIL: OpenRouter consensus score {openrouter_score:.1f}/10 too low (expected >7.0)")
             validation_passed = False
@@ -116,8 +295,8 @@ def validate_panel_consensus(panel_result):
     if "langextract" in panel_result.consensus_scores:
         langextract_score = panel_result.consensus_scores["langextract"].overall_quality
         if langextract_score < 5.0:
-            logger.info(f"✅ PASS: LangExtract penalized {langextract_score:.1f}/10 (expected <5.0 for missing citations)")
-            logger.info(f"   Phase 2: LangExtract had 5 events but NO citations (fatal flaw)")
+            logger.info("✅ PASS: LangExtract penalized %.1f/10 (expected <5.0 for missing citations)", langextract_score)
+            logger.info("   Phase 2: LangExtract had 5 events but NO citations (fatal flaw)")
         else:
             logger.error(f"❌ FAIL: LangExtract score {langextract_score:.1f}/10 too high (expected <5.0)")
             logger.error(f"   LangExtract should be heavily penalized for missing citations")
@@ -126,88 +305,69 @@ def validate_panel_consensus(panel_result):
     # Check 4: Inter-judge agreement should be strong (>0.7)
     avg_correlation = panel_result.agreement.average_correlation
     if avg_correlation >= 0.7:
-        logger.info(f"✅ PASS: Inter-judge agreement {avg_correlation:.3f} is strong (expected >0.7)")
+        logger.info("✅ PASS: Inter-judge agreement %.3f is strong (expected >0.7)", avg_correlation)
     else:
         logger.warning(f"⚠️ WARNING: Inter-judge agreement {avg_correlation:.3f} is moderate (expected >0.7)")
         logger.warning(f"   Pairwise correlations: {panel_result.agreement.pearson_correlation}")
         # Not a hard failure, but worth noting
 
-    # Check 5: Confidence level
-    confidence = panel_result.agreement.confidence_level
-    logger.info(f"\n📊 Confidence Level: {confidence}")
-    logger.info(f"   Winner Consensus: {panel_result.agreement.winner_consensus_percentage:.1f}%")
+    # Check 5: Confidence level (informational only, so skipped entirely below INFO)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n📊 Confidence Level: %s", panel_result.agreement.confidence_level)
+        logger.info("   Winner Consensus: %.1f%%", panel_result.agreement.winner_consensus_percentage)
 
     return validation_passed
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Validate the 3-judge panel against Phase 2 manual evaluation")
+    parser.add_argument(
+        "--use-judge-cache",
+        action="store_true",
+        help="Reuse cached judge responses for unchanged inputs (same as JUDGE_CACHE=1)"
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Save the panel result as zstd-compressed JSON (.json.zst)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run the panel even if a saved result matches the current inputs"
+    )
+    args = parser.parse_args()
+
     logger.info("\n" + "="*70)
     logger.info("🎯 3-JUDGE PANEL VALIDATION")
     logger.info("="*70)
     logger.info("\nValidating 3-judge panel against Phase 2 manual evaluation...")
 
-    # Check API keys
-    required_keys = {
-        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY"),
-        "ANTHROPIC_API_KEY": os.getenv("ANTHROPIC_API_KEY"),
-        "GEMINI_API_KEY": os.getenv("GEMINI_API_KEY")
-    }
-
-    missing_keys = [k for k, v in required_keys.items() if not v]
-    if missing_keys:
-        logger.error(f"\n❌ Missing API keys: {', '.join(missing_keys)}")
-        logger.error("Please set these environment variables in .env file")
-        sys.exit(1)
-
-    logger.info("\n✅ All API keys configured")
-
-    # Load baseline results
-    logger.info("\n📂 Loading baseline extraction results...")
-    try:
-        provider_outputs = load_baseline_results()
-        logger.info(f"✅ Loaded results for {len(provider_outputs)} providers")
-        for provider, events in provider_outputs.items():
-            logger.info(f"   {provider}: {len(events)} events")
-    except Exception as e:
-        logger.error(f"❌ Failed to load baseline results: {e}")
-        sys.exit(1)
-
-    # Initialize 3-judge panel
-    logger.info("\n🎯 Initializing 3-judge panel...")
-    try:
-        panel = JudgePanel(
-            gpt5_api_key=required_keys["OPENAI_API_KEY"],
-            claude_api_key=required_keys["ANTHROPIC_API_KEY"],
-            gemini_api_key=required_keys["GEMINI_API_KEY"]
+    # Reuse the saved panel result (plain or compressed) when the inputs have not changed
+    output_file = None
+    saved_file = None
+    if BASELINE_RESULTS_FILE.exists():
+        output_file = OUTPUT_DIR / f"phase4_panel_validation_{panel_input_hash(BASELINE_RESULTS_FILE)}.json"
+        saved_file = next(
+            (p for p in (output_file, output_file.with_name(output_file.name + ".zst")) if p.exists()),
+            None
         )
-    except Exception as e:
-        logger.error(f"❌ Failed to initialize panel: {e}")
-        sys.exit(1)
-
-    # Run panel evaluation
-    logger.info("\n🔍 Running 3-judge panel evaluation...")
-    logger.info("⏳ This may take 30-60 seconds (3 premium models with deep thinking)...\n")
-
-    try:
-        document_name = "Answer to Request for Arbitration.pdf"
-        panel_result = panel.judge_document(document_name, provider_outputs)
-    except Exception as e:
-        logger.error(f"❌ Panel evaluation failed: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
 
-    # Validate results
-    validation_passed = validate_panel_consensus(panel_result)
-
-    # Save results
-    output_dir = project_root / "config/benchmarks/results"
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if saved_file is not None and not args.force:
+        output_file = saved_file
+        logger.info(f"\n♻️  Inputs unchanged - reusing saved panel result: {output_file}")
+        logger.info("   Pass --force to re-run the judges")
+        panel_result = JudgePanel.load_results(str(output_file))
+        validation_passed = validate_panel_consensus(panel_result)
+    else:
+        panel, panel_result = run_panel(args.use_judge_cache)
 
-    timestamp = panel_result.timestamp.replace(":", "").replace(".", "_").replace("-", "")[:15]
-    output_file = output_dir / f"phase4_panel_validation_{timestamp}.json"
+        # Validate results
+        validation_passed = validate_panel_consensus(panel_result)
 
-    panel.save_results(panel_result, str(output_file))
+        # Save results (run_panel exits if the baseline file is missing, so output_file is set)
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        output_file = panel.save_results(panel_result, str(output_file), compress=args.compress)
 
     # Final summary
     logger.info("\n" + "="*70)
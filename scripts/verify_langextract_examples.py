@@ -51,6 +51,20 @@ import signal
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# Attributes the LangExtract API expects on each example and extraction
+REQUIRED_EXAMPLE_FIELDS = frozenset({"text", "extractions"})
+REQUIRED_EXTRACTION_FIELDS = frozenset({"extraction_class", "extraction_text", "attributes"})
+
+
+def missing_fields(obj, required: frozenset) -> set:
+    """Required attribute names absent from obj, via one set difference on its __dict__"""
+    try:
+        return required - vars(obj).keys()
+    except TypeError:
+        # No __dict__ (e.g. a slotted dataclass); fall back to attribute lookups
+        return {name for name in required if not hasattr(obj, name)}
+
+
 def handle_sigfpe(signum, frame):
     """Handle SIGFPE (floating point exception) during import"""
     print("❌ SIGFPE detected during langextract import")
@@ -73,14 +87,17 @@ def main():
     try:
         # Test if langextract module is available with broad exception handling
         try:
-            print("🔍 Testing langextract import...")
-            import langextract as lx
+            # Structural checks only use the data classes. Importing the
+            # submodule still runs langextract/__init__.py, so this is the
+            # same import cost as "import langextract"
+            print("🔍 Testing langextract.data import...")
+            from langextract import data as lx_data
             print("✅ langextract module available")
 
             # Verify core components are accessible
             print("🔍 Verifying langextract.data components...")
-            ExampleData = lx.data.ExampleData
-            Extraction = lx.data.Extraction
+            ExampleData = lx_data.ExampleData
+            Extraction = lx_data.Extraction
             print("✅ ExampleData and Extraction classes accessible")
 
         except ImportError as e:
@@ -91,7 +108,7 @@ def main():
             print(f"❌ langextract import failed with {type(e).__name__}: {e}")
             print("💡 This may be due to sandbox environment limitations or native library conflicts")
             print("📋 Manual test commands:")
-            print("   .venv/bin/python -c 'import langextract as lx; print(lx.data.ExampleData)'")
+            print("   .venv/bin/python -c 'from langextract import data; print(data.ExampleData)'")
             print("   .venv/bin/python -c 'import torch; import numpy; print(\"Dependencies OK\")'")
             return 2
 
@@ -123,30 +140,28 @@ def main():
                 return 1
 
             # Verify example structure
-            if client.shared_examples:
-                example = client.shared_examples[0]
-                if hasattr(example, 'text') and hasattr(example, 'extractions'):
-                    print("✅ Examples use correct API format (text + extractions)")
-                    if example.extractions and len(example.extractions) > 0:
-                        extraction = example.extractions[0]
-                        if (hasattr(extraction, 'extraction_class') and
-                            hasattr(extraction, 'extraction_text') and
-                            hasattr(extraction, 'attributes')):
-                            print("✅ Extractions have required fields")
-                            print(f"✅ SUCCESS: {example_count} examples ready for LangExtract")
-                            return 0
-                        else:
-                            print("❌ Extraction missing required fields")
-                            print("💡 Check extraction object construction in _create_shared_examples")
-                            return 1
-                    else:
-                        print("❌ Example has no extractions")
-                        print("💡 ExampleData objects need non-empty extractions list")
-                        return 1
-                else:
-                    print("❌ Example uses wrong API format")
-                    print("💡 Expected ExampleData(text=..., extractions=[...]) format")
-                    return 1
+            example = client.shared_examples[0]
+            missing = missing_fields(example, REQUIRED_EXAMPLE_FIELDS)
+            if missing:
+                print(f"❌ Example uses wrong API format (missing: {sorted(missing)})")
+                print("💡 Expected ExampleData(text=..., extractions=[...]) format")
+                return 1
+            print("✅ Examples use correct API format (text + extractions)")
+
+            if not example.extractions:
+                print("❌ Example has no extractions")
+                print("💡 ExampleData objects need non-empty extractions list")
+                return 1
+
+            missing = missing_fields(example.extractions[0], REQUIRED_EXTRACTION_FIELDS)
+            if missing:
+                print(f"❌ Extraction missing required fields: {sorted(missing)}")
+                print("💡 Check extraction object construction in _create_shared_examples")
+                return 1
+
+            print("✅ Extractions have required fields")
+            print(f"✅ SUCCESS: {example_count} examples ready for LangExtract")
+            return 0
 
         except Exception as client_error:
             print(f"❌ Error during LangExtractClient verification: {type(client_error).__name__}: {client_error}")
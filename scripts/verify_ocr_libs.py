@@ -1,66 +1,64 @@
 #!/usr/bin/env python3
 """Verify all OCR libraries are working"""
-import sys
-from pathlib import Path
+import importlib
+import importlib.util
+from importlib.metadata import PackageNotFoundError, version
 
-print("="*70)
-print("OCR LIBRARIES VERIFICATION")
-print("="*70)
+# (label, module, distribution, version symbol). Only libraries with a version
+# symbol are imported; the rest are located via find_spec + package metadata.
+PROBES = [
+    ("tesserocr", "tesserocr", "tesserocr", "tesseract_version"),
+    ("easyocr", "easyocr", "easyocr", None),
+    ("paddleocr", "paddleocr", "paddleocr", None),
+    ("rapidocr-onnxruntime", "rapidocr_onnxruntime", "rapidocr-onnxruntime", None),
+]
 
-# Test 1: Tesserocr
-print("\n1. Testing tesserocr...")
-try:
-    import tesserocr
-    print(f"   ✅ tesserocr {tesserocr.tesseract_version()}")
-except Exception as e:
-    print(f"   ❌ Error: {e}")
+DOCLING_OCR_OPTIONS = [
+    ("TesseractOcrOptions", ""),
+    ("EasyOcrOptions", ""),
+    ("OcrMacOptions", " (macOS native)"),
+]
 
-# Test 2: EasyOCR
-print("\n2. Testing easyocr...")
-try:
-    import easyocr
-    print(f"   ✅ easyocr installed")
-except Exception as e:
-    print(f"   ❌ Error: {e}")
 
-# Test 3: PaddleOCR
-print("\n3. Testing paddleocr...")
-try:
-    from paddleocr import PaddleOCR
-    print(f"   ✅ paddleocr installed")
-except Exception as e:
-    print(f"   ❌ Error: {e}")
-
-# Test 4: RapidOCR
-print("\n4. Testing rapidocr...")
-try:
-    from rapidocr_onnxruntime import RapidOCR
-    print(f"   ✅ rapidocr-onnxruntime installed")
-except Exception as e:
-    print(f"   ❌ Error: {e}")
+def probe(module: str, distribution: str, symbol: str | None) -> str:
+    """One result line for a library"""
+    try:
+        if symbol:
+            return f"✅ {getattr(importlib.import_module(module), symbol)()}"
+        if importlib.util.find_spec(module) is None:
+            return "❌ not installed"
+        try:
+            return f"✅ {version(distribution)}"
+        except PackageNotFoundError:
+            return "✅ installed"
+    except Exception as e:
+        return f"❌ Error: {e}"
 
-# Test 5: Check Docling OCR options
-print("\n5. Testing Docling OCR options...")
-try:
-    from docling.datamodel.pipeline_options import (
-        PipelineOptions,
-        TesseractOcrOptions,
-        EasyOcrOptions
-    )
-    print(f"   ✅ Docling OCR options available")
-    print(f"      - TesseractOcrOptions")
-    print(f"      - EasyOcrOptions")
 
-    # Check if OCRmac is available (macOS only)
+def probe_docling_options() -> list[str]:
+    """Result lines for the Docling OCR option classes"""
     try:
-        from docling.datamodel.pipeline_options import OcrMacOptions
-        print(f"      - OcrMacOptions (macOS native)")
-    except:
-        print(f"      - OcrMacOptions (not available)")
+        pipeline_options = importlib.import_module("docling.datamodel.pipeline_options")
+    except Exception as e:
+        return [f"   ❌ Error: {e}"]
+    return [
+        f"      - {name}{note}" if hasattr(pipeline_options, name) else f"      - {name} (not available)"
+        for name, note in DOCLING_OCR_OPTIONS
+    ]
 
-except Exception as e:
-    print(f"   ❌ Error: {e}")
 
-print("\n" + "="*70)
-print("VERIFICATION COMPLETE")
-print("="*70 + "\n")
+rows = [f"   {label:<22} {probe(module, dist, symbol)}" for label, module, dist, symbol in PROBES]
+print("\n".join([
+    "=" * 70,
+    "OCR LIBRARIES VERIFICATION",
+    "=" * 70,
+    "",
+    *rows,
+    "",
+    "   Docling OCR options:",
+    *probe_docling_options(),
+    "",
+    "=" * 70,
+    "VERIFICATION COMPLETE",
+    "=" * 70 + "\n",
+]))
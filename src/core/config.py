@@ -1,10 +1,18 @@
 """
 Configuration module for Docling and LangExtract settings
 Provides strongly-typed configuration with environment variable overrides
+
+Import order matters: environment variables are read ONCE, when this module is
+first imported, and become the dataclass defaults. Call load_dotenv() (or set
+os.environ) before importing anything from src.core; a later change is not
+seen by ``DoclingConfig()`` and friends. Code that must change the
+environment afterwards builds its configs with ``config_from_env(cls)``.
 """
 
 import os
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
 from typing import Optional, Literal, Tuple, Any
 
 from .constants import DEFAULT_MODEL
@@ -52,110 +60,230 @@ def env_optional_str(var_name: str) -> Optional[str]:
     return value if value else None
 
 
-@dataclass
+# Environment-derived defaults, evaluated once when this module is imported
+# (entry points call load_dotenv() before importing it). Instantiating a config
+# then copies plain defaults instead of calling a factory per field; use
+# config_from_env() when the environment changed after import.
+def _docling_defaults() -> dict:
+    """Defaults for DoclingConfig read from DOCLING_* variables"""
+    return {
+        "do_ocr": env_bool("DOCLING_DO_OCR", True),
+        "auto_ocr_detection": env_bool("DOCLING_AUTO_OCR_DETECTION", True),
+        "ocr_engine": env_str("DOCLING_OCR_ENGINE", "tesseract"),
+        "do_table_structure": env_bool("DOCLING_DO_TABLE_STRUCTURE", True),
+        "table_mode": env_str("DOCLING_TABLE_MODE", "FAST"),
+        "do_cell_matching": env_bool("DOCLING_DO_CELL_MATCHING", True),
+        "backend": env_str("DOCLING_BACKEND", "default"),
+        "accelerator_device": env_str("DOCLING_ACCELERATOR_DEVICE", "cpu"),
+        "accelerator_threads": env_int("DOCLING_ACCELERATOR_THREADS", 4),
+        "artifacts_path": env_optional_str("DOCLING_ARTIFACTS_PATH"),
+        "document_timeout": env_int("DOCLING_DOCUMENT_TIMEOUT", 300),
+    }
+
+
+def _langextract_defaults() -> dict:
+    """Defaults for LangExtractConfig"""
+    return {
+        "model_id": env_str("GEMINI_MODEL_ID", DEFAULT_MODEL),
+        "temperature": env_float("LANGEXTRACT_TEMPERATURE", 0.0),
+        "max_workers": env_int("LANGEXTRACT_MAX_WORKERS", 10),
+        "debug": env_bool("LANGEXTRACT_DEBUG", False),
+    }
+
+
+def _extractor_defaults() -> dict:
+    """Defaults for ExtractorConfig"""
+    return {
+        "doc_extractor": env_str("DOC_EXTRACTOR", "docling"),
+        "event_extractor": env_str("EVENT_EXTRACTOR", "langextract"),
+    }
+
+
+def _api_defaults(prefix: str, base_url: str, model: str, timeout: int) -> dict:
+    """Defaults for an HTTP provider config read from {prefix}_* variables"""
+    return {
+        "api_key": env_str(f"{prefix}_API_KEY", ""),
+        "base_url": env_str(f"{prefix}_BASE_URL", base_url),
+        "model": env_str(f"{prefix}_MODEL", model),
+        "timeout": env_int(f"{prefix}_TIMEOUT", timeout),
+    }
+
+
+_DEFAULT_FACTORIES = {
+    "docling": _docling_defaults,
+    "langextract": _langextract_defaults,
+    "extractor": _extractor_defaults,
+    "openrouter": partial(_api_defaults, "OPENROUTER", "https://openrouter.ai/api/v1", "anthropic/claude-3-haiku", 30),
+    "opencodezen": partial(
+        _api_defaults, "OPENCODEZEN", "https://api.opencode-zen.example/v1", "opencode-zen/legal-extractor", 30
+    ),
+    "openai": partial(_api_defaults, "OPENAI", "https://api.openai.com/v1", "gpt-4o-mini", 60),
+    "anthropic": partial(_api_defaults, "ANTHROPIC", "https://api.anthropic.com", "claude-3-haiku-20240307", 60),
+    "deepseek": partial(_api_defaults, "DEEPSEEK", "https://api.deepseek.com/v1", "deepseek-chat", 180),
+}
+
+_DOCLING_DEFAULTS = _DEFAULT_FACTORIES["docling"]()
+_TABLE_MODES = frozenset({"FAST", "ACCURATE"})
+_ACCELERATOR_DEVICES = frozenset({"cuda", "mps", "cpu"})
+_LANGEXTRACT_DEFAULTS = _DEFAULT_FACTORIES["langextract"]()
+_EXTRACTOR_DEFAULTS = _DEFAULT_FACTORIES["extractor"]()
+_OPENROUTER_DEFAULTS = _DEFAULT_FACTORIES["openrouter"]()
+_OPENCODEZEN_DEFAULTS = _DEFAULT_FACTORIES["opencodezen"]()
+_OPENAI_DEFAULTS = _DEFAULT_FACTORIES["openai"]()
+_ANTHROPIC_DEFAULTS = _DEFAULT_FACTORIES["anthropic"]()
+_DEEPSEEK_DEFAULTS = _DEFAULT_FACTORIES["deepseek"]()
+
+
+@dataclass(frozen=True, slots=True)
 class DoclingConfig:
-    """Configuration for Docling document processing"""
+    """Configuration for Docling document processing
+
+    Frozen (and so hashable); use ``dataclasses.replace`` to derive a variant.
+    """
 
     # OCR and processing options
-    do_ocr: bool = field(default_factory=lambda: env_bool("DOCLING_DO_OCR", True))
-    auto_ocr_detection: bool = field(default_factory=lambda: env_bool("DOCLING_AUTO_OCR_DETECTION", True))
-    ocr_engine: Literal["tesseract", "easyocr", "ocrmac", "rapidocr"] = field(
-        default_factory=lambda: env_str("DOCLING_OCR_ENGINE", "tesseract")
-    )
-    do_table_structure: bool = field(default_factory=lambda: env_bool("DOCLING_DO_TABLE_STRUCTURE", True))
-    table_mode: Literal["FAST", "ACCURATE"] = field(default_factory=lambda: env_str("DOCLING_TABLE_MODE", "FAST"))
-    do_cell_matching: bool = field(default_factory=lambda: env_bool("DOCLING_DO_CELL_MATCHING", True))
+    do_ocr: bool = _DOCLING_DEFAULTS["do_ocr"]
+    auto_ocr_detection: bool = _DOCLING_DEFAULTS["auto_ocr_detection"]
+    ocr_engine: Literal["tesseract", "easyocr", "ocrmac", "rapidocr"] = _DOCLING_DEFAULTS["ocr_engine"]
+    do_table_structure: bool = _DOCLING_DEFAULTS["do_table_structure"]
+    table_mode: Literal["FAST", "ACCURATE"] = _DOCLING_DEFAULTS["table_mode"]
+    do_cell_matching: bool = _DOCLING_DEFAULTS["do_cell_matching"]
 
     # Backend and acceleration
-    backend: Literal["default", "v2"] = field(default_factory=lambda: env_str("DOCLING_BACKEND", "default"))
-    accelerator_device: Literal["cuda", "mps", "cpu"] = field(default_factory=lambda: env_str("DOCLING_ACCELERATOR_DEVICE", "cpu"))
-    accelerator_threads: int = field(default_factory=lambda: env_int("DOCLING_ACCELERATOR_THREADS", 4))
+    backend: Literal["default", "v2"] = _DOCLING_DEFAULTS["backend"]
+    accelerator_device: Literal["cuda", "mps", "cpu"] = _DOCLING_DEFAULTS["accelerator_device"]
+    accelerator_threads: int = _DOCLING_DEFAULTS["accelerator_threads"]
 
     # Paths and timeouts
-    artifacts_path: Optional[str] = field(default_factory=lambda: env_optional_str("DOCLING_ARTIFACTS_PATH"))
-    document_timeout: int = field(default_factory=lambda: env_int("DOCLING_DOCUMENT_TIMEOUT", 300))
+    artifacts_path: Optional[str] = _DOCLING_DEFAULTS["artifacts_path"]
+    document_timeout: int = _DOCLING_DEFAULTS["document_timeout"]
+
+    def __post_init__(self):
+        """Validate the enumerated string options and intern them"""
+        for name, allowed in (("table_mode", _TABLE_MODES), ("accelerator_device", _ACCELERATOR_DEVICES)):
+            value = getattr(self, name)
+            if value not in allowed:
+                raise ValueError(f"Invalid DoclingConfig.{name} {value!r}; expected one of {sorted(allowed)}")
+            object.__setattr__(self, name, sys.intern(value))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LangExtractConfig:
     """Configuration for LangExtract operations"""
 
     # Model and API settings
-    model_id: str = field(default_factory=lambda: os.getenv("GEMINI_MODEL_ID", DEFAULT_MODEL))
-    temperature: float = field(default_factory=lambda: env_float("LANGEXTRACT_TEMPERATURE", 0.0))
-    max_workers: int = field(default_factory=lambda: env_int("LANGEXTRACT_MAX_WORKERS", 10))
-    debug: bool = field(default_factory=lambda: env_bool("LANGEXTRACT_DEBUG", False))
+    model_id: str = _LANGEXTRACT_DEFAULTS["model_id"]
+    temperature: float = _LANGEXTRACT_DEFAULTS["temperature"]
+    max_workers: int = _LANGEXTRACT_DEFAULTS["max_workers"]
+    debug: bool = _LANGEXTRACT_DEFAULTS["debug"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OpenRouterConfig:
     """Configuration for OpenRouter API operations"""
 
     # API settings
-    api_key: str = field(default_factory=lambda: env_str("OPENROUTER_API_KEY", ""))
-    base_url: str = field(default_factory=lambda: env_str("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"))
-    model: str = field(default_factory=lambda: env_str("OPENROUTER_MODEL", "anthropic/claude-3-haiku"))
-    timeout: int = field(default_factory=lambda: env_int("OPENROUTER_TIMEOUT", 30))
+    api_key: str = _OPENROUTER_DEFAULTS["api_key"]
+    base_url: str = _OPENROUTER_DEFAULTS["base_url"]
+    model: str = _OPENROUTER_DEFAULTS["model"]
+    timeout: int = _OPENROUTER_DEFAULTS["timeout"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OpenCodeZenConfig:
     """Configuration for OpenCode Zen API operations"""
 
     # API settings
-    api_key: str = field(default_factory=lambda: env_str("OPENCODEZEN_API_KEY", ""))
-    base_url: str = field(default_factory=lambda: env_str("OPENCODEZEN_BASE_URL", "https://api.opencode-zen.example/v1"))
-    model: str = field(default_factory=lambda: env_str("OPENCODEZEN_MODEL", "opencode-zen/legal-extractor"))
-    timeout: int = field(default_factory=lambda: env_int("OPENCODEZEN_TIMEOUT", 30))
+    api_key: str = _OPENCODEZEN_DEFAULTS["api_key"]
+    base_url: str = _OPENCODEZEN_DEFAULTS["base_url"]
+    model: str = _OPENCODEZEN_DEFAULTS["model"]
+    timeout: int = _OPENCODEZEN_DEFAULTS["timeout"]
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def get_opencodezen_config() -> OpenCodeZenConfig:
+    """Return the process-wide OpenCode Zen configuration, read from the environment once.
+
+    The instance is shared; callers that need to adjust fields should work on a
+    copy (``dataclasses.replace``) so the cached instance stays pristine.
+    """
+    return config_from_env(OpenCodeZenConfig)
+
+
+@dataclass(frozen=True, slots=True)
 class OpenAIConfig:
     """Configuration for OpenAI API operations"""
 
     # API settings
-    api_key: str = field(default_factory=lambda: env_str("OPENAI_API_KEY", ""))
-    base_url: str = field(default_factory=lambda: env_str("OPENAI_BASE_URL", "https://api.openai.com/v1"))
-    model: str = field(default_factory=lambda: env_str("OPENAI_MODEL", "gpt-4o-mini"))
-    timeout: int = field(default_factory=lambda: env_int("OPENAI_TIMEOUT", 60))
+    api_key: str = _OPENAI_DEFAULTS["api_key"]
+    base_url: str = _OPENAI_DEFAULTS["base_url"]
+    model: str = _OPENAI_DEFAULTS["model"]
+    timeout: int = _OPENAI_DEFAULTS["timeout"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AnthropicConfig:
     """Configuration for Anthropic API operations"""
 
     # API settings
-    api_key: str = field(default_factory=lambda: env_str("ANTHROPIC_API_KEY", ""))
-    base_url: str = field(default_factory=lambda: env_str("ANTHROPIC_BASE_URL", "https://api.anthropic.com"))
-    model: str = field(default_factory=lambda: env_str("ANTHROPIC_MODEL", "claude-3-haiku-20240307"))
-    timeout: int = field(default_factory=lambda: env_int("ANTHROPIC_TIMEOUT", 60))
+    api_key: str = _ANTHROPIC_DEFAULTS["api_key"]
+    base_url: str = _ANTHROPIC_DEFAULTS["base_url"]
+    model: str = _ANTHROPIC_DEFAULTS["model"]
+    timeout: int = _ANTHROPIC_DEFAULTS["timeout"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeepSeekConfig:
     """Configuration for DeepSeek API operations"""
 
     # API settings
-    api_key: str = field(default_factory=lambda: env_str("DEEPSEEK_API_KEY", ""))
-    base_url: str = field(default_factory=lambda: env_str("DEEPSEEK_BASE_URL", "https://api.deepseek.com/v1"))
-    model: str = field(default_factory=lambda: env_str("DEEPSEEK_MODEL", "deepseek-chat"))
-    timeout: int = field(default_factory=lambda: env_int("DEEPSEEK_TIMEOUT", 180))
+    api_key: str = _DEEPSEEK_DEFAULTS["api_key"]
+    base_url: str = _DEEPSEEK_DEFAULTS["base_url"]
+    model: str = _DEEPSEEK_DEFAULTS["model"]
+    timeout: int = _DEEPSEEK_DEFAULTS["timeout"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExtractorConfig:
     """Configuration for extractor selection"""
 
     # Extractor type selection
-    doc_extractor: str = None
-    event_extractor: str = None
+    doc_extractor: str = _EXTRACTOR_DEFAULTS["doc_extractor"]
+    event_extractor: str = _EXTRACTOR_DEFAULTS["event_extractor"]
 
-    def __post_init__(self):
-        """Initialize fields with environment variables after instance creation"""
-        if self.doc_extractor is None:
-            self.doc_extractor = env_str("DOC_EXTRACTOR", "docling")
-        if self.event_extractor is None:
-            self.event_extractor = env_str("EVENT_EXTRACTOR", "langextract")
+
+_CONFIG_DEFAULT_KEYS = {
+    DoclingConfig: "docling",
+    LangExtractConfig: "langextract",
+    OpenRouterConfig: "openrouter",
+    OpenCodeZenConfig: "opencodezen",
+    OpenAIConfig: "openai",
+    AnthropicConfig: "anthropic",
+    DeepSeekConfig: "deepseek",
+    ExtractorConfig: "extractor",
+}
+
+
+def config_from_env(config_cls, **overrides):
+    """
+    Build a config from the environment as it is now, not as it was at import
+
+    For scripts that load a .env file or change os.environ after importing this
+    module; keyword overrides win over environment values.
+    """
+    defaults = _DEFAULT_FACTORIES[_CONFIG_DEFAULT_KEYS[config_cls]]()
+    return config_cls(**{**defaults, **overrides})
+
+
+# Event extractor provider -> its config class; unknown providers fall back to LangExtract
+_PROVIDER_CONFIGS = {
+    "openrouter": OpenRouterConfig,
+    "opencode_zen": OpenCodeZenConfig,
+    "openai": OpenAIConfig,
+    "anthropic": AnthropicConfig,
+    "deepseek": DeepSeekConfig,
+    "langextract": LangExtractConfig,
+}
 
 
 def load_config() -> Tuple[DoclingConfig, LangExtractConfig, ExtractorConfig]:
@@ -182,7 +310,7 @@ def load_provider_config(
     Args:
         provider: Event extractor provider type.
         docling_config: Optional pre-loaded Docling configuration instance.
-        extractor_config: Optional extractor configuration instance to update.
+        extractor_config: Optional extractor configuration to derive the returned one from.
 
     Returns:
         Tuple of (DoclingConfig, provider_specific_config, ExtractorConfig) instances.
@@ -191,20 +319,11 @@ def load_provider_config(
     extractor_config = extractor_config or ExtractorConfig()
 
     provider_key = (provider or extractor_config.event_extractor or "langextract").strip().lower()
-    extractor_config.event_extractor = provider_key
-
-    if provider_key == "openrouter":
-        event_config = OpenRouterConfig()
-    elif provider_key == "opencode_zen":
-        event_config = OpenCodeZenConfig()
-    elif provider_key == "openai":
-        event_config = OpenAIConfig()
-    elif provider_key == "anthropic":
-        event_config = AnthropicConfig()
-    elif provider_key == "deepseek":
-        event_config = DeepSeekConfig()
-    else:
-        event_config = LangExtractConfig()
-        extractor_config.event_extractor = "langextract"
 
+    config_cls = _PROVIDER_CONFIGS.get(provider_key)
+    if config_cls is None:
+        config_cls, provider_key = LangExtractConfig, "langextract"
+    event_config = config_cls()
+
+    extractor_config = replace(extractor_config, event_extractor=provider_key)
     return docling_config, event_config, extractor_config
@@ -36,6 +36,11 @@ PROHIBITION: Never return an extraction with blank or empty "event_particulars"
 
 Extract all legally significant events, proceedings, filings, agreements, and deadlines."""
 
+# System prompt for the chat-completion adapters, built once instead of per request
+LEGAL_EVENTS_JSON_PROMPT = (
+    LEGAL_EVENTS_PROMPT + "\n\nReturn your response as valid JSON array containing the extracted events."
+)
+
 # API configuration
 REQUIRED_ENV_VARS = ["GEMINI_API_KEY"]
 DEFAULT_MODEL = "gemini-2.0-flash"
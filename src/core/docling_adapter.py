@@ -4,8 +4,13 @@ Wraps DocumentProcessor with configured options to implement DocumentExtractor i
 """
 
 import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Optional, Sequence
 
 import fitz  # PyMuPDF
 
@@ -50,10 +55,31 @@ def is_scanned_pdf(file_path: Path, sample_pages: int = 3, text_threshold: int =
         return True
 
     except Exception as e:
-        logger.warning(f"PDF detection failed for {file_path.name}: {e}, assuming digital")
+        logger.warning("PDF detection failed for %s: %s, assuming digital", file_path.name, e)
         return False  # Default to digital (fast path) on error
 
 
+_thread_processors = threading.local()
+
+
+def _get_processor(config: DoclingConfig) -> DocumentProcessor:
+    """
+    Return a DocumentProcessor for this config, shared within the calling thread
+
+    Building the Docling converter pipeline is the bulk of extractor start-up
+    cost, so equal configs reuse one processor. The Docling converter is not
+    safe to use from several threads at once, so each thread (e.g. each
+    Streamlit session) gets its own processors.
+    """
+    processors = getattr(_thread_processors, "processors", None)
+    if processors is None:
+        processors = _thread_processors.processors = {}
+    processor = processors.get(config)
+    if processor is None:
+        processor = processors[config] = DocumentProcessor(config)
+    return processor
+
+
 class DoclingDocumentExtractor:
     """Adapter that wraps DocumentProcessor to implement DocumentExtractor interface"""
 
@@ -65,7 +91,7 @@ class DoclingDocumentExtractor:
             config: DoclingConfig instance with all Docling settings
         """
         self.config = config
-        self.processor = DocumentProcessor(config)
+        self.processor = _get_processor(config)
         self.ocr_processor = None  # Lazy-init cache for OCR-enabled processor
         logger.info("✅ DoclingDocumentExtractor initialized")
 
@@ -79,49 +105,88 @@ class DoclingDocumentExtractor:
         Returns:
             ExtractedDocument with markdown, plain_text and metadata
         """
-        try:
-            # Get file extension from path
-            file_type = file_path.suffix.lstrip('.')
+        return self._extract(file_path, self._own_processor)
+
+    def extract_batch(self, file_paths: Sequence[Path], max_workers: Optional[int] = None) -> List[ExtractedDocument]:
+        """
+        Extract several documents concurrently, returning results in input order
+
+        Docling parsing and OCR run in native code that releases the GIL. Each
+        worker thread converts with its own processor, since one Docling
+        converter must not be used from several threads; every worker pays the
+        converter start-up cost once per call, so this pays off on larger batches.
 
+        Args:
+            file_paths: Documents to extract
+            max_workers: Worker threads (defaults to the CPU count divided by
+                config.accelerator_threads, so workers don't oversubscribe cores)
+
+        Returns:
+            One ExtractedDocument per path; failures are reported per document
+        """
+        if max_workers is None:
+            max_workers = (os.cpu_count() or 1) // max(1, self.config.accelerator_threads)
+        workers = min(max(1, max_workers), len(file_paths))
+        if workers <= 1:
+            return [self.extract(path) for path in file_paths]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda path: self._extract(path, self._thread_processor), file_paths))
+
+    def _own_processor(self, use_ocr_processor: bool) -> DocumentProcessor:
+        """This extractor's processors, for calls made through extract()"""
+        if not use_ocr_processor:
+            return self.processor
+        if self.ocr_processor is None:
+            # Lazy initialization: create OCR-enabled processor once
+            self.ocr_processor = _get_processor(replace(self.config, do_ocr=True))
+            logger.info("🔧 Created cached OCR processor for scanned PDFs")
+        return self.ocr_processor
+
+    def _thread_processor(self, use_ocr_processor: bool) -> DocumentProcessor:
+        """The calling thread's processors, for extract_batch() workers"""
+        config = replace(self.config, do_ocr=True) if use_ocr_processor else self.config
+        return _get_processor(config)
+
+    def _extract(
+        self,
+        file_path: Path,
+        get_processor: Callable[[bool], DocumentProcessor]
+    ) -> ExtractedDocument:
+        """extract() body; get_processor(True) supplies the OCR-enabled processor"""
+        # Parsed once and shared by the success and failure paths
+        suffix = file_path.suffix
+        file_type = sys.intern(suffix[1:].lower()) if suffix else ""
+        path_str = str(file_path)
+
+        try:
             # Determine if OCR should be used for this specific document
             needs_ocr = self.config.do_ocr  # Default: use config setting
             ocr_auto_detected = False
 
             # Auto-detect OCR requirement for PDFs
-            if (file_type.lower() == 'pdf' and
+            if (file_type == 'pdf' and
                 self.config.auto_ocr_detection and
                 not self.config.do_ocr):  # Only auto-detect if OCR is currently disabled
 
                 if is_scanned_pdf(file_path):
                     needs_ocr = True
                     ocr_auto_detected = True
-                    logger.info(f"🔍 OCR auto-detected for scanned PDF: {file_path.name}")
-
-            # Create processor with appropriate OCR setting
-            if needs_ocr and not self.config.do_ocr:
-                # Need OCR but current processor doesn't have it - use cached OCR processor
-                if self.ocr_processor is None:
-                    # Lazy initialization: create OCR-enabled processor once
-                    from copy import deepcopy
-                    ocr_config = deepcopy(self.config)
-                    ocr_config.do_ocr = True
-                    self.ocr_processor = DocumentProcessor(ocr_config)
-                    logger.info("🔧 Created cached OCR processor for scanned PDFs")
-                processor = self.ocr_processor
-            else:
-                # Use default processor
-                processor = self.processor
-
-            # Use DocumentProcessor to get Docling result
-            text, extraction_method = processor.extract_text(file_path, file_type)
-
-            if extraction_method == "failed" or not text.strip():
+                    logger.info("🔍 OCR auto-detected for scanned PDF: %s", file_path.name)
+
+            # Need OCR but the default processor doesn't have it - use the OCR processor
+            processor = get_processor(needs_ocr and not self.config.do_ocr)
+
+            # One Docling conversion yields both markdown and plain text
+            markdown, plain_text, extraction_method = processor.extract_both(file_path, file_type)
+
+            if extraction_method == "failed" or not markdown or markdown.isspace():
                 # Return empty strings instead of error flags
                 return ExtractedDocument(
                     markdown="",
                     plain_text="",
                     metadata={
-                        "file_path": str(file_path),
+                        "file_path": path_str,
                         "file_type": file_type,
                         "extraction_method": "failed",
                         "needs_ocr": needs_ocr,
@@ -134,22 +199,11 @@ class DoclingDocumentExtractor:
                     }
                 )
 
-            # For Docling extractions, get both markdown and plain text
-            if extraction_method == "docling":
-                # Re-run Docling to get both formats (use appropriate processor)
-                result = processor.converter.convert(file_path)
-                markdown = result.document.export_to_markdown()
-                plain_text = result.document.export_to_text()
-            else:
-                # For non-Docling extractions (email, etc.), text is plain text
-                markdown = text  # Use same content for both
-                plain_text = text
-
             return ExtractedDocument(
                 markdown=markdown,
                 plain_text=plain_text,
                 metadata={
-                    "file_path": str(file_path),
+                    "file_path": path_str,
                     "file_type": file_type,
                     "extraction_method": extraction_method,
                     "needs_ocr": needs_ocr,
@@ -163,14 +217,14 @@ class DoclingDocumentExtractor:
             )
 
         except Exception as e:
-            logger.error(f"❌ DoclingDocumentExtractor failed for {file_path.name}: {e}")
+            logger.error("❌ DoclingDocumentExtractor failed for %s: %s", file_path.name, e)
             # Return empty strings on exception
             return ExtractedDocument(
                 markdown="",
                 plain_text="",
                 metadata={
-                    "file_path": str(file_path),
-                    "file_type": file_path.suffix.lstrip('.'),
+                    "file_path": path_str,
+                    "file_type": file_type,
                     "extraction_method": "failed",
                     "needs_ocr": locals().get('needs_ocr', self.config.do_ocr),
                     "ocr_auto_detected": locals().get('ocr_auto_detected', False),
@@ -2,7 +2,10 @@
 Core Document Processing Module - Docling Integration with Configurable Options
 """
 
+import importlib
 import logging
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Tuple, Optional
 from docling.document_converter import DocumentConverter, FormatOption
@@ -14,22 +17,91 @@ from docling.datamodel.pipeline_options import (
     TableFormerMode
 )
 from docling.datamodel.base_models import InputFormat
-from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
-from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
-from docling.backend.msword_backend import MsWordDocumentBackend
-from docling.backend.mspowerpoint_backend import MsPowerpointDocumentBackend
-from docling.backend.html_backend import HTMLDocumentBackend
 from docling.pipeline.simple_pipeline import SimplePipeline
-try:
-    from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
-except ImportError:  # pragma: no cover
-    StandardPdfPipeline = None  # type: ignore
-import extract_msg
 
 from .config import DoclingConfig, load_config
 
 logger = logging.getLogger(__name__)
 
+# Docling backends and pipelines pull in heavy parser/ML dependencies, so they
+# are imported on first use rather than when this module is loaded
+_LAZY_IMPORTS = {
+    "DoclingParseV2DocumentBackend": "docling.backend.docling_parse_v2_backend",
+    "DoclingParseV4DocumentBackend": "docling.backend.docling_parse_v4_backend",
+    "MsWordDocumentBackend": "docling.backend.msword_backend",
+    "MsPowerpointDocumentBackend": "docling.backend.mspowerpoint_backend",
+    "HTMLDocumentBackend": "docling.backend.html_backend",
+    "StandardPdfPipeline": "docling.pipeline.standard_pdf_pipeline",
+}
+_BACKEND_CACHE: dict[str, type] = {}
+
+# File types converted by Docling vs. read as email (.txt is read directly)
+_DOCLING_FORMATS = frozenset({'pdf', 'docx', 'pptx', 'html'})
+_EMAIL_FORMATS = frozenset({'eml', 'msg'})
+_SUPPORTED_TYPES = ('pdf', 'docx', 'txt', 'pptx', 'html', 'eml', 'msg')
+
+
+def _lazy_import(name: str) -> type:
+    """Import a Docling backend/pipeline class by name, caching the result"""
+    cls = _BACKEND_CACHE.get(name)
+    if cls is None:
+        cls = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        _BACKEND_CACHE[name] = cls
+    return cls
+
+
+@lru_cache(maxsize=8)
+def _non_pdf_format_options(
+    accelerator_device: str,
+    accelerator_threads: int,
+    artifacts_path: Optional[str],
+    document_timeout: int
+) -> dict:
+    """DOCX/PPTX/HTML format options, shared by every processor with these settings"""
+    # Non-PDF formats continue using ConvertPipelineOptions
+    pipeline_options = ConvertPipelineOptions(
+        accelerator_options=AcceleratorOptions(device=accelerator_device, num_threads=accelerator_threads),
+        artifacts_path=artifacts_path,
+        document_timeout=document_timeout
+    )
+    return {
+        # Word documents
+        InputFormat.DOCX: FormatOption(
+            pipeline_options=pipeline_options,
+            backend=_lazy_import("MsWordDocumentBackend"),
+            pipeline_cls=SimplePipeline
+        ),
+        # PowerPoint documents
+        InputFormat.PPTX: FormatOption(
+            pipeline_options=pipeline_options,
+            backend=_lazy_import("MsPowerpointDocumentBackend"),
+            pipeline_cls=SimplePipeline
+        ),
+        # HTML documents
+        InputFormat.HTML: FormatOption(
+            pipeline_options=pipeline_options,
+            backend=_lazy_import("HTMLDocumentBackend"),
+            pipeline_cls=SimplePipeline
+        ),
+    }
+
+
+@lru_cache(maxsize=1)
+def _validate_tessdata() -> Optional[str]:
+    """Read TESSDATA_PREFIX once per process, warning once if it is missing"""
+    tessdata = os.getenv("TESSDATA_PREFIX")
+    if not tessdata:
+        logger.warning("⚠️ TESSDATA_PREFIX not set - Tesseract OCR may fail. "
+                       "Set it to your Tesseract language data directory.")
+    return tessdata
+
+
+def _fast_strip(text: str) -> str:
+    """str.strip() that returns the string itself when neither end is whitespace"""
+    if text and not text[0].isspace() and not text[-1].isspace():
+        return text
+    return text.strip()
+
 
 class DocumentProcessor:
     """Handles document text extraction using Docling with configurable options"""
@@ -46,6 +118,41 @@ class DocumentProcessor:
 
         self.config = config
 
+    @cached_property
+    def _ocr_options(self):
+        """OCR options for the configured engine, or None when OCR is disabled"""
+        config = self.config
+        if not config.do_ocr:
+            return None
+
+        if config.ocr_engine == "tesseract":
+            from docling.datamodel.pipeline_options import TesseractOcrOptions
+            tessdata = _validate_tessdata()
+            logger.info("✅ Using Tesseract OCR (TESSDATA_PREFIX: %s)", tessdata or 'NOT SET')
+            return TesseractOcrOptions()
+        elif config.ocr_engine == "ocrmac":
+            from docling.datamodel.pipeline_options import OcrMacOptions
+            logger.info("✅ Using OCRmac (macOS Vision Framework)")
+            return OcrMacOptions()
+        elif config.ocr_engine == "rapidocr":
+            from docling.datamodel.pipeline_options import RapidOcrOptions
+            logger.info("✅ Using RapidOCR (lightweight)")
+            return RapidOcrOptions()
+        else:  # easyocr (fallback)
+            from docling.datamodel.pipeline_options import EasyOcrOptions
+            logger.info("✅ Using EasyOCR (PyTorch-based)")
+            return EasyOcrOptions()
+
+    @cached_property
+    def converter(self) -> DocumentConverter:
+        """
+        Docling converter built from the config on first use
+
+        Building it loads the backends and OCR engine, so processors that only
+        answer get_supported_types() never pay for it.
+        """
+        config = self.config
+
         # Build accelerator options
         accelerator_options = AcceleratorOptions(
             device=config.accelerator_device,
@@ -59,31 +166,7 @@ class DocumentProcessor:
             do_cell_matching=config.do_cell_matching
         )
 
-        # Build OCR options based on configured engine
-        ocr_options = None
-        if config.do_ocr:
-            if config.ocr_engine == "tesseract":
-                from docling.datamodel.pipeline_options import TesseractOcrOptions
-                # Validate TESSDATA_PREFIX for Tesseract
-                import os
-                tessdata = os.getenv("TESSDATA_PREFIX")
-                if not tessdata:
-                    logger.warning("⚠️ TESSDATA_PREFIX not set - Tesseract OCR may fail. "
-                                   "Set it to your Tesseract language data directory.")
-                ocr_options = TesseractOcrOptions()
-                logger.info(f"✅ Using Tesseract OCR (TESSDATA_PREFIX: {tessdata or 'NOT SET'})")
-            elif config.ocr_engine == "ocrmac":
-                from docling.datamodel.pipeline_options import OcrMacOptions
-                ocr_options = OcrMacOptions()
-                logger.info("✅ Using OCRmac (macOS Vision Framework)")
-            elif config.ocr_engine == "rapidocr":
-                from docling.datamodel.pipeline_options import RapidOcrOptions
-                ocr_options = RapidOcrOptions()
-                logger.info("✅ Using RapidOCR (lightweight)")
-            else:  # easyocr (fallback)
-                from docling.datamodel.pipeline_options import EasyOcrOptions
-                ocr_options = EasyOcrOptions()
-                logger.info("✅ Using EasyOCR (PyTorch-based)")
+        ocr_options = self._ocr_options
 
         # Build format options for each supported document type with appropriate backends
         format_options = {}
@@ -91,7 +174,7 @@ class DocumentProcessor:
         # PDF format with configurable backend and pipeline
         if config.backend == "v2":
             # Parse V2: Use ConvertPipelineOptions + SimplePipeline
-            pdf_backend = DoclingParseV2DocumentBackend
+            pdf_backend = _lazy_import("DoclingParseV2DocumentBackend")
             pdf_pipeline = SimplePipeline
             pdf_pipeline_options = ConvertPipelineOptions(
                 accelerator_options=accelerator_options,
@@ -101,12 +184,13 @@ class DocumentProcessor:
             logger.info("✅ Using Docling Parse V2 backend with SimplePipeline for PDF")
         else:
             # Parse V4: Use PdfPipelineOptions + StandardPdfPipeline
-            pdf_backend = DoclingParseV4DocumentBackend  # Default modern backend
-            if StandardPdfPipeline is None:
+            pdf_backend = _lazy_import("DoclingParseV4DocumentBackend")  # Default modern backend
+            try:
+                pdf_pipeline = _lazy_import("StandardPdfPipeline")
+            except ImportError as e:
                 raise ImportError(
                     "Docling Parse V4 backend requires docling.pipeline.standard_pdf_pipeline."
-                )
-            pdf_pipeline = StandardPdfPipeline
+                ) from e
             # Construct PdfPipelineOptions; avoid passing ocr_options when OCR is disabled
             kwargs = dict(
                 # Base options
@@ -139,40 +223,21 @@ class DocumentProcessor:
             pipeline_cls=pdf_pipeline
         )
 
-        # Non-PDF formats continue using ConvertPipelineOptions
-        non_pdf_pipeline_options = ConvertPipelineOptions(
-            accelerator_options=accelerator_options,
-            artifacts_path=config.artifacts_path,
-            document_timeout=config.document_timeout
-        )
-
-        # Word documents
-        format_options[InputFormat.DOCX] = FormatOption(
-            pipeline_options=non_pdf_pipeline_options,
-            backend=MsWordDocumentBackend,
-            pipeline_cls=SimplePipeline
-        )
-
-        # PowerPoint documents
-        format_options[InputFormat.PPTX] = FormatOption(
-            pipeline_options=non_pdf_pipeline_options,
-            backend=MsPowerpointDocumentBackend,
-            pipeline_cls=SimplePipeline
-        )
-
-        # HTML documents
-        format_options[InputFormat.HTML] = FormatOption(
-            pipeline_options=non_pdf_pipeline_options,
-            backend=HTMLDocumentBackend,
-            pipeline_cls=SimplePipeline
-        )
+        # Non-PDF formats only depend on accelerator/artifacts/timeout settings
+        format_options.update(_non_pdf_format_options(
+            config.accelerator_device,
+            config.accelerator_threads,
+            config.artifacts_path,
+            config.document_timeout
+        ))
 
         # Initialize DocumentConverter with full configuration
-        self.converter = DocumentConverter(format_options=format_options)
+        converter = DocumentConverter(format_options=format_options)
 
-        logger.info(f"✅ DocumentProcessor initialized with config: OCR={config.do_ocr}, "
-                   f"Table={config.table_mode}, Device={config.accelerator_device}, "
-                   f"Backend={config.backend}, Timeout={config.document_timeout}s")
+        logger.info("✅ Docling converter built with config: OCR=%s, Table=%s, Device=%s, Backend=%s, Timeout=%ss",
+                    config.do_ocr, config.table_mode, config.accelerator_device,
+                    config.backend, config.document_timeout)
+        return converter
 
     def extract_text(self, file_path: Path, file_type: str) -> Tuple[str, str]:
         """
@@ -185,34 +250,65 @@ class DocumentProcessor:
         Returns:
             Tuple of (extracted_text, extraction_method)
         """
+        markdown, _, extraction_method = self.extract_both(file_path, file_type)
+        return markdown, extraction_method
+
+    def extract_both(self, file_path: Path, file_type: str) -> Tuple[str, str, str]:
+        """
+        Extract markdown and plain text from a single Docling conversion
+
+        Args:
+            file_path: Path to the document
+            file_type: File extension without dot
+
+        Returns:
+            Tuple of (markdown, plain_text, extraction_method); for email files
+            markdown and plain_text are the same text
+        """
         try:
-            text = ""
+            markdown = plain_text = ""
             extraction_method = "failed"
 
-            if file_type in ['pdf', 'docx', 'txt', 'pptx', 'html']:
+            if file_type == 'txt':
+                # Plain text has no structure to recover; skip the converter entirely
+                markdown = plain_text = _fast_strip(
+                    Path(file_path).read_text(encoding='utf-8', errors='ignore')
+                )
+                extraction_method = "raw_text"
+
+            elif file_type in _DOCLING_FORMATS:
                 # PURE DOCLING PROCESSING - NO FALLBACKS
                 result = self.converter.convert(file_path)
-                text = result.document.export_to_markdown()
+                markdown = _fast_strip(result.document.export_to_markdown())
+                plain_text = _fast_strip(result.document.export_to_text())
                 extraction_method = "docling"
-                logger.info(f"✅ DOCLING SUCCESS: {file_path.name}")
+                logger.info("✅ DOCLING SUCCESS: %s", file_path.name)
 
-            elif file_type in ['eml', 'msg']:
+            elif file_type in _EMAIL_FORMATS:
                 # Only email files use extract_msg
                 if file_type == 'msg':
-                    msg = extract_msg.openMsg(file_path)
-                    text = f"Subject: {msg.subject}\nFrom: {msg.sender}\nDate: {msg.date}\n\n{msg.body}"
+                    import extract_msg
+                    # Context manager releases the OLE file handle deterministically
+                    with extract_msg.openMsg(file_path) as msg:
+                        markdown = "".join((
+                            "Subject: ", str(msg.subject or ""),
+                            "\nFrom: ", str(msg.sender or ""),
+                            "\nDate: ", str(msg.date or ""),
+                            "\n\n", msg.body or "",
+                        ))
                     extraction_method = "extract_msg"
                 else:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        text = f.read()
+                    markdown = Path(file_path).read_text(encoding='utf-8', errors='ignore')
                     extraction_method = "raw_text"
+                markdown = plain_text = _fast_strip(markdown)
 
-            return text.strip(), extraction_method
+            # Every branch strips its own output with _fast_strip (a no-op on trimmed text)
+            return markdown, plain_text, extraction_method
 
         except Exception as e:
-            logger.error(f"❌ DOCLING FAILED: {file_path.name} - {str(e)}")
-            return "", "failed"
+            logger.error("❌ DOCLING FAILED: %s - %s", file_path.name, e)
+            return "", "", "failed"
 
     def get_supported_types(self) -> list[str]:
         """Get list of supported file types"""
-        return ['pdf', 'docx', 'txt', 'pptx', 'html', 'eml', 'msg']
+        return list(_SUPPORTED_TYPES)
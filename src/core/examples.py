@@ -6,12 +6,13 @@ Centralized example definitions to improve maintainability and configurability
 import logging
 from typing import List, Optional
 
+# Examples only use the data classes (this still runs langextract/__init__.py)
 try:
-    import langextract as lx
+    from langextract import data as lx_data
     LANGEXTRACT_AVAILABLE = True
 except ImportError:
     LANGEXTRACT_AVAILABLE = False
-    lx = None
+    lx_data = None
 
 logger = logging.getLogger(__name__)
 
@@ -29,10 +30,10 @@ def create_legal_events_examples() -> List:
 
     try:
         examples = [
-            lx.data.ExampleData(
+            lx_data.ExampleData(
                 text="On January 15, 2024, the plaintiff filed a motion to dismiss pursuant to Rule 12(b)(6) of the Federal Rules of Civil Procedure.",
                 extractions=[
-                    lx.data.Extraction(
+                    lx_data.Extraction(
                         extraction_class="legal_filing",
                         extraction_text="Plaintiff filed motion to dismiss on January 15, 2024",
                         attributes={
@@ -44,10 +45,10 @@ def create_legal_events_examples() -> List:
                     )
                 ]
             ),
-            lx.data.ExampleData(
+            lx_data.ExampleData(
                 text="The contract executed on March 3, 2023, between ABC Corp and XYZ LLC, with an effective date of April 1, 2023, terminates on March 31, 2025.",
                 extractions=[
-                    lx.data.Extraction(
+                    lx_data.Extraction(
                         extraction_class="contract_execution",
                         extraction_text="Contract execution between ABC Corp and XYZ LLC on March 3, 2023",
                         attributes={
@@ -59,10 +60,10 @@ def create_legal_events_examples() -> List:
                     )
                 ]
             ),
-            lx.data.ExampleData(
+            lx_data.ExampleData(
                 text="Court hearing scheduled for discovery disputes on February 10, 2024 at 2:00 PM pursuant to Local Rule 37.1.",
                 extractions=[
-                    lx.data.Extraction(
+                    lx_data.Extraction(
                         extraction_class="court_hearing",
                         extraction_text="Court hearing scheduled for discovery disputes on February 10, 2024 at 2:00 PM",
                         attributes={
@@ -3,7 +3,9 @@ Extractor Factory - Creates document and event extractors based on configuration
 Supports environment variable overrides for different implementations
 """
 
+import importlib
 import logging
+from dataclasses import replace
 from typing import Tuple, Callable, Dict, Any, Optional
 
 from .interfaces import DocumentExtractor, EventExtractor
@@ -12,16 +14,37 @@ from .config import (
     OpenRouterConfig, OpenCodeZenConfig, OpenAIConfig, AnthropicConfig, DeepSeekConfig,
     load_config, load_provider_config
 )
-from .docling_adapter import DoclingDocumentExtractor
-from .langextract_adapter import LangExtractEventExtractor
-from .openrouter_adapter import OpenRouterEventExtractor
-from .opencode_zen_adapter import OpenCodeZenEventExtractor
-from .openai_adapter import OpenAIEventExtractor
-from .anthropic_adapter import AnthropicEventExtractor
-from .deepseek_adapter import DeepSeekEventExtractor
 
 logger = logging.getLogger(__name__)
 
+# Adapter classes are imported on first use so only the selected provider's SDK
+# is loaded. Each resolved class is cached as a module global, which is also
+# what tests monkeypatch.
+_ADAPTER_MODULES = {
+    "DoclingDocumentExtractor": ".docling_adapter",
+    "LangExtractEventExtractor": ".langextract_adapter",
+    "OpenRouterEventExtractor": ".openrouter_adapter",
+    "OpenCodeZenEventExtractor": ".opencode_zen_adapter",
+    "OpenAIEventExtractor": ".openai_adapter",
+    "AnthropicEventExtractor": ".anthropic_adapter",
+    "DeepSeekEventExtractor": ".deepseek_adapter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an adapter class the first time it is looked up on this module"""
+    module_name = _ADAPTER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    adapter_cls = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = adapter_cls
+    return adapter_cls
+
+
+def _adapter(name: str) -> Any:
+    """Resolve an adapter class, importing its module at most once"""
+    return globals().get(name) or __getattr__(name)
+
 
 class ExtractorConfigurationError(ValueError):
     """Raised when extractor provider configuration is invalid."""
@@ -33,7 +56,7 @@ def _create_langextract_event_extractor(
     _extractor_config: ExtractorConfig
 ) -> EventExtractor:
     """Factory for the default LangExtract adapter."""
-    return LangExtractEventExtractor(event_config)
+    return _adapter("LangExtractEventExtractor")(event_config)
 
 
 def _create_openrouter_event_extractor(
@@ -42,7 +65,7 @@ def _create_openrouter_event_extractor(
     _extractor_config: ExtractorConfig
 ) -> EventExtractor:
     """Factory for the OpenRouter adapter."""
-    return OpenRouterEventExtractor(event_config)
+    return _adapter("OpenRouterEventExtractor")(event_config)
 
 
 def _create_opencode_zen_event_extractor(
@@ -51,7 +74,7 @@ def _create_opencode_zen_event_extractor(
     _extractor_config: ExtractorConfig
 ) -> EventExtractor:
     """Factory for the OpenCode Zen adapter."""
-    return OpenCodeZenEventExtractor(event_config)
+    return _adapter("OpenCodeZenEventExtractor")(event_config)
 
 
 def _create_openai_event_extractor(
@@ -60,7 +83,7 @@ def _create_openai_event_extractor(
     _extractor_config: ExtractorConfig
 ) -> EventExtractor:
     """Factory for the OpenAI adapter."""
-    return OpenAIEventExtractor(event_config)
+    return _adapter("OpenAIEventExtractor")(event_config)
 
 
 def _create_anthropic_event_extractor(
@@ -69,7 +92,7 @@ def _create_anthropic_event_extractor(
     _extractor_config: ExtractorConfig
 ) -> EventExtractor:
     """Factory for the Anthropic adapter."""
-    return AnthropicEventExtractor(event_config)
+    return _adapter("AnthropicEventExtractor")(event_config)
 
 
 def _create_deepseek_event_extractor(
@@ -78,7 +101,7 @@ def _create_deepseek_event_extractor(
     _extractor_config: ExtractorConfig
 ) -> EventExtractor:
     """Factory for the DeepSeek adapter."""
-    return DeepSeekEventExtractor(event_config)
+    return _adapter("DeepSeekEventExtractor")(event_config)
 
 
 EVENT_PROVIDER_REGISTRY: Dict[str, Callable[[DoclingConfig, Any, ExtractorConfig], EventExtractor]] = {
@@ -119,7 +142,7 @@ def build_extractors(
 
     # Create document extractor
     if doc_extractor_type == "docling":
-        doc_extractor = DoclingDocumentExtractor(docling_config)
+        doc_extractor = _adapter("DoclingDocumentExtractor")(docling_config)
         logger.info("✅ Created DoclingDocumentExtractor")
     else:
         raise ValueError(f"Unsupported document extractor type: {doc_extractor_type}")
@@ -151,7 +174,7 @@ def create_default_extractors(
     docling_config, _, extractor_config = load_config()
 
     if event_extractor_override:
-        extractor_config.event_extractor = event_extractor_override
+        extractor_config = replace(extractor_config, event_extractor=event_extractor_override)
 
     # Load provider-specific configuration based on the event extractor type
     docling_config, event_config, extractor_config = load_provider_config(
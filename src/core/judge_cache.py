@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+On-Disk Judge Response Cache
+
+Judge validation scripts are re-run against the same benchmark fixtures, so
+re-grading identical provider outputs costs time and money for the same
+verdict. Judge responses are stored as JSON files under
+JUDGE_CACHE_DIR/{namespace}/{judge_model}/{key}.json, keyed by a hash of the
+document, its provider outputs, the judge prompt template and RUBRIC_VERSION.
+Each caller (LLMJudge, JudgePanel) stores a different payload shape, so each
+writes under its own namespace.
+
+Caching is opt-in (JUDGE_CACHE=1 or the scripts' --use-judge-cache flag).
+Edits to a judge prompt template change its fingerprint and so miss old
+entries on their own; bump RUBRIC_VERSION for changes the template does not
+capture (system prompts, result parsing).
+
+The same hashing also finds providers that returned identical events for a
+document, so only one of them needs to be sent to the judges.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import env_bool, env_str
+
+logger = logging.getLogger(__name__)
+
+# Bump when the scoring rubric or judge prompts change to invalidate old entries
+RUBRIC_VERSION = 1
+
+DEFAULT_CACHE_DIR = "output/judge_cache"
+
+
+def judge_cache_enabled() -> bool:
+    """Whether JUDGE_CACHE asks for cached judge responses"""
+    return env_bool("JUDGE_CACHE", False)
+
+
+def prompt_fingerprint(*parts: str) -> str:
+    """Short digest of the prompt text a judge is built from, for cache_key()"""
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:16]
+
+
+def cache_key(
+    document_name: str,
+    provider_outputs: Dict[str, List[Dict[str, Any]]],
+    prompt_version: str = "",
+    rubric_version: int = RUBRIC_VERSION
+) -> str:
+    """
+    Stable key for one judging request
+
+    Every provider of a document is scored in the same request, so the key
+    covers the whole provider-to-events mapping rather than a single provider.
+    prompt_version is the judge's prompt_fingerprint(), so prompt edits miss
+    entries written with the old wording.
+    """
+    blob = json.dumps(
+        {
+            "document": document_name,
+            "providers": provider_outputs,
+            "prompt_version": prompt_version,
+            "rubric_version": rubric_version
+        },
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+def dedupe_provider_outputs(
+    provider_outputs: Dict[str, List[Dict[str, Any]]]
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, List[str]]]:
+    """
+    Keep one provider per group of identical event lists
+
+    Returns:
+        (outputs to judge, mapping of each kept provider to the providers it stands in for)
+    """
+    representatives: Dict[str, str] = {}
+    unique_outputs: Dict[str, List[Dict[str, Any]]] = {}
+    duplicates: Dict[str, List[str]] = {}
+
+    for provider, events in provider_outputs.items():
+        digest = hashlib.sha256(json.dumps(events, sort_keys=True, default=str).encode()).hexdigest()
+        representative = representatives.setdefault(digest, provider)
+        if representative == provider:
+            unique_outputs[provider] = events
+        else:
+            duplicates.setdefault(representative, []).append(provider)
+
+    for representative, others in duplicates.items():
+        logger.info(f"🔁 Deduped {[representative, *others]} → 1 judge call")
+
+    return unique_outputs, duplicates
+
+
+def expand_duplicate_scores(scores: List[Any], duplicates: Dict[str, List[str]]) -> List[Any]:
+    """Copy each kept provider's score dataclass to the providers it stands in for"""
+    expanded = list(scores)
+    for score in scores:
+        for provider in duplicates.get(score.provider, []):
+            expanded.append(replace(score, provider=provider))
+    return expanded
+
+
+class JudgeCache:
+    """JSON-file cache of parsed judge responses, one directory per caller and judge model"""
+
+    def __init__(self, cache_dir: str | Path | None = None):
+        """
+        Args:
+            cache_dir: Cache root (defaults to JUDGE_CACHE_DIR env var, else output/judge_cache)
+        """
+        self.cache_dir = Path(cache_dir or env_str("JUDGE_CACHE_DIR", DEFAULT_CACHE_DIR))
+
+    def _path(self, namespace: str, model: str, key: str) -> Path:
+        return self.cache_dir / namespace / model.replace("/", "_") / f"{key}.json"
+
+    def get(self, namespace: str, model: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload, or None on a miss or unreadable entry"""
+        path = self._path(namespace, model, key)
+        try:
+            payload = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable judge cache entry {path}: {e}")
+            return None
+
+        logger.info(f"Judge cache hit: {namespace}/{model}/{key}")
+        return payload
+
+    def put(self, namespace: str, model: str, key: str, payload: Dict[str, Any]) -> None:
+        """Store a payload; write failures are logged, never raised"""
+        path = self._path(namespace, model, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload, indent=2))
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write judge cache entry {path}: {e}")
@@ -7,21 +7,54 @@ consensus evaluation with inter-judge agreement analysis.
 """
 
 import os
+import asyncio
 import logging
 import statistics
 from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass, asdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
 import json
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    # HTTP/2 needs the h2 extra (pip install "httpx[http2]"), not just httpx
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from .judges.gpt5_judge import GPT5Judge
 from .judges.claude_opus_judge import ClaudeOpusJudge
 from .judges.gemini_pro_judge import GeminiProJudge
-from .judges.base_judge import JudgeResult, ProviderScore
+from .judges.base_judge import BaseJudge, JudgeResult, ProviderScore
+from .judge_cache import JudgeCache, cache_key, judge_cache_enabled, prompt_fingerprint
 
 logger = logging.getLogger(__name__)
 
+# Bump when consensus or agreement logic changes so saved panel results are not reused
+JUDGE_PANEL_VERSION = "1"
+
 
 @dataclass
 class ConsensusScore:
@@ -81,11 +114,15 @@ class JudgePanel:
     Provides consensus scores and inter-judge agreement analysis.
     """
 
+    # Cache directory for this class's asdict(JudgeResult) entries
+    CACHE_NAMESPACE = "panel"
+
     def __init__(
         self,
         gpt5_api_key: str | None = None,
         claude_api_key: str | None = None,
-        gemini_api_key: str | None = None
+        gemini_api_key: str | None = None,
+        cache: JudgeCache | None = None
     ):
         """
         Initialize 3-judge panel
@@ -94,10 +131,15 @@ class JudgePanel:
             gpt5_api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
             claude_api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
             gemini_api_key: Google AI API key (defaults to GEMINI_API_KEY env var)
+            cache: Judge response cache for re-runs (defaults to one when JUDGE_CACHE=1)
         """
         self.gpt5_api_key = gpt5_api_key or os.getenv("OPENAI_API_KEY")
         self.claude_api_key = claude_api_key or os.getenv("ANTHROPIC_API_KEY")
         self.gemini_api_key = gemini_api_key or os.getenv("GEMINI_API_KEY")
+        self.cache = cache if cache is not None else (JudgeCache() if judge_cache_enabled() else None)
+
+        # Connection pool shared by the async judges, created on first async use
+        self._http = None
 
         # Initialize judges
         self.judges: List[BaseJudge] = []
@@ -158,6 +200,39 @@ class JudgePanel:
         # Run judges in parallel
         individual_results = self._run_judges_parallel(document_name, provider_outputs)
 
+        return self._build_panel_result(document_name, provider_outputs, individual_results)
+
+    async def judge_document_async(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]]
+    ) -> PanelResult:
+        """
+        Async variant of judge_document() that awaits all judges concurrently.
+
+        Judges use their providers' async SDK clients, so panel latency is the
+        slowest judge rather than the sum; no worker threads are needed.
+
+        Judges whose SDK accepts one share a single httpx connection pool.
+        Await aclose() before the event loop exits.
+        """
+        logger.info(f"\n{'='*70}")
+        logger.info(f"🎯 3-JUDGE PANEL EVALUATION: {document_name}")
+        logger.info(f"{'='*70}")
+        logger.info(f"Judges: {[j.__class__.__name__ for j in self.judges]}")
+        logger.info(f"Providers to evaluate: {list(provider_outputs.keys())}")
+
+        individual_results = await self._run_judges_async(document_name, provider_outputs)
+
+        return self._build_panel_result(document_name, provider_outputs, individual_results)
+
+    def _build_panel_result(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        individual_results: Dict[str, JudgeResult]
+    ) -> PanelResult:
+        """Compute consensus and agreement from the individual judge results"""
         # Calculate consensus scores
         consensus_scores = self._calculate_consensus_scores(individual_results, provider_outputs)
 
@@ -196,12 +271,14 @@ class JudgePanel:
         provider_outputs: Dict[str, List[Dict[str, Any]]]
     ) -> Dict[str, JudgeResult]:
         """Run all judges in parallel using ThreadPoolExecutor"""
-        results = {}
+        results, pending = self._load_cached_results(document_name, provider_outputs)
+        if not pending:
+            return results
 
-        with ThreadPoolExecutor(max_workers=len(self.judges)) as executor:
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
             futures = {
                 executor.submit(judge.judge_providers, document_name, provider_outputs): judge
-                for judge in self.judges
+                for judge in pending
             }
 
             for future in as_completed(futures):
@@ -209,12 +286,112 @@ class JudgePanel:
                 try:
                     result = future.result()
                     results[result.judge_name] = result
+                    self._cache_result(judge, document_name, provider_outputs, result)
                     logger.info(f"✅ {result.judge_name} completed - winner: {result.winner}")
                 except Exception as e:
                     logger.error(f"❌ {judge.__class__.__name__} failed: {e}")
 
         return results
 
+    async def _run_judges_async(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, JudgeResult]:
+        """Run all judges concurrently with asyncio.gather, skipping failed judges"""
+        results, pending = self._load_cached_results(document_name, provider_outputs)
+
+        http_client = self._shared_http_client()
+        outcomes = await asyncio.gather(
+            *(judge.ajudge_providers(document_name, provider_outputs, http_client) for judge in pending),
+            return_exceptions=True
+        )
+
+        for judge, outcome in zip(pending, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"❌ {judge.__class__.__name__} failed: {outcome}")
+                continue
+            results[outcome.judge_name] = outcome
+            self._cache_result(judge, document_name, provider_outputs, outcome)
+            logger.info(f"✅ {outcome.judge_name} completed - winner: {outcome.winner}")
+
+        return results
+
+    def _shared_http_client(self):
+        """
+        One keep-alive pool (HTTP/2 when h2 is installed) for every async judge
+
+        Saves a TCP+TLS handshake per judge call. Returns None without httpx,
+        in which case each judge opens its own connection as before.
+        """
+        if self._http is None and HTTPX_AVAILABLE:
+            self._http = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                # Deep-thinking judges can take minutes; match the SDKs' own default
+                timeout=httpx.Timeout(600.0, connect=5.0),
+                limits=httpx.Limits(max_keepalive_connections=32)
+            )
+        return self._http
+
+    async def aclose(self):
+        """Close the shared connection pool (a later run opens a fresh one)"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    @staticmethod
+    def _cache_key(judge: BaseJudge, document_name: str, provider_outputs: Dict[str, List[Dict[str, Any]]]) -> str:
+        """Cache key for one judge, covering that judge's prompt template"""
+        return cache_key(document_name, provider_outputs, prompt_fingerprint(judge._build_judge_prompt("", {})))
+
+    def _load_cached_results(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]]
+    ) -> Tuple[Dict[str, JudgeResult], List[BaseJudge]]:
+        """
+        Split judges into cached results and judges that still need an API call
+
+        Cached results report zero cost and thinking tokens, since nothing was
+        spent on this run.
+        """
+        if self.cache is None:
+            return {}, list(self.judges)
+
+        results = {}
+        pending = []
+        for judge in self.judges:
+            entry = self.cache.get(self.CACHE_NAMESPACE, judge.model, self._cache_key(judge, document_name, provider_outputs))
+            if entry is None:
+                pending.append(judge)
+                continue
+
+            result = JudgeResult(
+                **{
+                    **entry,
+                    "provider_scores": [ProviderScore(**score) for score in entry["provider_scores"]],
+                    "cost": 0.0,
+                    "thinking_tokens": 0
+                }
+            )
+            results[result.judge_name] = result
+            logger.info(f"✅ {result.judge_name} cached - winner: {result.winner}")
+
+        return results, pending
+
+    def _cache_result(
+        self,
+        judge: BaseJudge,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        result: JudgeResult
+    ):
+        """Store a fresh judge result in the response cache"""
+        if self.cache is not None:
+            self.cache.put(
+                self.CACHE_NAMESPACE, judge.model, self._cache_key(judge, document_name, provider_outputs), asdict(result)
+            )
+
     def _calculate_consensus_scores(
         self,
         individual_results: Dict[str, JudgeResult],
@@ -283,22 +460,31 @@ class JudgePanel:
     ) -> InterJudgeAgreement:
         """Calculate inter-judge agreement metrics"""
 
-        # Calculate pairwise Pearson correlations
+        # Calculate pairwise Pearson correlations of overall_quality scores
         judge_names = list(individual_results.keys())
+        judge_scores = [
+            [s.overall_quality for s in individual_results[name].provider_scores]
+            for name in judge_names
+        ]
         correlations = {}
 
-        for i in range(len(judge_names)):
-            for j in range(i + 1, len(judge_names)):
-                judge1 = judge_names[i]
-                judge2 = judge_names[j]
-
-                # Collect overall_quality scores for correlation
-                scores1 = [s.overall_quality for s in individual_results[judge1].provider_scores]
-                scores2 = [s.overall_quality for s in individual_results[judge2].provider_scores]
+        if len(judge_names) > 1 and len({len(scores) for scores in judge_scores}) == 1 and len(judge_scores[0]) > 1:
+            # Every judge scored the same number of providers: one corrcoef call
+            # yields the whole matrix; constant score rows correlate as 0.0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                matrix = np.corrcoef(np.array(judge_scores, dtype=np.float64))
+            matrix = np.nan_to_num(matrix, nan=0.0)
+            for i, j in zip(*np.triu_indices_from(matrix, k=1)):
+                correlations[f"{judge_names[i]}_vs_{judge_names[j]}"] = float(matrix[i, j])
+        else:
+            for i in range(len(judge_names)):
+                for j in range(i + 1, len(judge_names)):
+                    scores1 = judge_scores[i]
+                    scores2 = judge_scores[j]
 
-                if len(scores1) == len(scores2) and len(scores1) > 1:
-                    corr = self._pearson_correlation(scores1, scores2)
-                    correlations[f"{judge1}_vs_{judge2}"] = corr
+                    if len(scores1) == len(scores2) and len(scores1) > 1:
+                        corr = self._pearson_correlation(scores1, scores2)
+                        correlations[f"{judge_names[i]}_vs_{judge_names[j]}"] = corr
 
         average_correlation = statistics.mean(correlations.values()) if correlations else 0.0
 
@@ -355,6 +541,9 @@ class JudgePanel:
 
     def _log_panel_summary(self, result: PanelResult):
         """Log comprehensive panel evaluation summary"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         logger.info(f"\n{'='*70}")
         logger.info(f"📊 PANEL EVALUATION SUMMARY: {result.document_name}")
         logger.info(f"{'='*70}")
@@ -378,8 +567,19 @@ class JudgePanel:
 
         logger.info(f"\n{'='*70}\n")
 
-    def save_results(self, result: PanelResult, output_path: str):
-        """Save panel results to JSON file"""
+    def save_results(self, result: PanelResult, output_path: str, compress: bool = False) -> str:
+        """
+        Save panel results to JSON file
+
+        Args:
+            result: Panel result to save
+            output_path: Destination .json path
+            compress: Write zstd-compressed JSON to output_path + ".zst" instead
+                (requires the zstandard package; plain JSON is written without it)
+
+        Returns:
+            Path actually written
+        """
         # Convert dataclasses to dicts
         output_data = {
             "document_name": result.document_name,
@@ -410,7 +610,63 @@ class JudgePanel:
             "total_thinking_tokens": result.total_thinking_tokens
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(output_data, indent=2).encode("utf-8")
+
+        if compress and not ZSTD_AVAILABLE:
+            logger.warning("⚠️ zstandard not installed - saving uncompressed panel results")
+        elif compress:
+            output_path = f"{output_path}.zst"
+            # One-shot compress records the content size, so load_results() can decompress in one call
+            Path(output_path).write_bytes(zstandard.ZstdCompressor(level=3).compress(payload))
+            logger.info(f"✅ Panel results saved to: {output_path}")
+            return output_path
+
+        Path(output_path).write_bytes(payload)
 
         logger.info(f"✅ Panel results saved to: {output_path}")
+        return output_path
+
+    @staticmethod
+    def load_results(input_path: str) -> PanelResult:
+        """Load a panel result previously written by save_results(), compressed or not"""
+        raw = Path(input_path).read_bytes()
+        if input_path.endswith(".zst"):
+            if not ZSTD_AVAILABLE:
+                raise ImportError(f"zstandard is required to read {input_path}")
+            raw = zstandard.ZstdDecompressor().decompress(raw)
+
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+        individual_results = {
+            judge_name: JudgeResult(
+                judge_name=jr["judge_name"],
+                model=jr["model"],
+                document_name=data["document_name"],
+                provider_scores=[ProviderScore(**score) for score in jr["scores"]],
+                winner=jr["winner"],
+                timestamp=data["timestamp"],
+                cost=jr["cost"],
+                thinking_tokens=jr["thinking_tokens"]
+            )
+            for judge_name, jr in data["individual_results"].items()
+        }
+
+        return PanelResult(
+            document_name=data["document_name"],
+            timestamp=data["timestamp"],
+            judges_used=data["judges_used"],
+            individual_results=individual_results,
+            consensus_method=data["consensus"]["method"],
+            consensus_scores={
+                provider: ConsensusScore(**score)
+                for provider, score in data["consensus"]["scores"].items()
+            },
+            consensus_winner=data["consensus"]["winner"],
+            winner_votes=data["consensus"]["winner_votes"],
+            agreement=InterJudgeAgreement(**data["agreement"]),
+            total_cost=data["total_cost"],
+            total_thinking_tokens=data["total_thinking_tokens"]
+        )
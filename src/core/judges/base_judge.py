@@ -6,6 +6,7 @@ All judges must implement this interface to ensure consistent evaluation
 across GPT-5, Claude Opus 4.1, and Gemini 2.5 Pro.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Any
@@ -93,6 +94,23 @@ class BaseJudge(ABC):
         """
         pass
 
+    async def ajudge_providers(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        http_client: Any = None
+    ) -> JudgeResult:
+        """
+        Async variant of judge_providers() so a panel can await all judges at once.
+
+        Judges with an async SDK client override this; the default runs the
+        blocking judge_providers() in a worker thread.
+
+        http_client is a caller-owned httpx.AsyncClient shared across judges.
+        Judges whose SDK accepts one send requests through it; others ignore it.
+        """
+        return await asyncio.to_thread(self.judge_providers, document_name, provider_outputs)
+
     @abstractmethod
     def _call_api(self, prompt: str) -> str:
         """
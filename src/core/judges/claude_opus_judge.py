@@ -78,6 +78,30 @@ class ClaudeOpusJudge(BaseJudge):
         # Call Anthropic API
         response_text = self._call_api(prompt)
 
+        return self._to_judge_result(document_name, provider_outputs, response_text)
+
+    async def ajudge_providers(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        http_client: Any = None
+    ) -> JudgeResult:
+        """Evaluate all provider outputs using the async Anthropic client"""
+        logger.info(f"Claude Opus Judge evaluating document: {document_name}")
+        logger.info(f"Providers to compare: {list(provider_outputs.keys())}")
+
+        prompt = self._build_judge_prompt(document_name, provider_outputs)
+        response_text = await self._acall_api(prompt, http_client)
+
+        return self._to_judge_result(document_name, provider_outputs, response_text)
+
+    def _to_judge_result(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        response_text: str
+    ) -> JudgeResult:
+        """Parse Claude's JSON response into a JudgeResult"""
         # Parse response
         result = json.loads(response_text)
 
@@ -131,67 +155,97 @@ class ClaudeOpusJudge(BaseJudge):
             JSON string with provider scores
         """
         try:
-            # Add JSON output instruction to system prompt
-            system_prompt = """You are an expert legal document analyst. You evaluate legal event extraction quality objectively.
-
-You must return your evaluation in valid JSON format only. No other text before or after the JSON.
-
-Think deeply about your evaluation using the extended thinking budget provided."""
+            response = self.client.messages.create(**self._request_kwargs(prompt))
+            return self._read_response(response)
 
-            # max_tokens must be > thinking.budget_tokens
-            # Allocate thinking_budget + 4096 for actual response
-            max_tokens = self.thinking_budget + 4096
-
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                thinking={
-                    "type": "enabled",
-                    "budget_tokens": self.thinking_budget
-                },
-                temperature=self.temperature,
-                system=system_prompt,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
+        except Exception as e:
+            logger.error(f"Claude Opus API call failed: {e}")
+            raise
 
-            # Extract content - Claude returns list of content blocks
-            # Thinking appears as separate block with type="thinking"
-            text_content = ""
-            thinking_content = ""
+    async def _acall_api(self, prompt: str, http_client: Any = None) -> str:
+        """
+        Async variant of _call_api().
 
-            for block in response.content:
-                if block.type == "text":
-                    text_content += block.text
-                elif block.type == "thinking":
-                    thinking_content = block.thinking
+        Without a shared http_client, the async client is scoped to the call
+        so it never outlives the event loop that created it.
+        """
+        try:
+            from anthropic import AsyncAnthropic
 
-            # Calculate thinking tokens and cost
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
+            if http_client is None:
+                async with AsyncAnthropic(api_key=self.api_key) as client:
+                    response = await client.messages.create(**self._request_kwargs(prompt))
+            else:
+                # Not closed here: closing the SDK client would close the caller's shared pool
+                client = AsyncAnthropic(api_key=self.api_key, http_client=http_client)
+                response = await client.messages.create(**self._request_kwargs(prompt))
+            return self._read_response(response)
 
-            # Claude Opus 4.1 pricing: $15/M input, $75/M output
-            input_cost = (input_tokens / 1_000_000) * 15.00
-            output_cost = (output_tokens / 1_000_000) * 75.00
-            self._last_cost = input_cost + output_cost
+        except Exception as e:
+            logger.error(f"Claude Opus API call failed: {e}")
+            raise
 
-            # Estimate thinking tokens (not directly provided by API)
-            # Thinking tokens are included in output tokens
-            self._last_thinking_tokens = len(thinking_content.split()) * 1.3 if thinking_content else 0
+    def _request_kwargs(self, prompt: str) -> Dict[str, Any]:
+        """Messages API arguments shared by the sync and async clients"""
+        # Add JSON output instruction to system prompt
+        system_prompt = """You are an expert legal document analyst. You evaluate legal event extraction quality objectively.
 
-            logger.debug(f"Claude Opus API usage: {input_tokens} input, {output_tokens} output tokens")
-            logger.debug(f"Claude Opus thinking: {len(thinking_content)} chars")
-            logger.debug(f"Claude Opus API cost: ${self._last_cost:.4f}")
+You must return your evaluation in valid JSON format only. No other text before or after the JSON.
 
-            return text_content
+Think deeply about your evaluation using the extended thinking budget provided."""
 
-        except Exception as e:
-            logger.error(f"Claude Opus API call failed: {e}")
-            raise
+        # max_tokens must be > thinking.budget_tokens
+        # Allocate thinking_budget + 4096 for actual response
+        max_tokens = self.thinking_budget + 4096
+
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "thinking": {
+                "type": "enabled",
+                "budget_tokens": self.thinking_budget
+            },
+            "temperature": self.temperature,
+            "system": system_prompt,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+
+    def _read_response(self, response) -> str:
+        """Record thinking tokens and cost, and return the text content"""
+        # Extract content - Claude returns list of content blocks
+        # Thinking appears as separate block with type="thinking"
+        text_content = ""
+        thinking_content = ""
+
+        for block in response.content:
+            if block.type == "text":
+                text_content += block.text
+            elif block.type == "thinking":
+                thinking_content = block.thinking
+
+        # Calculate thinking tokens and cost
+        input_tokens = response.usage.input_tokens
+        output_tokens = response.usage.output_tokens
+
+        # Claude Opus 4.1 pricing: $15/M input, $75/M output
+        input_cost = (input_tokens / 1_000_000) * 15.00
+        output_cost = (output_tokens / 1_000_000) * 75.00
+        self._last_cost = input_cost + output_cost
+
+        # Estimate thinking tokens (not directly provided by API)
+        # Thinking tokens are included in output tokens
+        self._last_thinking_tokens = len(thinking_content.split()) * 1.3 if thinking_content else 0
+
+        logger.debug(f"Claude Opus API usage: {input_tokens} input, {output_tokens} output tokens")
+        logger.debug(f"Claude Opus thinking: {len(thinking_content)} chars")
+        logger.debug(f"Claude Opus API cost: ${self._last_cost:.4f}")
+
+        return text_content
 
     def is_available(self) -> bool:
         """Check if Claude Opus judge is properly configured"""
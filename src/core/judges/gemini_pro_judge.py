@@ -76,6 +76,30 @@ class GeminiProJudge(BaseJudge):
         # Call Gemini API
         response_text = self._call_api(prompt)
 
+        return self._to_judge_result(document_name, provider_outputs, response_text)
+
+    async def ajudge_providers(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        http_client: Any = None
+    ) -> JudgeResult:
+        """Evaluate all provider outputs using Gemini's async generate call"""
+        logger.info(f"Gemini Pro Judge evaluating document: {document_name}")
+        logger.info(f"Providers to compare: {list(provider_outputs.keys())}")
+
+        prompt = self._build_judge_prompt(document_name, provider_outputs)
+        response_text = await self._acall_api(prompt)
+
+        return self._to_judge_result(document_name, provider_outputs, response_text)
+
+    def _to_judge_result(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        response_text: str
+    ) -> JudgeResult:
+        """Parse Gemini's JSON response into a JudgeResult"""
         # Parse response
         result = json.loads(response_text)
 
@@ -126,45 +150,62 @@ class GeminiProJudge(BaseJudge):
             JSON string with provider scores
         """
         try:
-            # Configure generation parameters for JSON output
-            generation_config = {
-                "temperature": self.temperature,
-                "response_mime_type": "application/json"
-            }
-
             # Generate content
             response = self.model_obj.generate_content(
                 prompt,
-                generation_config=generation_config
+                generation_config=self._generation_config()
             )
+            return self._read_response(prompt, response)
 
-            # Extract text response
-            response_text = response.text
-
-            # Calculate cost (Gemini 2.5 Pro pricing: ~$1.25/$5 per M tokens)
-            # Note: usage_metadata might not be available in all versions
-            if hasattr(response, 'usage_metadata'):
-                input_tokens = response.usage_metadata.prompt_token_count
-                output_tokens = response.usage_metadata.candidates_token_count
-
-                input_cost = (input_tokens / 1_000_000) * 1.25
-                output_cost = (output_tokens / 1_000_000) * 5.00
-                self._last_cost = input_cost + output_cost
-
-                logger.debug(f"Gemini API usage: {input_tokens} input, {output_tokens} output tokens")
-                logger.debug(f"Gemini API cost: ${self._last_cost:.4f}")
-            else:
-                # Fallback - estimate based on response length
-                estimated_tokens = len(prompt.split()) + len(response_text.split())
-                self._last_cost = (estimated_tokens / 1_000_000) * 2.0
-                logger.debug(f"Gemini API cost (estimated): ${self._last_cost:.4f}")
+        except Exception as e:
+            logger.error(f"Gemini API call failed: {e}")
+            raise
 
-            return response_text
+    async def _acall_api(self, prompt: str) -> str:
+        """Async variant of _call_api()"""
+        try:
+            response = await self.model_obj.generate_content_async(
+                prompt,
+                generation_config=self._generation_config()
+            )
+            return self._read_response(prompt, response)
 
         except Exception as e:
             logger.error(f"Gemini API call failed: {e}")
             raise
 
+    def _generation_config(self) -> Dict[str, Any]:
+        """Configure generation parameters for JSON output"""
+        return {
+            "temperature": self.temperature,
+            "response_mime_type": "application/json"
+        }
+
+    def _read_response(self, prompt: str, response) -> str:
+        """Record the call's cost and return the response text"""
+        # Extract text response
+        response_text = response.text
+
+        # Calculate cost (Gemini 2.5 Pro pricing: ~$1.25/$5 per M tokens)
+        # Note: usage_metadata might not be available in all versions
+        if hasattr(response, 'usage_metadata'):
+            input_tokens = response.usage_metadata.prompt_token_count
+            output_tokens = response.usage_metadata.candidates_token_count
+
+            input_cost = (input_tokens / 1_000_000) * 1.25
+            output_cost = (output_tokens / 1_000_000) * 5.00
+            self._last_cost = input_cost + output_cost
+
+            logger.debug(f"Gemini API usage: {input_tokens} input, {output_tokens} output tokens")
+            logger.debug(f"Gemini API cost: ${self._last_cost:.4f}")
+        else:
+            # Fallback - estimate based on response length
+            estimated_tokens = len(prompt.split()) + len(response_text.split())
+            self._last_cost = (estimated_tokens / 1_000_000) * 2.0
+            logger.debug(f"Gemini API cost (estimated): ${self._last_cost:.4f}")
+
+        return response_text
+
     def is_available(self) -> bool:
         """Check if Gemini Pro judge is properly configured"""
         return bool(self.api_key) and hasattr(self, 'model_obj')
@@ -11,7 +11,7 @@ import logging
 from typing import List, Dict, Any
 from datetime import datetime
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from .base_judge import BaseJudge, JudgeResult, ProviderScore
 
@@ -73,6 +73,30 @@ class GPT5Judge(BaseJudge):
         # Call GPT-5 API
         response_text = self._call_api(prompt)
 
+        return self._to_judge_result(document_name, provider_outputs, response_text)
+
+    async def ajudge_providers(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        http_client: Any = None
+    ) -> JudgeResult:
+        """Evaluate all provider outputs using the async OpenAI client"""
+        logger.info(f"GPT-5 Judge evaluating document: {document_name}")
+        logger.info(f"Providers to compare: {list(provider_outputs.keys())}")
+
+        prompt = self._build_judge_prompt(document_name, provider_outputs)
+        response_text = await self._acall_api(prompt, http_client)
+
+        return self._to_judge_result(document_name, provider_outputs, response_text)
+
+    def _to_judge_result(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        response_text: str
+    ) -> JudgeResult:
+        """Parse GPT-5's JSON response into a JudgeResult"""
         # Parse response
         result = json.loads(response_text)
 
@@ -126,54 +150,82 @@ class GPT5Judge(BaseJudge):
             JSON string with provider scores
         """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert legal document analyst. You evaluate legal event extraction quality objectively and return results in JSON format."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                reasoning_effort=self.reasoning_effort,
-                temperature=self.temperature,
-                response_format={"type": "json_object"}
-            )
+            response = self.client.chat.completions.create(**self._request_kwargs(prompt))
+            return self._read_response(response)
 
-            # Extract reasoning tokens and calculate cost
-            usage = response.usage
-            total_tokens = usage.total_tokens
+        except Exception as e:
+            logger.error(f"GPT-5 API call failed: {e}")
+            raise
 
-            # GPT-5 pricing (approximate):
-            # Input: $2.50/M, Output: $10/M, Reasoning: $10/M (same as output)
-            input_tokens = usage.prompt_tokens
-            output_tokens = usage.completion_tokens
+    async def _acall_api(self, prompt: str, http_client: Any = None) -> str:
+        """
+        Async variant of _call_api().
 
-            # Check if reasoning tokens are available
-            if hasattr(usage, 'completion_tokens_details'):
-                reasoning_tokens = getattr(usage.completion_tokens_details, 'reasoning_tokens', 0)
-                self._last_reasoning_tokens = reasoning_tokens
+        Without a shared http_client, the async client is scoped to the call
+        so it never outlives the event loop that created it.
+        """
+        try:
+            if http_client is None:
+                async with AsyncOpenAI(api_key=self.api_key) as client:
+                    response = await client.chat.completions.create(**self._request_kwargs(prompt))
             else:
-                reasoning_tokens = 0
-                self._last_reasoning_tokens = 0
-
-            # Calculate cost
-            input_cost = (input_tokens / 1_000_000) * 2.50
-            output_cost = (output_tokens / 1_000_000) * 10.00
-            self._last_cost = input_cost + output_cost
-
-            logger.debug(f"GPT-5 API usage: {input_tokens} input, {output_tokens} output, {reasoning_tokens} reasoning tokens")
-            logger.debug(f"GPT-5 API cost: ${self._last_cost:.4f}")
-
-            return response.choices[0].message.content
+                # Not closed here: closing the SDK client would close the caller's shared pool
+                client = AsyncOpenAI(api_key=self.api_key, http_client=http_client)
+                response = await client.chat.completions.create(**self._request_kwargs(prompt))
+            return self._read_response(response)
 
         except Exception as e:
             logger.error(f"GPT-5 API call failed: {e}")
             raise
 
+    def _request_kwargs(self, prompt: str) -> Dict[str, Any]:
+        """Chat completion arguments shared by the sync and async clients"""
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an expert legal document analyst. You evaluate legal event extraction quality objectively and return results in JSON format."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "reasoning_effort": self.reasoning_effort,
+            "temperature": self.temperature,
+            "response_format": {"type": "json_object"}
+        }
+
+    def _read_response(self, response) -> str:
+        """Record reasoning tokens and cost, and return the response text"""
+        # Extract reasoning tokens and calculate cost
+        usage = response.usage
+        total_tokens = usage.total_tokens
+
+        # GPT-5 pricing (approximate):
+        # Input: $2.50/M, Output: $10/M, Reasoning: $10/M (same as output)
+        input_tokens = usage.prompt_tokens
+        output_tokens = usage.completion_tokens
+
+        # Check if reasoning tokens are available
+        if hasattr(usage, 'completion_tokens_details'):
+            reasoning_tokens = getattr(usage.completion_tokens_details, 'reasoning_tokens', 0)
+            self._last_reasoning_tokens = reasoning_tokens
+        else:
+            reasoning_tokens = 0
+            self._last_reasoning_tokens = 0
+
+        # Calculate cost
+        input_cost = (input_tokens / 1_000_000) * 2.50
+        output_cost = (output_tokens / 1_000_000) * 10.00
+        self._last_cost = input_cost + output_cost
+
+        logger.debug(f"GPT-5 API usage: {input_tokens} input, {output_tokens} output, {reasoning_tokens} reasoning tokens")
+        logger.debug(f"GPT-5 API cost: ${self._last_cost:.4f}")
+
+        return response.choices[0].message.content
+
     def is_available(self) -> bool:
         """Check if GPT-5 judge is properly configured"""
         return bool(self.api_key)
@@ -3,12 +3,17 @@ Centralized LangExtract Client - Single point for all LangExtract operations
 Handles API key loading, shared prompts, and extraction calls
 """
 
+from __future__ import annotations
+
 import os
 import logging
 from typing import Dict, List, Any, Optional
 
+# Building examples only uses the data classes; the top-level package is bound
+# where lx.extract() is called. Importing langextract.data still runs
+# langextract/__init__.py, so this does not reduce import cost by itself
 try:
-    import langextract as lx
+    from langextract import data as lx_data
     LANGEXTRACT_AVAILABLE = True
 except ImportError:
     LANGEXTRACT_AVAILABLE = False
@@ -50,7 +55,7 @@ class LangExtractClient:
 
         logger.info("✅ GEMINI_API_KEY loaded successfully")
 
-    def _create_shared_examples(self) -> List[lx.data.ExampleData]:
+    def _create_shared_examples(self) -> List[lx_data.ExampleData]:
         """
         Load shared example data from external module
 
@@ -74,7 +79,7 @@ class LangExtractClient:
     def extract_with_prompt(self,
                            text: str,
                            prompt_description: str,
-                           custom_examples: Optional[List[lx.data.ExampleData]] = None) -> Optional[Any]:
+                           custom_examples: Optional[List[lx_data.ExampleData]] = None) -> Optional[Any]:
         """
         Execute LangExtract with shared configuration
 
@@ -97,6 +102,8 @@ class LangExtractClient:
             logger.info(f"📝 Text length: {len(text)} chars")
             logger.info(f"🎯 Examples: {len(examples)}")
 
+            import langextract as lx
+
             # Execute the real LangExtract API call
             response = lx.extract(
                 text_or_documents=text,
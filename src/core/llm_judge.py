@@ -14,14 +14,72 @@ No ground truth needed - compares provider outputs directly.
 
 import os
 import json
+import asyncio
 import logging
 from typing import List, Dict, Any
 from dataclasses import dataclass, asdict
+from pathlib import Path
 
-from openai import OpenAI
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from openai import AsyncOpenAI, OpenAI
+
+from .judge_cache import JudgeCache, cache_key, judge_cache_enabled, prompt_fingerprint
 
 logger = logging.getLogger(__name__)
 
+# Scoring rubric and closing guidelines of the judge prompt
+SCORING_CRITERIA = """**Scoring Criteria** (calibrated for legal professional needs):
+
+1. **Completeness** (0-10): Did the provider capture all meaningful legal events?
+   - 10 = All events captured, no important events missed
+   - 5 = About half the events captured
+   - 0 = Very few or no events captured
+   - NOTE: High completeness with missing citations should NOT score 10 overall
+
+2. **Accuracy** (0-10): Are the dates, parties, facts, and details correct?
+   - 10 = All facts accurate, no errors
+   - 5 = Some errors but mostly correct
+   - 0 = Many errors or completely wrong
+
+3. **Hallucinations** (0-10): Are there invented facts NOT in the source?
+   - 10 = No hallucinations, all facts from source
+   - 5 = Minor invented details
+   - 0 = Many fabricated facts
+
+4. **Citation Quality** (0-10): Are legal citations accurate and properly formatted?
+   - 10 = All citations accurate and well-formatted
+   - 5 = Some citation errors or missing citations
+   - 0 = No citations or completely wrong citations
+   - **CRITICAL FOR LEGAL WORK**: Missing citations is a fatal flaw (max 5/10 overall)
+
+5. **Overall Quality** (0-10): Overall usability for legal professionals
+   - 10 = Production-ready, no corrections needed (requires proper citations)
+   - 5 = Usable with moderate corrections
+   - 0 = Not usable, requires complete rewrite
+   - **Consider**: Legal professionals need QUALITY over QUANTITY
+   - **Prefer**: 1 well-cited event over 5 events without citations
+   - **Fatal flaws**: Missing citations, hallucinations, poor accuracy
+
+"""
+
+JUDGE_SYSTEM_PROMPT = "You are an expert legal document analyst. You evaluate legal event extraction quality objectively and return results in JSON format."
+
+JUDGING_GUIDELINES = """**Important Judging Guidelines**:
+- Score ALL providers objectively
+- Use decimal scores (e.g., 8.5) for precision
+- Winner = highest overall_quality score
+- **Citation quality is CRITICAL**: Providers with missing/poor citations cannot score >7/10 overall
+- **Quality over quantity**: 1 well-cited event beats 5 events without citations
+- **Legal professional context**: Prioritize usability for lawyers (citations, accuracy, no hallucinations)
+- Reasoning should explain key strengths/weaknesses (2-3 sentences)
+- Return ONLY the JSON, no other text
+"""
+
 
 @dataclass
 class ProviderScore:
@@ -54,11 +112,15 @@ class LLMJudge:
     without requiring ground truth annotations.
     """
 
+    # Cache directory for this class's {"result", "timestamp"} entries
+    CACHE_NAMESPACE = "llm_judge"
+
     def __init__(
         self,
         api_key: str | None = None,
         model: str = "gpt-4o-mini",
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        cache: JudgeCache | None = None
     ):
         """
         Initialize LLM judge
@@ -67,6 +129,7 @@ class LLMJudge:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
             model: Model to use for judging (gpt-4o-mini recommended)
             temperature: Temperature for generation (0.0 for consistency)
+            cache: Response cache for re-runs (defaults to one when JUDGE_CACHE=1)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
@@ -75,6 +138,8 @@ class LLMJudge:
         self.model = model
         self.temperature = temperature
         self.client = OpenAI(api_key=self.api_key)
+        self.cache = cache if cache is not None else (JudgeCache() if judge_cache_enabled() else None)
+        self._prompt_version = prompt_fingerprint(JUDGE_SYSTEM_PROMPT, self._build_judge_prompt("", {}))
 
         logger.info(f"LLM Judge initialized with model: {model}")
 
@@ -99,52 +164,12 @@ class LLMJudge:
 
 **Your Task**: Score each provider on 5 criteria (0-10 scale) and identify the best provider.
 
-**Scoring Criteria** (calibrated for legal professional needs):
-
-1. **Completeness** (0-10): Did the provider capture all meaningful legal events?
-   - 10 = All events captured, no important events missed
-   - 5 = About half the events captured
-   - 0 = Very few or no events captured
-   - NOTE: High completeness with missing citations should NOT score 10 overall
-
-2. **Accuracy** (0-10): Are the dates, parties, facts, and details correct?
-   - 10 = All facts accurate, no errors
-   - 5 = Some errors but mostly correct
-   - 0 = Many errors or completely wrong
-
-3. **Hallucinations** (0-10): Are there invented facts NOT in the source?
-   - 10 = No hallucinations, all facts from source
-   - 5 = Minor invented details
-   - 0 = Many fabricated facts
-
-4. **Citation Quality** (0-10): Are legal citations accurate and properly formatted?
-   - 10 = All citations accurate and well-formatted
-   - 5 = Some citation errors or missing citations
-   - 0 = No citations or completely wrong citations
-   - **CRITICAL FOR LEGAL WORK**: Missing citations is a fatal flaw (max 5/10 overall)
-
-5. **Overall Quality** (0-10): Overall usability for legal professionals
-   - 10 = Production-ready, no corrections needed (requires proper citations)
-   - 5 = Usable with moderate corrections
-   - 0 = Not usable, requires complete rewrite
-   - **Consider**: Legal professionals need QUALITY over QUANTITY
-   - **Prefer**: 1 well-cited event over 5 events without citations
-   - **Fatal flaws**: Missing citations, hallucinations, poor accuracy
-
-**Provider Outputs**:
+{SCORING_CRITERIA}**Provider Outputs**:
 
 """
 
         # Add each provider's output
-        for provider, events in provider_outputs.items():
-            prompt += f"\n**{provider.upper()}** ({len(events)} events):\n"
-            if not events:
-                prompt += "  (No events extracted)\n"
-            else:
-                for i, event in enumerate(events, 1):
-                    prompt += f"  {i}. Date: {event.get('date', 'N/A')}\n"
-                    prompt += f"     Event: {event.get('event_particulars', 'N/A')[:200]}...\n"
-                    prompt += f"     Citation: {event.get('citation', 'N/A')}\n\n"
+        prompt += self._format_provider_outputs(provider_outputs)
 
         prompt += """
 **Output Format**: Return ONLY valid JSON with this exact structure:
@@ -164,19 +189,112 @@ class LLMJudge:
   "winner": "provider_name"
 }
 
-**Important Judging Guidelines**:
-- Score ALL providers objectively
-- Use decimal scores (e.g., 8.5) for precision
-- Winner = highest overall_quality score
-- **Citation quality is CRITICAL**: Providers with missing/poor citations cannot score >7/10 overall
-- **Quality over quantity**: 1 well-cited event beats 5 events without citations
-- **Legal professional context**: Prioritize usability for lawyers (citations, accuracy, no hallucinations)
-- Reasoning should explain key strengths/weaknesses (2-3 sentences)
-- Return ONLY the JSON, no other text
-"""
+""" + JUDGING_GUIDELINES
 
         return prompt
 
+    @staticmethod
+    def _format_provider_outputs(provider_outputs: Dict[str, List[Dict[str, Any]]]) -> str:
+        """Render each provider's events as the numbered list shown to the judge"""
+        text = ""
+        for provider, events in provider_outputs.items():
+            text += f"\n**{provider.upper()}** ({len(events)} events):\n"
+            if not events:
+                text += "  (No events extracted)\n"
+            else:
+                for i, event in enumerate(events, 1):
+                    text += f"  {i}. Date: {event.get('date', 'N/A')}\n"
+                    text += f"     Event: {event.get('event_particulars', 'N/A')[:200]}...\n"
+                    text += f"     Citation: {event.get('citation', 'N/A')}\n\n"
+        return text
+
+    def _completion_kwargs(self, prompt: str) -> Dict[str, Any]:
+        """JSON-mode chat completion arguments shared by the sync and async clients"""
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": JUDGE_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": self.temperature,
+            "response_format": {"type": "json_object"}
+        }
+
+    def _create_completion(self, prompt: str):
+        """Send a judge prompt to the model in JSON mode"""
+        return self.client.chat.completions.create(**self._completion_kwargs(prompt))
+
+    @staticmethod
+    def _to_comparison(
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        result: Dict[str, Any],
+        timestamp: str
+    ) -> JudgeComparison:
+        """Build a JudgeComparison from one document's parsed judge output"""
+        provider_scores = []
+        for provider_data in result.get("providers", []):
+            score = ProviderScore(
+                provider=provider_data["provider"],
+                document_name=document_name,
+                completeness=float(provider_data["completeness"]),
+                accuracy=float(provider_data["accuracy"]),
+                hallucinations=float(provider_data["hallucinations"]),
+                citation_quality=float(provider_data["citation_quality"]),
+                overall_quality=float(provider_data["overall_quality"]),
+                reasoning=provider_data["reasoning"],
+                event_count=len(provider_outputs.get(provider_data["provider"], []))
+            )
+            provider_scores.append(score)
+
+        return JudgeComparison(
+            document_name=document_name,
+            provider_scores=provider_scores,
+            winner=result.get("winner", "unknown"),
+            timestamp=timestamp
+        )
+
+    def _cached_comparison(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]]
+    ) -> JudgeComparison | None:
+        """Rebuild a comparison from the response cache, if enabled and present"""
+        if self.cache is None:
+            return None
+
+        entry = self.cache.get(
+            self.CACHE_NAMESPACE, self.model, cache_key(document_name, provider_outputs, self._prompt_version)
+        )
+        if entry is None:
+            return None
+
+        comparison = self._to_comparison(document_name, provider_outputs, entry["result"], entry["timestamp"])
+        logger.info(f"Winner for {document_name}: {comparison.winner} (cached)")
+        return comparison
+
+    def _cache_result(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        result: Dict[str, Any],
+        timestamp: str
+    ):
+        """Store one document's parsed judge output in the response cache"""
+        if self.cache is not None:
+            self.cache.put(
+                self.CACHE_NAMESPACE,
+                self.model,
+                cache_key(document_name, provider_outputs, self._prompt_version),
+                {"result": result, "timestamp": timestamp}
+            )
+
     def judge_providers(
         self,
         document_name: str,
@@ -195,26 +313,16 @@ class LLMJudge:
         logger.info(f"Judging providers for document: {document_name}")
         logger.info(f"Providers to compare: {list(provider_outputs.keys())}")
 
+        cached = self._cached_comparison(document_name, provider_outputs)
+        if cached is not None:
+            return cached
+
         # Build prompt
         prompt = self._build_judge_prompt(document_name, provider_outputs)
 
         # Call OpenAI with JSON mode
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert legal document analyst. You evaluate legal event extraction quality objectively and return results in JSON format."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=self.temperature,
-                response_format={"type": "json_object"}
-            )
+            response = self._create_completion(prompt)
 
             # Parse response
             result_text = response.choices[0].message.content
@@ -222,29 +330,11 @@ class LLMJudge:
 
             logger.info(f"Judge response received: {len(result.get('providers', []))} providers scored")
 
-            # Build ProviderScore objects
-            provider_scores = []
-            for provider_data in result.get("providers", []):
-                score = ProviderScore(
-                    provider=provider_data["provider"],
-                    document_name=document_name,
-                    completeness=float(provider_data["completeness"]),
-                    accuracy=float(provider_data["accuracy"]),
-                    hallucinations=float(provider_data["hallucinations"]),
-                    citation_quality=float(provider_data["citation_quality"]),
-                    overall_quality=float(provider_data["overall_quality"]),
-                    reasoning=provider_data["reasoning"],
-                    event_count=len(provider_outputs.get(provider_data["provider"], []))
-                )
-                provider_scores.append(score)
-
-            # Create comparison
-            comparison = JudgeComparison(
-                document_name=document_name,
-                provider_scores=provider_scores,
-                winner=result.get("winner", "unknown"),
-                timestamp=response.created.__str__()
+            # Create comparison; only a reply that builds one is worth caching
+            comparison = self._to_comparison(
+                document_name, provider_outputs, result, response.created.__str__()
             )
+            self._cache_result(document_name, provider_outputs, result, response.created.__str__())
 
             logger.info(f"Winner for {document_name}: {comparison.winner}")
 
@@ -286,6 +376,90 @@ class LLMJudge:
 
         return comparisons
 
+    async def ajudge_providers(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        client: AsyncOpenAI
+    ) -> JudgeComparison:
+        """
+        Async variant of judge_providers() using a shared AsyncOpenAI client
+
+        Args:
+            document_name: Name of document being evaluated
+            provider_outputs: Dict mapping provider names to list of events
+            client: Async client owned by the caller
+
+        Returns:
+            JudgeComparison with scores for all providers
+        """
+        logger.info(f"Judging providers for document: {document_name}")
+
+        cached = self._cached_comparison(document_name, provider_outputs)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_judge_prompt(document_name, provider_outputs)
+
+        try:
+            response = await client.chat.completions.create(**self._completion_kwargs(prompt))
+            result = json.loads(response.choices[0].message.content)
+        except Exception as e:
+            logger.error(f"Error during judging {document_name}: {e}")
+            raise
+
+        comparison = self._to_comparison(
+            document_name, provider_outputs, result, response.created.__str__()
+        )
+        self._cache_result(document_name, provider_outputs, result, response.created.__str__())
+        logger.info(f"Winner for {document_name}: {comparison.winner}")
+
+        return comparison
+
+    async def ajudge_multiple_documents(
+        self,
+        document_results: Dict[str, Dict[str, List[Dict[str, Any]]]],
+        max_concurrency: int | None = None
+    ) -> List[JudgeComparison]:
+        """
+        Judge documents concurrently, at most max_concurrency requests at a time
+
+        Args:
+            document_results: Dict mapping document names to provider outputs
+            max_concurrency: Cap on in-flight requests, to stay under the
+                account's rate limits (defaults to OPENAI_MAX_PARALLEL, else 8)
+
+        Returns:
+            List of JudgeComparison objects, one per document, in input order
+        """
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("OPENAI_MAX_PARALLEL", "8"))
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async with AsyncOpenAI(api_key=self.api_key) as client:
+            async def judge_one(index, doc_name, provider_outputs):
+                async with semaphore:
+                    return index, await self.ajudge_providers(doc_name, provider_outputs, client)
+
+            tasks = [
+                asyncio.create_task(judge_one(index, doc_name, outputs))
+                for index, (doc_name, outputs) in enumerate(document_results.items())
+            ]
+
+            # Report each document as soon as it is scored instead of after the slowest
+            comparisons: List[JudgeComparison | None] = [None] * len(tasks)
+            try:
+                for done, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                    index, comparison = await next_result
+                    comparisons[index] = comparison
+                    logger.info(f"[{done}/{len(tasks)}] {comparison.document_name} judged - winner: {comparison.winner}")
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            return comparisons
+
     def aggregate_scores(
         self,
         comparisons: List[JudgeComparison]
@@ -431,8 +605,11 @@ class LLMJudge:
             "total_documents": len(comparisons)
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            Path(output_path).write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(export_data, f, indent=2)
 
         logger.info(f"Results exported to {output_path}")
 
@@ -9,7 +9,7 @@ from typing import List, Dict, Any, Optional
 
 from .interfaces import EventExtractor, EventRecord
 from .config import OpenCodeZenConfig
-from .constants import DEFAULT_NO_DATE, DEFAULT_NO_CITATION, LEGAL_EVENTS_PROMPT
+from .constants import DEFAULT_NO_DATE, DEFAULT_NO_CITATION, LEGAL_EVENTS_JSON_PROMPT
 
 logger = logging.getLogger(__name__)
 
@@ -114,7 +114,7 @@ class OpenCodeZenEventExtractor:
         messages = [
             {
                 "role": "system",
-                "content": LEGAL_EVENTS_PROMPT + "\n\nReturn your response as valid JSON array containing the extracted events."
+                "content": LEGAL_EVENTS_JSON_PROMPT
             },
             {
                 "role": "user",
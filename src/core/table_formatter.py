@@ -3,14 +3,80 @@ Table Formatter - Shared formatting logic for five-column legal events table
 Ensures consistency between pipeline, UI, and downloads
 """
 
+import io
+import json
+import numpy as np
 import pandas as pd
 import logging
 from typing import List, Dict, Any, Optional
 
-from .constants import FIVE_COLUMN_HEADERS, INTERNAL_FIELDS, DEFAULT_NO_DATE
+try:
+    import pyarrow as pa  # enables pandas' "string[pyarrow]" dtype
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xlsxwriter  # noqa: F401 - faster Excel engine for exports
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+from .constants import (
+    FIVE_COLUMN_HEADERS, INTERNAL_FIELDS, DEFAULT_NO_DATE, DEFAULT_NO_PARTICULARS,
+    DEFAULT_NO_CITATION, DEFAULT_NO_REFERENCE
+)
 
 logger = logging.getLogger(__name__)
 
+__all__ = ["TableFormatter"]
+
+# Defaults for internal fields missing from a record ("number" uses the record position)
+_FIELD_DEFAULTS = {
+    "number": None,
+    "date": DEFAULT_NO_DATE,
+    "event_particulars": DEFAULT_NO_PARTICULARS,
+    "citation": DEFAULT_NO_CITATION,
+    "document_reference": DEFAULT_NO_REFERENCE,
+}
+
+# Performance timing fields carried through to the table when present
+_TIMING_COLUMNS = ["docling_seconds", "extractor_seconds", "total_seconds"]
+
+# Text columns stored as Arrow strings so .str operations run in Arrow kernels.
+# Normalized and fallback tables share these dtypes, so either concatenates cleanly
+_TEXT_COLUMNS = FIVE_COLUMN_HEADERS[1:]
+_TEXT_DTYPES = {col: "string[pyarrow]" for col in _TEXT_COLUMNS} if PYARROW_AVAILABLE else {}
+
+# Citation values that mark a default/fallback rather than a real citation
+_PLACEHOLDER_CITATION_PATTERN = r"No citation available|processing failed"
+
+
+# One-row fallback table; create_fallback_dataframe() copies it and fills in the reason
+_FALLBACK_TEMPLATE = pd.DataFrame([{
+    FIVE_COLUMN_HEADERS[0]: 1,  # No
+    FIVE_COLUMN_HEADERS[1]: DEFAULT_NO_DATE,  # Date
+    FIVE_COLUMN_HEADERS[2]: "",  # Event Particulars
+    FIVE_COLUMN_HEADERS[3]: "No citation available (processing failed)",  # Citation
+    FIVE_COLUMN_HEADERS[4]: DEFAULT_NO_REFERENCE  # Document Reference
+}]).astype(_TEXT_DTYPES)
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback for the pandas/NumPy scalars a table can hold (pd.NA becomes null)"""
+    if value is pd.NA:
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
 class TableFormatter:
     """
@@ -34,45 +100,52 @@ class TableFormatter:
             return pd.DataFrame(columns=FIVE_COLUMN_HEADERS)
 
         try:
-            # Create DataFrame from records
-            df = pd.DataFrame(records)
-
-            # Ensure all required internal fields exist
-            for field in INTERNAL_FIELDS:
-                if field not in df.columns:
-                    logger.warning(f"⚠️ Missing field {field} - adding default values")
-                    if field == "number":
-                        df[field] = range(1, len(df) + 1)
-                    elif field == "date":
-                        df[field] = DEFAULT_NO_DATE
-                    elif field == "event_particulars":
-                        df[field] = "Event details not available"
-                    elif field == "citation":
-                        df[field] = "No citation available"
-                    elif field == "document_reference":
-                        df[field] = "Unknown document"
+            # Fill missing fields while copying the records, so pandas builds the
+            # frame in one pass instead of patching columns in afterwards
+            rows = []
+            missing_fields = set()
+            present_timing = set()
+            for number, record in enumerate(records, start=1):
+                row = dict(record)
+                # One key-view comparison for complete records (the usual case)
+                if not _FIELD_DEFAULTS.keys() <= row.keys():
+                    for field in _FIELD_DEFAULTS.keys() - row.keys():
+                        missing_fields.add(field)
+                        row[field] = number if field == "number" else _FIELD_DEFAULTS[field]
+                present_timing.update(col for col in _TIMING_COLUMNS if col in row)
+                rows.append(row)
+
+            for field in sorted(missing_fields):
+                logger.warning(f"⚠️ Missing field {field} - adding default values")
 
             # Preserve timing columns if present (performance metrics)
-            timing_columns = ["docling_seconds", "extractor_seconds", "total_seconds"]
-            timing_data = {}
-            for col in timing_columns:
-                if col in df.columns:
-                    timing_data[col] = df[col]
+            timing_columns = [col for col in _TIMING_COLUMNS if col in present_timing]
 
             # Select and reorder core columns to match internal field order
-            core_df = df[INTERNAL_FIELDS].copy()
-
-            # Rename columns to display headers
-            core_df.columns = FIVE_COLUMN_HEADERS
-
-            # Add timing columns back if they were present
-            for col, data in timing_data.items():
-                # Convert column name to display format (capitalize words)
-                display_col = col.replace("_", " ").title().replace(" ", "_")
-                core_df[display_col] = data
-
-            # Sort by number column
-            core_df = core_df.sort_values(FIVE_COLUMN_HEADERS[0]).reset_index(drop=True)
+            core_df = pd.DataFrame(rows, columns=INTERNAL_FIELDS + timing_columns)
+
+            # Rename columns to display headers in place (labels only, no data copy);
+            # timing columns are capitalized per word
+            timing_display = [col.replace("_", " ").title().replace(" ", "_") for col in timing_columns]
+            core_df.columns = FIVE_COLUMN_HEADERS + timing_display
+
+            for display_col in timing_display:
+                # Timings are normally floats already; coerce only unexpected values
+                if core_df[display_col].dtype.kind not in "iuf":
+                    core_df[display_col] = pd.to_numeric(core_df[display_col], errors="coerce")
+
+            # All dtype conversions in one astype call. Seconds only carry ~ms
+            # precision, so float32 halves the bytes moved downstream
+            column_dtypes = {col: "float32" for col in timing_display}
+            column_dtypes.update(_TEXT_DTYPES)
+            core_df = core_df.astype(column_dtypes)
+
+            # Sort by number column; numbers normally arrive in order, so check first
+            # (the frame was just built with a RangeIndex, so nothing to reset then)
+            numbers = core_df[FIVE_COLUMN_HEADERS[0]].to_numpy()
+            if not np.all(numbers[1:] >= numbers[:-1]):
+                core_df = core_df.take(np.argsort(numbers, kind="stable"))
+                core_df.index = pd.RangeIndex(len(core_df))
 
             # Validate final format (allows extra columns beyond the core 5)
             if not TableFormatter.validate_dataframe_format(core_df):
@@ -112,15 +185,16 @@ class TableFormatter:
             logger.error(f"❌ Core columns mismatch. Expected first 5: {FIVE_COLUMN_HEADERS}, Got: {df_columns[:5]}")
             return False
 
-        # Check required columns have data
+        # Check required columns have data (stops at the first non-null value)
         for col in FIVE_COLUMN_HEADERS:
-            if df[col].isnull().all():
+            if df[col].first_valid_index() is None:
                 logger.error(f"❌ Column {col} has no data")
                 return False
 
         # Check number column contains valid integers
         try:
-            if not df[FIVE_COLUMN_HEADERS[0]].dtype.kind in 'iu':  # integer or unsigned int
+            # Covers NumPy ints as well as pandas Int64 / Arrow int64 extension dtypes
+            if not pd.api.types.is_integer_dtype(df[FIVE_COLUMN_HEADERS[0]]):
                 logger.error(f"❌ Number column contains non-integer values")
                 return False
         except Exception as e:
@@ -141,15 +215,9 @@ class TableFormatter:
         Returns:
             Valid DataFrame with one fallback record
         """
-        fallback_record = {
-            FIVE_COLUMN_HEADERS[0]: 1,  # No
-            FIVE_COLUMN_HEADERS[1]: DEFAULT_NO_DATE,  # Date
-            FIVE_COLUMN_HEADERS[2]: f"Processing failed: {reason}",  # Event Particulars
-            FIVE_COLUMN_HEADERS[3]: "No citation available (processing failed)",  # Citation
-            FIVE_COLUMN_HEADERS[4]: "Unknown document"  # Document Reference
-        }
-
-        df = pd.DataFrame([fallback_record])
+        # Deep copy: callers annotate and may edit the frame, the template must stay intact
+        df = _FALLBACK_TEMPLATE.copy()
+        df.iat[0, 2] = f"Processing failed: {reason}"  # Event Particulars
         logger.info(f"✅ Created fallback DataFrame: {reason}")
         return df
 
@@ -225,12 +293,17 @@ class TableFormatter:
         Returns:
             Excel workbook with two sheets: Legal Events and Metadata
         """
-        import io
-
         buffer = io.BytesIO()
 
-        # Create Excel writer with multiple sheets
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+        # Create Excel writer with multiple sheets. xlsxwriter serializes without
+        # building openpyxl's in-memory cell tree; its constant_memory mode is not
+        # used because pandas writes body cells column by column, which that mode drops.
+        if XLSXWRITER_AVAILABLE:
+            writer_kwargs = {"engine": "xlsxwriter", "engine_kwargs": {"options": {"strings_to_urls": False}}}
+        else:
+            writer_kwargs = {"engine": "openpyxl"}
+
+        with pd.ExcelWriter(buffer, **writer_kwargs) as writer:
             # Sheet 1: Legal Events (main data)
             df.to_excel(writer, sheet_name='Legal Events', index=False)
 
@@ -297,8 +370,6 @@ class TableFormatter:
         Returns:
             JSON with pipeline_id field and legal_events array
         """
-        import json
-
         records = df.to_dict(orient='records')
 
         # Wrap with pipeline_id if available
@@ -311,7 +382,47 @@ class TableFormatter:
             # Fallback to plain array if no pipeline_id
             output = records
 
-        return json.dumps(output, indent=2).encode('utf-8')
+        # Arrow-backed text columns report missing values as pd.NA
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                output,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+        return json.dumps(output, indent=2, default=_json_default).encode('utf-8')
+
+    @staticmethod
+    def count_real_citations(citations: pd.Series) -> int:
+        """
+        Count citations that are not default/fallback placeholders
+
+        Args:
+            citations: Citation column
+
+        Returns:
+            Number of real citations
+        """
+        placeholder = citations.str.contains(_PLACEHOLDER_CITATION_PATTERN, regex=True, na=False)
+        return int((~placeholder).sum())
+
+    @staticmethod
+    def _mean_text_length(series: pd.Series) -> float:
+        """Mean string length of the non-null values (NaN if there are none)"""
+        if PYARROW_AVAILABLE and getattr(series.dtype, "storage", None) == "pyarrow":
+            # Reduced in Arrow without materializing a pandas length Series
+            mean = pc.mean(pc.utf8_length(pa.array(series))).as_py()
+            return float("nan") if mean is None else mean
+
+        return float(series.str.len().mean())
+
+    @staticmethod
+    def _count_distinct(series: pd.Series) -> int:
+        """Number of distinct non-null values"""
+        if PYARROW_AVAILABLE and getattr(series.dtype, "storage", None) == "pyarrow":
+            # Arrow hashes the column in place instead of building a unique array
+            return pc.count_distinct(pa.array(series), mode="only_valid").as_py()
+
+        return int(series.nunique())
 
     @staticmethod
     def get_table_summary(df: pd.DataFrame) -> Dict[str, Any]:
@@ -335,18 +446,15 @@ class TableFormatter:
         try:
             # Calculate statistics
             total_events = len(df)
-            unique_docs = df[FIVE_COLUMN_HEADERS[4]].nunique()  # Document Reference
+            unique_docs = TableFormatter._count_distinct(df[FIVE_COLUMN_HEADERS[4]])  # Document Reference
 
             # Count events with real citations (not default)
             citation_col = FIVE_COLUMN_HEADERS[3]  # Citation
-            events_with_citations = len(df[
-                (~df[citation_col].str.contains("No citation available", na=False)) &
-                (~df[citation_col].str.contains("processing failed", na=False))
-            ])
+            events_with_citations = TableFormatter.count_real_citations(df[citation_col])
 
             # Average length of event particulars
             particulars_col = FIVE_COLUMN_HEADERS[2]  # Event Particulars
-            avg_length = df[particulars_col].str.len().mean()
+            avg_length = TableFormatter._mean_text_length(df[particulars_col])
 
             return {
                 "total_events": total_events,
@@ -12,6 +12,7 @@ from typing import Optional, List
 
 from ..core.legal_pipeline_refactored import LegalEventsPipeline
 from ..core.constants import FIVE_COLUMN_HEADERS
+from ..core.table_formatter import TableFormatter
 
 logger = logging.getLogger(__name__)
 
@@ -338,10 +339,7 @@ def display_legal_events_table(legal_events_df: pd.DataFrame) -> None:
         st.metric("Documents Processed", unique_docs)
     with col3:
         # Count events with real citations (not defaults)
-        citations_count = len(legal_events_df[
-            (~legal_events_df[FIVE_COLUMN_HEADERS[3]].str.contains("No citation available", na=False)) &  # Citation
-            (~legal_events_df[FIVE_COLUMN_HEADERS[3]].str.contains("processing failed", na=False))
-        ])
+        citations_count = TableFormatter.count_real_citations(legal_events_df[FIVE_COLUMN_HEADERS[3]])  # Citation
         st.metric("Events with Citations", citations_count)
     with col4:
         avg_chars = legal_events_df[FIVE_COLUMN_HEADERS[2]].str.len().mean()  # Event Particulars
@@ -433,6 +431,5 @@ def show_sample_table_format() -> None:
     st.subheader("📋 Sample Five-Column Format")
     st.caption("This is the guaranteed output format:")
 
-    from ..core.table_formatter import TableFormatter
     sample_df = TableFormatter.create_fallback_dataframe("Sample - no files uploaded yet")
     st.dataframe(sample_df, width='stretch', hide_index=True)
\ No newline at end of file
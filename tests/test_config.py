@@ -0,0 +1,78 @@
+"""Tests for environment-derived configuration dataclasses."""
+
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
+from src.core import config as config_module
+from src.core.config import (
+    DoclingConfig, ExtractorConfig, OpenAIConfig, OpenCodeZenConfig,
+    config_from_env, load_provider_config
+)
+
+
+def test_defaults_are_read_at_import(monkeypatch):
+    """Plain construction keeps the import-time environment, by design."""
+    monkeypatch.setenv("DOCLING_ACCELERATOR_THREADS", "97")
+
+    assert DoclingConfig().accelerator_threads == config_module._DOCLING_DEFAULTS["accelerator_threads"]
+
+
+def test_config_from_env_sees_changes_after_import(monkeypatch):
+    monkeypatch.setenv("DOCLING_ACCELERATOR_THREADS", "97")
+    monkeypatch.setenv("DOCLING_TABLE_MODE", "ACCURATE")
+    monkeypatch.setenv("OPENAI_MODEL", "gpt-test")
+
+    assert config_from_env(DoclingConfig).accelerator_threads == 97
+    assert config_from_env(DoclingConfig).table_mode == "ACCURATE"
+    assert config_from_env(OpenAIConfig).model == "gpt-test"
+
+
+def test_config_from_env_overrides_win(monkeypatch):
+    monkeypatch.setenv("OPENCODEZEN_MODEL", "from-env")
+
+    assert config_from_env(OpenCodeZenConfig, model="explicit").model == "explicit"
+
+
+@pytest.mark.parametrize("field, value", [("table_mode", "SLOW"), ("accelerator_device", "tpu")])
+def test_docling_config_rejects_unknown_options(field, value):
+    with pytest.raises(ValueError, match=field):
+        DoclingConfig(**{field: value})
+
+
+def test_replace_revalidates_docling_options():
+    with pytest.raises(ValueError):
+        replace(DoclingConfig(), table_mode="fast")
+
+
+def test_invalid_environment_value_raises(monkeypatch):
+    monkeypatch.setenv("DOCLING_ACCELERATOR_DEVICE", "tpu")
+
+    with pytest.raises(ValueError):
+        config_from_env(DoclingConfig)
+
+
+def test_configs_are_frozen():
+    config = DoclingConfig()
+
+    with pytest.raises(FrozenInstanceError):
+        config.do_ocr = not config.do_ocr
+
+
+def test_replace_returns_a_new_config_and_leaves_the_original():
+    config = DoclingConfig(do_ocr=False)
+    ocr_config = replace(config, do_ocr=True)
+
+    assert ocr_config.do_ocr and not config.do_ocr
+    assert replace(ocr_config, do_ocr=False) == config
+    assert hash(replace(ocr_config, do_ocr=False)) == hash(config)
+
+
+def test_load_provider_config_sets_event_extractor():
+    extractor_config = ExtractorConfig(doc_extractor="docling", event_extractor="langextract")
+
+    _, event_config, resolved = load_provider_config("OpenAI", extractor_config=extractor_config)
+
+    assert isinstance(event_config, OpenAIConfig)
+    assert resolved.event_extractor == "openai"
+    assert extractor_config.event_extractor == "langextract"
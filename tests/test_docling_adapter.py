@@ -0,0 +1,72 @@
+"""Tests for DocumentProcessor sharing in the Docling adapter."""
+
+import threading
+from pathlib import Path
+
+from src.core import docling_adapter
+from src.core.config import DoclingConfig
+
+
+class FakeProcessor:
+    """Stands in for DocumentProcessor so no Docling pipeline is built."""
+
+    def __init__(self, config):
+        self.config = config
+        self.converter = object()
+        self.threads = set()
+
+    def extract_both(self, file_path, file_type):
+        self.threads.add(threading.get_ident())
+        return f"# {file_path.name}", file_path.name, "docling"
+
+
+def test_same_thread_reuses_processor(monkeypatch):
+    monkeypatch.setattr(docling_adapter, "DocumentProcessor", FakeProcessor)
+    monkeypatch.setattr(docling_adapter, "_thread_processors", threading.local())
+    config = DoclingConfig()
+
+    first = docling_adapter._get_processor(config)
+    second = docling_adapter._get_processor(config)
+
+    assert first is second
+
+
+def test_threads_do_not_share_converter(monkeypatch):
+    monkeypatch.setattr(docling_adapter, "DocumentProcessor", FakeProcessor)
+    monkeypatch.setattr(docling_adapter, "_thread_processors", threading.local())
+    config = DoclingConfig()
+    converters = []
+
+    def build():
+        converters.append(docling_adapter._get_processor(config).converter)
+
+    threads = [threading.Thread(target=build) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(converters) == 2
+    assert converters[0] is not converters[1]
+
+
+def test_extract_batch_keeps_order_and_one_thread_per_processor(monkeypatch):
+    monkeypatch.setattr(docling_adapter, "DocumentProcessor", FakeProcessor)
+    monkeypatch.setattr(docling_adapter, "_thread_processors", threading.local())
+    extractor = docling_adapter.DoclingDocumentExtractor(DoclingConfig())
+    paths = [Path(f"doc{i}.docx") for i in range(8)]
+    processors = []
+    real_get_processor = docling_adapter._get_processor
+
+    def recording_get_processor(config):
+        processor = real_get_processor(config)
+        processors.append(processor)
+        return processor
+
+    monkeypatch.setattr(docling_adapter, "_get_processor", recording_get_processor)
+
+    documents = extractor.extract_batch(paths, max_workers=4)
+
+    assert [doc.plain_text for doc in documents] == [path.name for path in paths]
+    assert extractor.processor.threads == set()
+    assert all(len(processor.threads) == 1 for processor in processors)
@@ -0,0 +1,168 @@
+"""Tests for the on-disk judge response cache."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.judge_cache import JudgeCache, cache_key, prompt_fingerprint
+from src.core.judges.base_judge import BaseJudge, JudgeResult, ProviderScore
+from src.core.judge_panel import JudgePanel
+from src.core.llm_judge import LLMJudge
+
+
+PROVIDER_OUTPUTS = {
+    "openai": [{"date": "2024-01-01", "event_particulars": "Filed complaint", "citation": "Doc 1"}],
+    "openrouter": [],
+}
+
+JUDGE_OUTPUT = {
+    "providers": [
+        {
+            "provider": "openai",
+            "completeness": 8.0,
+            "accuracy": 9.0,
+            "hallucinations": 10.0,
+            "citation_quality": 7.0,
+            "overall_quality": 8.5,
+            "reasoning": "Accurate and cited.",
+        }
+    ],
+    "winner": "openai",
+}
+
+
+class StubJudge(BaseJudge):
+    """Panel judge that never calls an API."""
+
+    def judge_providers(self, document_name, provider_outputs):  # pragma: no cover - interface stub
+        raise AssertionError("cached tests must not call the judge")
+
+    def _call_api(self, prompt):  # pragma: no cover - interface stub
+        raise AssertionError("cached tests must not call the judge")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return JudgeCache(tmp_path)
+
+
+def make_panel(cache, model="gpt-4o-mini"):
+    """JudgePanel with one stub judge, skipping SDK client setup."""
+    panel = JudgePanel.__new__(JudgePanel)
+    panel.cache = cache
+    panel.judges = [StubJudge(api_key="test", model=model)]
+    return panel
+
+
+def make_judge_result(model="gpt-4o-mini"):
+    return JudgeResult(
+        judge_name="stub",
+        model=model,
+        document_name="doc.pdf",
+        provider_scores=[
+            ProviderScore(
+                provider="openai",
+                document_name="doc.pdf",
+                completeness=8.0,
+                accuracy=9.0,
+                hallucinations=10.0,
+                citation_quality=7.0,
+                overall_quality=8.5,
+                reasoning="Accurate and cited.",
+                event_count=1,
+            )
+        ],
+        winner="openai",
+        timestamp="2025-01-01T00:00:00",
+        cost=0.25,
+        thinking_tokens=100,
+    )
+
+
+def test_put_get_round_trip(cache):
+    key = cache_key("doc.pdf", PROVIDER_OUTPUTS)
+    cache.put("llm_judge", "gpt-4o-mini", key, {"result": JUDGE_OUTPUT, "timestamp": "1"})
+
+    assert cache.get("llm_judge", "gpt-4o-mini", key) == {"result": JUDGE_OUTPUT, "timestamp": "1"}
+
+
+def test_namespaces_do_not_share_entries(cache):
+    key = cache_key("doc.pdf", PROVIDER_OUTPUTS)
+    cache.put("llm_judge", "gpt-4o-mini", key, {"result": JUDGE_OUTPUT, "timestamp": "1"})
+
+    assert cache.get("panel", "gpt-4o-mini", key) is None
+
+
+def test_unreadable_entry_is_a_miss(cache):
+    key = cache_key("doc.pdf", PROVIDER_OUTPUTS)
+    path = cache._path("panel", "gpt-4o-mini", key)
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json")
+
+    assert cache.get("panel", "gpt-4o-mini", key) is None
+
+
+def test_cache_key_covers_prompt_version():
+    assert cache_key("doc.pdf", PROVIDER_OUTPUTS, prompt_fingerprint("v1")) != cache_key(
+        "doc.pdf", PROVIDER_OUTPUTS, prompt_fingerprint("v2")
+    )
+
+
+def test_llm_judge_round_trip(cache):
+    judge = LLMJudge(api_key="test", cache=cache)
+    judge._cache_result("doc.pdf", PROVIDER_OUTPUTS, JUDGE_OUTPUT, "1700000000")
+
+    comparison = judge._cached_comparison("doc.pdf", PROVIDER_OUTPUTS)
+
+    assert comparison.winner == "openai"
+    assert comparison.provider_scores[0].overall_quality == 8.5
+    assert comparison.provider_scores[0].event_count == 1
+
+
+def test_llm_judge_misses_after_prompt_change(cache, monkeypatch):
+    judge = LLMJudge(api_key="test", cache=cache)
+    judge._cache_result("doc.pdf", PROVIDER_OUTPUTS, JUDGE_OUTPUT, "1700000000")
+
+    monkeypatch.setattr(judge, "_prompt_version", prompt_fingerprint("edited prompt"))
+
+    assert judge._cached_comparison("doc.pdf", PROVIDER_OUTPUTS) is None
+
+
+def test_llm_judge_does_not_cache_malformed_reply(cache, monkeypatch):
+    judge = LLMJudge(api_key="test", cache=cache)
+    malformed = {"providers": [{"provider": "openai", "completeness": 8.0}], "winner": "openai"}
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(malformed)))],
+        created=1700000000,
+    )
+    monkeypatch.setattr(judge, "_create_completion", lambda prompt: response)
+
+    with pytest.raises(KeyError):
+        judge.judge_providers("doc.pdf", PROVIDER_OUTPUTS)
+
+    assert judge._cached_comparison("doc.pdf", PROVIDER_OUTPUTS) is None
+
+
+def test_panel_round_trip_zeroes_cost(cache):
+    panel = make_panel(cache)
+    panel._cache_result(panel.judges[0], "doc.pdf", PROVIDER_OUTPUTS, make_judge_result())
+
+    results, pending = panel._load_cached_results("doc.pdf", PROVIDER_OUTPUTS)
+
+    assert pending == []
+    result = results["stub"]
+    assert result.provider_scores == make_judge_result().provider_scores
+    assert (result.cost, result.thinking_tokens) == (0.0, 0)
+
+
+def test_llm_judge_and_panel_with_same_model_do_not_collide(cache):
+    judge = LLMJudge(api_key="test", model="gpt-4o-mini", cache=cache)
+    panel = make_panel(cache, model="gpt-4o-mini")
+
+    judge._cache_result("doc.pdf", PROVIDER_OUTPUTS, JUDGE_OUTPUT, "1700000000")
+    panel._cache_result(panel.judges[0], "doc.pdf", PROVIDER_OUTPUTS, make_judge_result())
+
+    assert judge._cached_comparison("doc.pdf", PROVIDER_OUTPUTS).winner == "openai"
+    results, pending = panel._load_cached_results("doc.pdf", PROVIDER_OUTPUTS)
+    assert pending == [] and results["stub"].winner == "openai"
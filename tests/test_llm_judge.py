@@ -0,0 +1,57 @@
+"""Tests for how LLMJudge batches providers into judge calls."""
+
+import json
+from types import SimpleNamespace
+
+from src.core.llm_judge import LLMJudge
+
+
+DOCUMENT_RESULTS = {
+    "motion.pdf": {
+        "openai": [{"date": "2024-01-15", "event_particulars": "Motion filed", "citation": "Rule 12"}],
+        "anthropic": [],
+        "openrouter": [{"date": "2024-01-15", "event_particulars": "Motion filed", "citation": "N/A"}],
+    },
+    "order.pdf": {
+        "openai": [],
+        "anthropic": [{"date": "2024-02-03", "event_particulars": "Order entered", "citation": "Doc 7"}],
+        "openrouter": [],
+    },
+}
+
+
+def make_reply(providers):
+    scores = [
+        {
+            "provider": provider,
+            "completeness": 5.0,
+            "accuracy": 5.0,
+            "hallucinations": 10.0,
+            "citation_quality": 5.0,
+            "overall_quality": 5.0,
+            "reasoning": "Stub reply.",
+        }
+        for provider in providers
+    ]
+    content = json.dumps({"providers": scores, "winner": providers[0]})
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], created=1700000000)
+
+
+def test_one_judge_call_per_document_covers_every_provider(monkeypatch):
+    judge = LLMJudge(api_key="test")
+    judge.cache = None  # Even with JUDGE_CACHE=1 set, every document must reach the stub
+    prompts = []
+
+    def create_completion(prompt):
+        prompts.append(prompt)
+        return make_reply(["openai", "anthropic", "openrouter"])
+
+    monkeypatch.setattr(judge, "_create_completion", create_completion)
+
+    comparisons = judge.judge_multiple_documents(DOCUMENT_RESULTS)
+
+    assert len(prompts) == len(DOCUMENT_RESULTS)
+    for prompt, doc_name in zip(prompts, DOCUMENT_RESULTS):
+        assert f"**Document**: {doc_name}" in prompt
+        assert all(f"**{provider.upper()}**" in prompt for provider in DOCUMENT_RESULTS[doc_name])
+    assert [len(c.provider_scores) for c in comparisons] == [3, 3]
@@ -0,0 +1,218 @@
+"""Tests for the shared five-column table formatter."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.constants import DEFAULT_NO_CITATION, DEFAULT_NO_REFERENCE, FIVE_COLUMN_HEADERS
+from src.core.table_formatter import PYARROW_AVAILABLE, TableFormatter, _json_default
+
+
+RECORDS = [
+    {
+        "number": 1,
+        "date": "2024-01-15",
+        "event_particulars": "Plaintiff filed a motion to dismiss.",
+        "citation": "Fed. R. Civ. P. 12(b)(6)",
+        "document_reference": "motion.pdf",
+    },
+    {
+        "number": 2,
+        "date": "2024-02-03",
+        "event_particulars": "Court granted the motion.",
+        "citation": "No citation available",
+        "document_reference": "order.pdf",
+    },
+]
+
+TEXT_DTYPE = "string[pyarrow]" if PYARROW_AVAILABLE else object
+
+
+def assert_normalized_dtypes(df):
+    assert pd.api.types.is_integer_dtype(df[FIVE_COLUMN_HEADERS[0]])
+    for col in FIVE_COLUMN_HEADERS[1:]:
+        assert df[col].dtype == TEXT_DTYPE
+
+
+def test_validate_accepts_normalized_frame():
+    df = TableFormatter.normalize_records_to_dataframe(RECORDS)
+
+    assert TableFormatter.validate_dataframe_format(df)
+
+
+def test_validate_rejects_renamed_columns_after_passing():
+    df = TableFormatter.normalize_records_to_dataframe(RECORDS)
+    assert TableFormatter.validate_dataframe_format(df)
+
+    df.columns = ["A", "B", "C", "D", "E"]
+
+    assert not TableFormatter.validate_dataframe_format(df)
+
+
+def test_validate_rejects_overwritten_number_column_after_passing():
+    df = TableFormatter.normalize_records_to_dataframe(RECORDS)
+    assert TableFormatter.validate_dataframe_format(df)
+
+    df[FIVE_COLUMN_HEADERS[0]] = ["one", "two"]
+
+    assert not TableFormatter.validate_dataframe_format(df)
+
+
+def test_validate_leaves_attrs_untouched():
+    df = TableFormatter.normalize_records_to_dataframe(RECORDS)
+    df.attrs["pipeline_id"] = "abc123"
+
+    TableFormatter.validate_dataframe_format(df)
+
+    assert df.attrs == {"pipeline_id": "abc123"}
+
+
+def test_validate_rejects_empty_frame():
+    assert not TableFormatter.validate_dataframe_format(pd.DataFrame(columns=FIVE_COLUMN_HEADERS))
+
+
+def test_json_export_writes_missing_text_as_null():
+    df = TableFormatter.normalize_records_to_dataframe(RECORDS)
+    df.loc[1, FIVE_COLUMN_HEADERS[3]] = None
+
+    exported = json.loads(TableFormatter.prepare_for_export(df, "json", pipeline_id="abc123"))
+
+    assert exported["pipeline_id"] == "abc123"
+    assert exported["legal_events"][1][FIVE_COLUMN_HEADERS[3]] is None
+
+
+def test_json_default_unboxes_numpy_scalars():
+    assert _json_default(np.int64(3)) == 3
+    assert _json_default(np.float32(0.5)) == 0.5
+    assert _json_default(pd.NA) is None
+
+
+def test_json_default_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        _json_default(object())
+
+
+def test_fallback_frame_matches_normalized_dtypes():
+    normalized = TableFormatter.normalize_records_to_dataframe(RECORDS)
+    fallback = TableFormatter.create_fallback_dataframe("boom")
+
+    assert fallback.dtypes.to_dict() == normalized.dtypes.to_dict()
+    assert fallback.iat[0, 2] == "Processing failed: boom"
+
+
+def test_document_reference_accepts_new_values_and_concat_keeps_dtype():
+    first = TableFormatter.normalize_records_to_dataframe(RECORDS[:1])
+    second = TableFormatter.normalize_records_to_dataframe(RECORDS[1:])
+
+    first.loc[0, FIVE_COLUMN_HEADERS[4]] = "renamed.pdf"
+    combined = pd.concat([first, second, TableFormatter.create_fallback_dataframe()], ignore_index=True)
+
+    assert combined[FIVE_COLUMN_HEADERS[4]].dtype == first[FIVE_COLUMN_HEADERS[4]].dtype
+    assert combined[FIVE_COLUMN_HEADERS[4]].tolist()[:2] == ["renamed.pdf", "order.pdf"]
+
+
+@pytest.mark.parametrize(
+    "placeholder",
+    [
+        "No citation available",
+        "No citation available (processing failed)",
+        "Extraction processing failed",
+        "  No citation available  ",
+        "\tprocessing failed\n",
+    ],
+)
+def test_count_real_citations_skips_placeholders(placeholder):
+    citations = pd.Series([placeholder, "Fed. R. Civ. P. 12(b)(6)"])
+
+    assert TableFormatter.count_real_citations(citations) == 1
+
+
+def test_count_real_citations_is_case_sensitive():
+    # Matches the phrases exactly as the pipeline writes them
+    citations = pd.Series(["no citation available", "PROCESSING FAILED", "No Citation Available"])
+
+    assert TableFormatter.count_real_citations(citations) == 3
+
+
+def test_count_real_citations_counts_nulls_as_real():
+    citations = pd.Series([None, np.nan, "No citation available"], dtype=object)
+
+    assert TableFormatter.count_real_citations(citations) == 2
+
+
+def test_count_real_citations_counts_real_citations():
+    citations = pd.Series(["Fed. R. Civ. P. 12(b)(6)", "28 U.S.C. § 1331", "Smith v. Jones, 123 F.3d 456"])
+
+    assert TableFormatter.count_real_citations(citations) == 3
+
+
+def test_count_real_citations_matches_two_pass_count():
+    citations = pd.Series(
+        [
+            "No citation available",
+            "  processing failed",
+            "No citation available (processing failed)",
+            "no citation available",
+            "28 U.S.C. § 1331",
+            None,
+            "",
+        ],
+        dtype=object,
+    )
+    two_pass = len(citations[
+        (~citations.str.contains("No citation available", na=False)) &
+        (~citations.str.contains("processing failed", na=False))
+    ])
+
+    assert TableFormatter.count_real_citations(citations) == two_pass == 4
+
+
+def test_normalize_sorts_out_of_order_numbers():
+    records = [dict(RECORDS[1], number=3), dict(RECORDS[0], number=1), dict(RECORDS[1], number=2)]
+
+    df = TableFormatter.normalize_records_to_dataframe(records)
+
+    assert df[FIVE_COLUMN_HEADERS[0]].tolist() == [1, 2, 3]
+    assert df[FIVE_COLUMN_HEADERS[4]].tolist() == ["motion.pdf", "order.pdf", "order.pdf"]
+    assert df.index.equals(pd.RangeIndex(3))
+    assert_normalized_dtypes(df)
+
+
+def test_normalize_fills_missing_fields():
+    incomplete = {key: value for key, value in RECORDS[1].items() if key not in ("citation", "document_reference")}
+
+    df = TableFormatter.normalize_records_to_dataframe([RECORDS[0], incomplete])
+
+    assert df[FIVE_COLUMN_HEADERS[0]].tolist() == [1, 2]
+    assert df[FIVE_COLUMN_HEADERS[3]].tolist() == ["Fed. R. Civ. P. 12(b)(6)", DEFAULT_NO_CITATION]
+    assert df[FIVE_COLUMN_HEADERS[4]].tolist() == ["motion.pdf", DEFAULT_NO_REFERENCE]
+    assert_normalized_dtypes(df)
+
+
+@pytest.mark.parametrize("dtype", [object, TEXT_DTYPE])
+def test_mean_text_length(dtype):
+    series = pd.Series(["abcd", None, "ab"], dtype=dtype)
+
+    assert TableFormatter._mean_text_length(series) == 3.0
+
+
+@pytest.mark.parametrize("dtype", [object, TEXT_DTYPE])
+def test_mean_text_length_is_nan_without_values(dtype):
+    assert np.isnan(TableFormatter._mean_text_length(pd.Series([None, None], dtype=dtype)))
+
+
+@pytest.mark.parametrize("dtype", [object, TEXT_DTYPE])
+def test_count_distinct_ignores_nulls(dtype):
+    series = pd.Series(["a.pdf", "b.pdf", None, "a.pdf"], dtype=dtype)
+
+    assert TableFormatter._count_distinct(series) == series.nunique() == 2
+
+
+def test_summary_counts_unique_documents():
+    records = RECORDS + [dict(RECORDS[0], number=3)]
+
+    summary = TableFormatter.get_table_summary(TableFormatter.normalize_records_to_dataframe(records))
+
+    assert summary["unique_documents"] == 2